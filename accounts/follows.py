@@ -0,0 +1,74 @@
+"""
+팔로우 관계 일괄 생성
+가입 직후 여러 사용자 팔로우, 다른 서비스에서 가져온 팔로우 관계 등을 청크(FOLLOW_BULK_CHUNK_SIZE) 단위로 저장
+
+- 청크마다 INSERT ... ON CONFLICT DO NOTHING RETURNING 한 번으로 저장하고 실제로 생성된 행만 반환
+  (존재하지 않는 사용자는 제외, 이미 있거나 동시에 생성된 관계는 건너뜀)
+- INSERT를 직접 실행하므로 post_save 대신 청크마다 follows_created signal로 카운터, 캐시, 알림, 피드를 한 번에 처리
+- 팔로우 대상 순서로 정렬해서 저장하므로 같은 사용자에 대한 팔로우 알림이 한 청크에서 묶임
+"""
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+from accounts.models import Follow
+from accounts.signals import follows_created
+
+# 존재하는 사용자 사이의 관계만 청크 순서대로 저장하고 이미 있는 관계는 건너뜀
+# RETURNING은 이 문장이 실제로 생성한 행만 반환 (다른 요청이 동시에 생성한 관계는 포함되지 않음)
+INSERT_FOLLOWS_SQL = """
+INSERT INTO accounts_follow (follower_id, following_id, created_at)
+SELECT edge.follower_id, edge.following_id, %s
+FROM unnest(%s::bigint[], %s::bigint[]) WITH ORDINALITY
+    AS edge(follower_id, following_id, position)
+WHERE EXISTS (SELECT 1 FROM accounts_user WHERE id = edge.follower_id)
+    AND EXISTS (SELECT 1 FROM accounts_user WHERE id = edge.following_id)
+ORDER BY edge.position
+ON CONFLICT (follower_id, following_id) DO NOTHING
+RETURNING id, follower_id, following_id, created_at
+"""
+
+
+def create_follows(edges, chunk_size=None, notify=True):
+    """
+    (follower_id, following_id) 목록의 팔로우 관계 생성
+    자기 자신, 중복, 존재하지 않는 사용자, 이미 있는 관계는 제외
+    notify: False이면 팔로우 알림을 생성하지 않음
+    반환값: 새로 생성한 Follow 목록
+    """
+    chunk_size = chunk_size or settings.FOLLOW_BULK_CHUNK_SIZE
+    edges = sorted(
+        {
+            (follower_id, following_id)
+            for follower_id, following_id in edges
+            if follower_id != following_id
+        },
+        key=lambda edge: (edge[1], edge[0]),
+    )
+    created = []
+    for start in range(0, len(edges), chunk_size):
+        created += _create_chunk(edges[start : start + chunk_size], notify)
+    return created
+
+
+def _create_chunk(edges, notify):
+    field_names = ["id", "follower_id", "following_id", "created_at"]
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(
+                INSERT_FOLLOWS_SQL,
+                [
+                    timezone.now(),
+                    [follower_id for follower_id, _ in edges],
+                    [following_id for _, following_id in edges],
+                ],
+            )
+            rows = cursor.fetchall()
+        # id는 청크의 순서대로 부여되므로 id 순서가 저장 순서
+        follows = sorted(
+            (Follow.from_db(connection.alias, field_names, row) for row in rows),
+            key=lambda follow: follow.pk,
+        )
+        if follows:
+            follows_created.send(sender=Follow, follows=follows, notify=notify)
+    return follows
@@ -0,0 +1,92 @@
+"""
+인기 사용자(팔로워 수) 순위
+게시물 목록과 친구 추천에서 인기 사용자를 조회할 때 사용
+
+백엔드 (settings.LEADERBOARD_BACKEND)
+- db: User.followers_count 카운터 인덱스(accounts_user_followers_idx)를 순서대로 읽음
+- redis: 팔로우/언팔로우 commit 이후 Redis ZSET 점수를 증감하고 ZREVRANGE로 조회
+  ZSET이 비어 있거나 요청한 수보다 적으면 db 백엔드로 조회 (rebuild_leaderboard 명령어로 초기화)
+"""
+
+import redis
+from django.conf import settings
+from accounts.models import User
+
+REBUILD_BATCH_SIZE = 5000
+
+
+def get_redis():
+    return redis.Redis.from_url(settings.LEADERBOARD_REDIS_URL)
+
+
+def _top_users_from_db(limit):
+    return list(
+        User.objects.order_by("-followers_count", "id").values_list(
+            "id", "followers_count"
+        )[:limit]
+    )
+
+
+def top_users(limit):
+    """팔로워 수가 많은 순서대로 (user_id, followers_count) 목록"""
+    if settings.LEADERBOARD_BACKEND == "redis":
+        entries = get_redis().zrevrange(
+            settings.LEADERBOARD_KEY, 0, limit - 1, withscores=True
+        )
+        if len(entries) >= limit:
+            return [(int(member), int(score)) for member, score in entries]
+    return _top_users_from_db(limit)
+
+
+def top_user_ids(limit):
+    return [user_id for user_id, _ in top_users(limit)]
+
+
+def record_follow(user_id, delta):
+    """팔로워 수 변경 반영 (db 백엔드는 카운터 컬럼이 이미 갱신되므로 처리하지 않음)"""
+    if settings.LEADERBOARD_BACKEND != "redis":
+        return
+    client = get_redis()
+    score = client.zincrby(settings.LEADERBOARD_KEY, delta, user_id)
+    if score <= 0:
+        client.zrem(settings.LEADERBOARD_KEY, user_id)
+
+
+def remove_user(user_id):
+    if settings.LEADERBOARD_BACKEND == "redis":
+        get_redis().zrem(settings.LEADERBOARD_KEY, user_id)
+
+
+def rebuild():
+    """
+    카운터 컬럼으로 ZSET을 다시 생성
+    임시 키에 채운 뒤 RENAME으로 교체하므로 생성 중에도 기존 순위를 조회할 수 있음
+    반환값: ZSET에 저장한 사용자 수
+    """
+    client = get_redis()
+    key = settings.LEADERBOARD_KEY
+    temp_key = f"{key}:rebuild"
+    client.delete(temp_key)
+
+    total = 0
+    batch = {}
+    users = (
+        User.objects.filter(followers_count__gt=0)
+        .values_list("id", "followers_count")
+        .iterator(chunk_size=REBUILD_BATCH_SIZE)
+    )
+    for user_id, followers_count in users:
+        batch[user_id] = followers_count
+        if len(batch) >= REBUILD_BATCH_SIZE:
+            client.zadd(temp_key, batch)
+            total += len(batch)
+            batch = {}
+    if batch:
+        client.zadd(temp_key, batch)
+        total += len(batch)
+
+    if total:
+        client.rename(temp_key, key)
+    else:
+        client.delete(key)
+    return total
@@ -0,0 +1,131 @@
+import random
+import statistics
+import time
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Q
+from accounts import search
+
+User = get_user_model()
+
+# 사용자명은 음절을 조합하고 숫자를 붙여서 생성
+SYLLABLES = [
+    "kim", "lee", "park", "choi", "jung", "kang", "cho", "yoon", "jang", "lim",
+    "min", "ji", "soo", "hyun", "woo", "jin", "young", "seo", "ha", "eun",
+    "jun", "hee", "sung", "ho", "yeon", "na", "ra", "bin", "tae", "gyul",
+]  # fmt: skip
+
+
+class Command(BaseCommand):
+    """
+    프로필 검색의 기존 방식(username, email icontains + distinct)과
+    trigram 인덱스 검색, 접두사 자동완성 조회 시간 비교
+    임시 사용자를 트랜잭션 안에서 생성하고 측정 후 롤백하므로 데이터가 남지 않음
+    기존 방식은 검색용 인덱스를 트랜잭션 안에서 삭제한 상태로 측정
+    """
+
+    help = "프로필 검색 조회 시간을 기존 icontains 방식과 trigram 인덱스 방식으로 측정합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows", type=int, default=1_000_000, help="생성할 임시 사용자 수"
+        )
+        parser.add_argument(
+            "--queries",
+            nargs="+",
+            default=["gyulkim", "hyunwoo12", "parkjin7", "ki"],
+            help="측정할 검색어",
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=5, help="검색어별 반복 측정 횟수"
+        )
+
+    def handle(self, *args, **options):
+        rows = options["rows"]
+        rng = random.Random(0)
+        with transaction.atomic():
+            user = User.objects.create_user(
+                username="search_benchmark", email="search_benchmark@example.com"
+            )
+            User.objects.bulk_create(
+                (self.make_user(rng, i) for i in range(rows)), batch_size=5000
+            )
+            with connection.cursor() as cursor:
+                cursor.execute(f"ANALYZE {User._meta.db_table}")
+
+            self.stdout.write(f"사용자 {rows}명")
+            self.stdout.write(
+                f"{'검색어':<12}{'방식':<14}{'결과 수':>10}{'중앙값(ms)':>14}"
+            )
+            results = {}
+            for query in options["queries"]:
+                results[query] = (
+                    self.measure(
+                        options,
+                        lambda: self.search_page(user, query),
+                    ),
+                    self.measure(
+                        options,
+                        lambda: list(
+                            search.autocomplete(User.objects.exclude(id=user.id), query)
+                        ),
+                    ),
+                )
+
+            # 기존 방식은 검색용 인덱스 없이 측정 (롤백 시 복구됨)
+            with connection.cursor() as cursor:
+                cursor.execute("DROP INDEX accounts_user_name_trgm_idx")
+                cursor.execute("DROP INDEX accounts_user_name_prefix_idx")
+            for query in options["queries"]:
+                self.report(
+                    query,
+                    "icontains",
+                    *self.measure(options, lambda: self.old_page(user, query)),
+                )
+                searched, autocompleted = results[query]
+                self.report(query, "trigram", *searched)
+                self.report(query, "autocomplete", *autocompleted)
+
+            transaction.set_rollback(True)
+
+    def make_user(self, rng, i):
+        username = "".join(rng.choices(SYLLABLES, k=rng.randint(2, 3)))
+        username += str(rng.randrange(1000))
+        return User(
+            username=f"{username}_{i}",
+            email=f"{username}_{i}@example.com",
+            password="!",
+        )
+
+    def old_page(self, user, query):
+        """기존 ProfileFilter: 부분 일치 전체를 distinct 후 count와 첫 페이지 조회"""
+        queryset = (
+            User.objects.filter(
+                Q(username__icontains=query) | Q(email__icontains=query)
+            )
+            .exclude(id=user.id)
+            .distinct()
+        )
+        count = queryset.count()
+        list(queryset[:10])
+        return count
+
+    def search_page(self, user, query):
+        """현재 ProfileFilter: 유사도순 count와 첫 페이지 조회"""
+        queryset = search.search_users(User.objects.exclude(id=user.id), query)
+        count = queryset.count()
+        list(queryset[:10])
+        return count
+
+    def measure(self, options, func):
+        timings = []
+        for _ in range(options["repeat"]):
+            start = time.perf_counter()
+            result = func()
+            timings.append((time.perf_counter() - start) * 1000)
+        count = result if isinstance(result, int) else len(result)
+        return count, statistics.median(timings)
+
+    def report(self, query, label, count, elapsed):
+        self.stdout.write(f"{query:<12}{label:<14}{count:>10}{elapsed:>14.2f}")
@@ -0,0 +1,42 @@
+import time
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from accounts import recommendations
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    """
+    친구 추천 목록 생성 명령어
+    cron 등으로 주기적으로(RECOMMENDATION_CACHE_TIMEOUT보다 짧은 주기) 실행해서 캐시를 갱신
+    캐시는 API 서버와 공유되어야 하므로 REDIS_URL을 설정한 환경에서 실행
+    """
+
+    help = "팔로우 관계와 게시물 태그로 사용자별 친구 추천 목록을 계산해서 캐시에 저장합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "usernames",
+            nargs="*",
+            help="추천 목록을 생성할 사용자명 (생략 시 전체 사용자)",
+        )
+
+    def handle(self, *args, **options):
+        usernames = options["usernames"]
+        user_ids = None
+        if usernames:
+            user_ids = list(
+                User.objects.filter(username__in=usernames).values_list("id", flat=True)
+            )
+            if len(user_ids) != len(set(usernames)):
+                raise CommandError("존재하지 않는 사용자명이 포함되어 있습니다.")
+
+        start = time.perf_counter()
+        built = recommendations.build_all(user_ids)
+        elapsed = time.perf_counter() - start
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{built}명의 추천 목록을 생성했습니다. ({elapsed:.1f}s)"
+            )
+        )
@@ -0,0 +1,85 @@
+import csv
+from itertools import islice
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from accounts.follows import create_follows
+from accounts.models import User
+
+
+class Command(BaseCommand):
+    """
+    팔로우 관계 가져오기 명령어
+    다른 서비스에서 내보낸 팔로우 관계 CSV(follower, following 열)를 청크 단위로 저장
+    청크마다 사용자 식별자를 한 번에 id로 바꾸고 create_follows로 저장 (카운터, 알림 일괄 처리)
+    """
+
+    help = "CSV 파일의 팔로우 관계를 가져옵니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="follower, following 열이 있는 CSV 파일")
+        parser.add_argument(
+            "--by",
+            choices=["username", "email", "id"],
+            default="username",
+            help="CSV의 사용자 식별자",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=settings.FOLLOW_BULK_CHUNK_SIZE,
+            help="한 번에 저장할 팔로우 관계 수",
+        )
+        parser.add_argument(
+            "--no-notify",
+            action="store_true",
+            help="팔로우 알림을 생성하지 않음",
+        )
+
+    def handle(self, *args, **options):
+        total = created = 0
+        try:
+            with open(options["path"], newline="", encoding="utf-8") as file:
+                reader = csv.DictReader(file)
+                if not {"follower", "following"} <= set(reader.fieldnames or ()):
+                    raise CommandError("CSV에 follower, following 열이 필요합니다.")
+
+                while rows := list(islice(reader, options["chunk_size"])):
+                    total += len(rows)
+                    edges = self.resolve(rows, options["by"])
+                    created += len(
+                        create_follows(
+                            edges,
+                            chunk_size=options["chunk_size"],
+                            notify=not options["no_notify"],
+                        )
+                    )
+        except OSError as e:
+            raise CommandError(f"파일을 읽을 수 없습니다: {e}")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"팔로우 관계 {total}건 중 {created}건을 가져왔습니다. "
+                f"({total - created}건은 중복, 알 수 없는 사용자 또는 이미 있는 관계)"
+            )
+        )
+
+    def resolve(self, rows, by):
+        """청크의 사용자 식별자를 한 번에 조회해서 (follower_id, following_id) 목록으로 변환"""
+        pairs = [
+            ((row["follower"] or "").strip(), (row["following"] or "").strip())
+            for row in rows
+        ]
+        values = {value for pair in pairs for value in pair}
+        if by == "id":
+            values = {value for value in values if value.isdigit()}
+        ids = {
+            str(value): user_id
+            for value, user_id in User.objects.filter(
+                **{f"{by}__in": values}
+            ).values_list(by, "id")
+        }
+        return [
+            (ids[follower], ids[following])
+            for follower, following in pairs
+            if follower in ids and following in ids
+        ]
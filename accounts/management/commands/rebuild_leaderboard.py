@@ -0,0 +1,23 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from accounts import leaderboard
+
+
+class Command(BaseCommand):
+    """
+    인기 사용자 순위(Redis ZSET) 재생성 명령어
+    redis 백엔드를 처음 사용할 때 또는 순위가 카운터와 어긋났을 때 사용
+    """
+
+    help = "팔로워 수 카운터로 인기 사용자 순위를 다시 생성합니다."
+
+    def handle(self, *args, **options):
+        if settings.LEADERBOARD_BACKEND != "redis":
+            raise CommandError(
+                "LEADERBOARD_BACKEND가 redis일 때만 사용할 수 있습니다. (db 백엔드는 카운터 인덱스를 직접 조회)"
+            )
+
+        total = leaderboard.rebuild()
+        self.stdout.write(
+            self.style.SUCCESS(f"{total}명의 인기 사용자 순위를 다시 생성했습니다.")
+        )
@@ -0,0 +1,50 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from accounts.models import Follow, User
+from insta.models import Comment, Like, Post
+
+# (카운터를 가진 모델, 카운터 필드, 집계 대상 모델, 집계 대상의 FK 필드)
+COUNTERS = [
+    (User, "followers_count", Follow, "following"),
+    (User, "following_count", Follow, "follower"),
+    (Post, "likes_count", Like, "post"),
+    (Post, "comments_count", Comment, "post"),
+]
+
+
+class Command(BaseCommand):
+    """
+    비정규화 카운터 보정 명령어
+    signal을 거치지 않은 대량 작업 등으로 실제 개수와 어긋난 카운터를 다시 계산
+    """
+
+    help = "팔로워/팔로잉/좋아요/댓글 카운터를 실제 개수와 맞춥니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="수정하지 않고 어긋난 행 수만 출력",
+        )
+
+    def handle(self, *args, **options):
+        for model, field, related_model, related_field in COUNTERS:
+            counts = (
+                related_model.objects.filter(**{related_field: OuterRef("pk")})
+                .values(related_field)
+                .annotate(count=Count("*"))
+                .values("count")
+            )
+            actual = Coalesce(Subquery(counts), 0)
+            drifted = model.objects.exclude(**{field: actual})
+
+            if options["dry_run"]:
+                fixed = drifted.count()
+            else:
+                fixed = drifted.update(**{field: actual})
+
+            self.stdout.write(f"{model.__name__}.{field}: {fixed}건 불일치")
+
+        if not options["dry_run"]:
+            self.stdout.write(self.style.SUCCESS("카운터 보정을 완료했습니다."))
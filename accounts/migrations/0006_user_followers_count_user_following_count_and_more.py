@@ -0,0 +1,50 @@
+# Generated by Django 5.1.2 on 2026-10-17 22:07
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def fill_follow_counts(apps, schema_editor):
+    """기존 팔로우 관계로 카운터 초기화"""
+    User = apps.get_model("accounts", "User")
+    Follow = apps.get_model("accounts", "Follow")
+    for field, lookup in (
+        ("followers_count", "following"),
+        ("following_count", "follower"),
+    ):
+        counts = (
+            Follow.objects.filter(**{lookup: OuterRef("pk")})
+            .values(lookup)
+            .annotate(count=Count("*"))
+            .values("count")
+        )
+        User.objects.update(**{field: Coalesce(Subquery(counts), 0)})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0005_alter_user_profile_image"),
+        ("auth", "0012_alter_user_first_name_max_length"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="followers_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="user",
+            name="following_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(
+                fields=["-followers_count"], name="accounts_user_followers_idx"
+            ),
+        ),
+        migrations.RunPython(fill_follow_counts, migrations.RunPython.noop),
+    ]
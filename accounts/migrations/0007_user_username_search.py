@@ -0,0 +1,38 @@
+# Generated by Django 5.1.2 on 2026-10-17 22:53
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0006_user_followers_count_user_following_count_and_more"),
+        ("auth", "0012_alter_user_first_name_max_length"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name="user",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("username"),
+                    name="gin_trgm_ops",
+                ),
+                name="accounts_user_name_trgm_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("username"),
+                    name="text_pattern_ops",
+                ),
+                name="accounts_user_name_prefix_idx",
+            ),
+        ),
+    ]
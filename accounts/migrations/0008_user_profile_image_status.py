@@ -0,0 +1,23 @@
+# Generated by Django 5.1.2 on 2026-10-17 23:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0007_user_username_search"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="profile_image_status",
+            field=models.CharField(
+                choices=[("pending", "처리 중"), ("ready", "완료"), ("failed", "실패")],
+                default="ready",
+                editable=False,
+                max_length=10,
+            ),
+        ),
+    ]
@@ -0,0 +1,119 @@
+# Generated by Django 5.1.2 on 2026-10-17 23:58
+
+from django.db import migrations, models
+from django.db.models import Case, Value, When
+
+# flags의 비트 순서 (accounts.models.PRIVACY_FLAGS와 같은 순서)
+FLAG_NAMES = [
+    "follower_can_see_email",
+    "follower_can_see_bio",
+    "follower_can_see_posts",
+    "follower_can_see_following_list",
+    "follower_can_see_follower_list",
+    "following_can_see_email",
+    "following_can_see_bio",
+    "following_can_see_posts",
+    "following_can_see_following_list",
+    "following_can_see_follower_list",
+    "others_can_see_email",
+    "others_can_see_bio",
+    "others_can_see_posts",
+    "others_can_see_following_list",
+    "others_can_see_follower_list",
+]
+
+
+def pack_flags(apps, schema_editor):
+    """불리언 컬럼을 flags 비트로 변환"""
+    PrivacySettings = apps.get_model("accounts", "PrivacySettings")
+    flags = Value(0)
+    for bit, name in enumerate(FLAG_NAMES):
+        flags = flags + Case(
+            When(**{name: True}, then=Value(1 << bit)), default=Value(0)
+        )
+    PrivacySettings.objects.update(flags=flags)
+
+
+def unpack_flags(apps, schema_editor):
+    """flags 비트를 불리언 컬럼으로 변환"""
+    PrivacySettings = apps.get_model("accounts", "PrivacySettings")
+    for privacy_settings in PrivacySettings.objects.all():
+        for bit, name in enumerate(FLAG_NAMES):
+            setattr(privacy_settings, name, bool(privacy_settings.flags & (1 << bit)))
+        privacy_settings.save()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0008_user_profile_image_status"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="privacysettings",
+            name="flags",
+            field=models.PositiveSmallIntegerField(default=7134),
+        ),
+        migrations.RunPython(pack_flags, unpack_flags),
+        migrations.RemoveField(
+            model_name="privacysettings",
+            name="follower_can_see_bio",
+        ),
+        migrations.RemoveField(
+            model_name="privacysettings",
+            name="follower_can_see_email",
+        ),
+        migrations.RemoveField(
+            model_name="privacysettings",
+            name="follower_can_see_follower_list",
+        ),
+        migrations.RemoveField(
+            model_name="privacysettings",
+            name="follower_can_see_following_list",
+        ),
+        migrations.RemoveField(
+            model_name="privacysettings",
+            name="follower_can_see_posts",
+        ),
+        migrations.RemoveField(
+            model_name="privacysettings",
+            name="following_can_see_bio",
+        ),
+        migrations.RemoveField(
+            model_name="privacysettings",
+            name="following_can_see_email",
+        ),
+        migrations.RemoveField(
+            model_name="privacysettings",
+            name="following_can_see_follower_list",
+        ),
+        migrations.RemoveField(
+            model_name="privacysettings",
+            name="following_can_see_following_list",
+        ),
+        migrations.RemoveField(
+            model_name="privacysettings",
+            name="following_can_see_posts",
+        ),
+        migrations.RemoveField(
+            model_name="privacysettings",
+            name="others_can_see_bio",
+        ),
+        migrations.RemoveField(
+            model_name="privacysettings",
+            name="others_can_see_email",
+        ),
+        migrations.RemoveField(
+            model_name="privacysettings",
+            name="others_can_see_follower_list",
+        ),
+        migrations.RemoveField(
+            model_name="privacysettings",
+            name="others_can_see_following_list",
+        ),
+        migrations.RemoveField(
+            model_name="privacysettings",
+            name="others_can_see_posts",
+        ),
+    ]
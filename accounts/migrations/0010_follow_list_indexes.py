@@ -0,0 +1,27 @@
+# Generated by Django 5.1.2 on 2026-10-18 00:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0009_privacysettings_flags"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="follow",
+            index=models.Index(
+                fields=["following", "-created_at", "-id"],
+                name="accounts_follow_followers_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="follow",
+            index=models.Index(
+                fields=["follower", "-created_at", "-id"],
+                name="accounts_follow_following_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.2 on 2026-10-18 00:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0010_follow_list_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="privacysettings",
+            name="flags",
+            field=models.PositiveIntegerField(default=7134),
+        ),
+    ]
@@ -1,7 +1,11 @@
 from django.contrib.auth.models import AbstractUser
+from django.core.exceptions import ImproperlyConfigured
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from imagekit.models import ProcessedImageField, ImageSpecField
 from imagekit.processors import ResizeToFill, Thumbnail
+from config import image_pipeline
 
 
 class User(AbstractUser):
@@ -34,16 +38,47 @@ class User(AbstractUser):
         format="JPEG",
         options={"quality": 60},
     )
+    # 프로필 이미지 비동기 처리 상태 (pending 동안 기존 이미지 유지)
+    profile_image_status = image_pipeline.status_field()
     bio = models.TextField(max_length=500, blank=True)
+    # 팔로우 생성/삭제 시 signal로 갱신되는 비정규화 카운터
+    followers_count = models.PositiveIntegerField(default=0)
+    following_count = models.PositiveIntegerField(default=0)
 
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = ["username"]
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # 인기 사용자(팔로워 수 순) 조회용
+            models.Index(
+                fields=["-followers_count"], name="accounts_user_followers_idx"
+            ),
+            # 프로필 검색: 사용자명 부분 일치(icontains)용 trigram 인덱스
+            GinIndex(
+                OpClass(Upper("username"), name="gin_trgm_ops"),
+                name="accounts_user_name_trgm_idx",
+            ),
+            # 프로필 자동완성: 사용자명 접두사 일치(istartswith)용 인덱스
+            models.Index(
+                OpClass(Upper("username"), name="text_pattern_ops"),
+                name="accounts_user_name_prefix_idx",
+            ),
+        ]
+
     def __str__(self):
         return self.username
 
     def get_followers_count(self):
-        return self.followers.count()
+        return self.followers_count
+
+
+image_pipeline.register(
+    User,
+    field="profile_image",
+    status_field="profile_image_status",
+    renditions=["profile_image_thumbnail"],
+)
 
 
 class SocialAccount(models.Model):
@@ -80,40 +115,97 @@ class Follow(models.Model):
 
     class Meta:
         unique_together = ("follower", "following")
+        indexes = [
+            # 팔로워/팔로잉 목록 커서 페이지네이션 (-created_at, -id 순서)
+            models.Index(
+                fields=["following", "-created_at", "-id"],
+                name="accounts_follow_followers_idx",
+            ),
+            models.Index(
+                fields=["follower", "-created_at", "-id"],
+                name="accounts_follow_following_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.follower.username} follows {self.following.username}"
 
 
+# 공개 설정 항목과 기본값 (순서가 flags의 비트 위치이므로 항목은 끝에만 추가)
+# flags는 PositiveIntegerField이므로 최대 31개
+PRIVACY_FLAGS = (
+    # 팔로워에게 공개될 정보
+    ("follower_can_see_email", False),
+    ("follower_can_see_bio", True),
+    ("follower_can_see_posts", True),
+    ("follower_can_see_following_list", True),
+    ("follower_can_see_follower_list", True),
+    # 팔로잉에게 공개될 정보
+    ("following_can_see_email", False),
+    ("following_can_see_bio", True),
+    ("following_can_see_posts", True),
+    ("following_can_see_following_list", True),
+    ("following_can_see_follower_list", True),
+    # 둘 다 아닌 사람들에게 공개될 정보
+    ("others_can_see_email", False),
+    ("others_can_see_bio", True),
+    ("others_can_see_posts", True),
+    ("others_can_see_following_list", False),
+    ("others_can_see_follower_list", False),
+)
+if len(PRIVACY_FLAGS) > 31:
+    raise ImproperlyConfigured("공개 설정 항목은 31개를 넘을 수 없습니다.")
+PRIVACY_FLAG_BITS = {name: 1 << bit for bit, (name, _) in enumerate(PRIVACY_FLAGS)}
+DEFAULT_PRIVACY_FLAGS = sum(
+    PRIVACY_FLAG_BITS[name] for name, default in PRIVACY_FLAGS if default
+)
+
+
+def _privacy_flag(name):
+    """flags의 비트 하나를 불리언 속성으로 읽고 쓰는 property"""
+    bit = PRIVACY_FLAG_BITS[name]
+
+    def getter(self):
+        return bool(self.flags & bit)
+
+    def setter(self, value):
+        self.flags = self.flags | bit if value else self.flags & ~bit
+
+    return property(getter, setter)
+
+
 class PrivacySettings(models.Model):
     """
     프로필 공개 설정 모델
+    항목별 공개 여부는 flags 정수 하나에 비트로 저장하고, 항목 이름의 속성으로 읽고 씀
+    행이 없는 사용자는 기본값(DEFAULT_PRIVACY_FLAGS) 사용
     """
 
     user = models.OneToOneField(
         User, on_delete=models.CASCADE, related_name="privacy_settings"
     )
+    flags = models.PositiveIntegerField(default=DEFAULT_PRIVACY_FLAGS)
 
     # 팔로워에게 공개될 정보
-    follower_can_see_email = models.BooleanField(default=False)
-    follower_can_see_bio = models.BooleanField(default=True)
-    follower_can_see_posts = models.BooleanField(default=True)
-    follower_can_see_following_list = models.BooleanField(default=True)
-    follower_can_see_follower_list = models.BooleanField(default=True)
+    follower_can_see_email = _privacy_flag("follower_can_see_email")
+    follower_can_see_bio = _privacy_flag("follower_can_see_bio")
+    follower_can_see_posts = _privacy_flag("follower_can_see_posts")
+    follower_can_see_following_list = _privacy_flag("follower_can_see_following_list")
+    follower_can_see_follower_list = _privacy_flag("follower_can_see_follower_list")
 
     # 팔로잉에게 공개될 정보
-    following_can_see_email = models.BooleanField(default=False)
-    following_can_see_bio = models.BooleanField(default=True)
-    following_can_see_posts = models.BooleanField(default=True)
-    following_can_see_following_list = models.BooleanField(default=True)
-    following_can_see_follower_list = models.BooleanField(default=True)
+    following_can_see_email = _privacy_flag("following_can_see_email")
+    following_can_see_bio = _privacy_flag("following_can_see_bio")
+    following_can_see_posts = _privacy_flag("following_can_see_posts")
+    following_can_see_following_list = _privacy_flag("following_can_see_following_list")
+    following_can_see_follower_list = _privacy_flag("following_can_see_follower_list")
 
     # 둘 다 아닌 사람들에게 공개될 정보
-    others_can_see_email = models.BooleanField(default=False)
-    others_can_see_bio = models.BooleanField(default=True)
-    others_can_see_posts = models.BooleanField(default=True)
-    others_can_see_following_list = models.BooleanField(default=False)
-    others_can_see_follower_list = models.BooleanField(default=False)
+    others_can_see_email = _privacy_flag("others_can_see_email")
+    others_can_see_bio = _privacy_flag("others_can_see_bio")
+    others_can_see_posts = _privacy_flag("others_can_see_posts")
+    others_can_see_following_list = _privacy_flag("others_can_see_following_list")
+    others_can_see_follower_list = _privacy_flag("others_can_see_follower_list")
 
     def __str__(self):
         return f"{self.user.username}'s Privacy Settings"
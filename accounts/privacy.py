@@ -0,0 +1,109 @@
+"""
+프로필 공개 설정 캐시
+공개 설정은 (행 id, flags 정수)뿐이므로 프로세스 안의 LRU(PRIVACY_SETTINGS_CACHE_SIZE)에 저장
+
+공개 설정마다 버전을 공유 캐시(settings.CACHES)에 저장하고 LRU 항목은 읽은 시점의 버전과 함께 보관
+공개 설정이 바뀌면 commit 이후 새 버전으로 교체하므로 다른 프로세스의 LRU 항목도 다음 조회 때 무효화
+(DB 조회 전에 버전을 먼저 읽으므로 조회 중에 바뀐 설정이 새 버전으로 저장되지 않음)
+
+행이 없는 사용자는 기본값(DEFAULT_PRIVACY_FLAGS) 사용 (조회 중에 행을 생성하지 않음)
+"""
+
+import threading
+import uuid
+from collections import OrderedDict
+from django.conf import settings
+from django.core.cache import cache
+from accounts.models import DEFAULT_PRIVACY_FLAGS, PrivacySettings
+
+_entries = OrderedDict()
+_lock = threading.Lock()
+
+
+def _version_key(user_id):
+    return f"privacy_settings_version:{user_id}"
+
+
+def get_versions(user_ids):
+    """
+    사용자별 공개 설정 버전 {user_id: 버전}
+    버전이 없으면(처음 조회, 캐시 만료) 새 버전 생성
+    """
+    keys = {_version_key(user_id): user_id for user_id in user_ids}
+    versions = {keys[key]: version for key, version in cache.get_many(keys).items()}
+    missing = [key for key, user_id in keys.items() if user_id not in versions]
+    for key in missing:
+        # 동시에 생성하면 먼저 저장된 버전 사용
+        cache.add(key, uuid.uuid4().hex, None)
+    if missing:
+        versions.update(
+            {keys[key]: version for key, version in cache.get_many(missing).items()}
+        )
+    return versions
+
+
+def lookup(user_ids):
+    """
+    LRU에서 버전이 일치하는 공개 설정
+    반환값: ({user_id: (행 id, flags)}, 버전) - 버전은 DB에서 조회한 결과를 store()할 때 사용
+    """
+    versions = get_versions(user_ids)
+    found = {}
+    with _lock:
+        for user_id, version in versions.items():
+            entry = _entries.get(user_id)
+            if entry is not None and entry[0] == version:
+                _entries.move_to_end(user_id)
+                found[user_id] = entry[1:]
+    return found, versions
+
+
+def store(values, versions):
+    """
+    DB에서 조회한 공개 설정을 lookup() 시점의 버전으로 저장
+    values: {user_id: (행 id, flags)} - 행이 없으면 (None, DEFAULT_PRIVACY_FLAGS)
+    """
+    with _lock:
+        for user_id, (pk, flags) in values.items():
+            if user_id not in versions:
+                continue
+            _entries[user_id] = (versions[user_id], pk, flags)
+            _entries.move_to_end(user_id)
+        while len(_entries) > settings.PRIVACY_SETTINGS_CACHE_SIZE:
+            _entries.popitem(last=False)
+
+
+def get_flags_many(user_ids):
+    """사용자별 공개 설정 {user_id: (행 id 또는 None, flags)} (LRU에 없는 사용자만 한 번에 조회)"""
+    found, versions = lookup(user_ids)
+    missing = set(user_ids) - found.keys()
+    if missing:
+        rows = PrivacySettings.objects.filter(user_id__in=missing).values_list(
+            "user_id", "pk", "flags"
+        )
+        values = {user_id: (None, DEFAULT_PRIVACY_FLAGS) for user_id in missing}
+        values.update({user_id: (pk, flags) for user_id, pk, flags in rows})
+        store(values, versions)
+        found.update(values)
+    return found
+
+
+def get_settings(user):
+    """
+    사용자의 PrivacySettings (행이 없으면 기본값으로 만든 저장 전 객체)
+    저장하면 행이 있으면 UPDATE, 없으면 INSERT
+    """
+    pk, flags = get_flags_many([user.pk])[user.pk]
+    return PrivacySettings(pk=pk, user=user, flags=flags)
+
+
+def invalidate(user_id):
+    """새 버전으로 교체해서 모든 프로세스의 LRU 항목 무효화"""
+    cache.set(_version_key(user_id), uuid.uuid4().hex, None)
+    with _lock:
+        _entries.pop(user_id, None)
+
+
+def clear():
+    with _lock:
+        _entries.clear()
@@ -0,0 +1,203 @@
+"""
+프로필 공개 범위와 프로필 카드 캐시
+조회자 유형(self, follower, following, others)과 공개 설정으로 숨길 항목을 직렬화 전에 결정하므로
+숨겨진 항목(팔로워/팔로잉 목록, 게시물, 상품)은 조회하지 않음
+팔로워/팔로잉 목록은 follow_list()로 최신순 커서 페이지네이션
+
+조회자와 프로필 사용자의 팔로우 관계와 공개 설정은 여러 사용자를 한 번의 쿼리로 조회하고
+요청마다 결과를 저장해서 프로필, 팔로워 목록, 검색 결과가 함께 사용
+공개 설정은 accounts.privacy의 LRU에 있으면 조회하지 않고, 행이 없는 사용자는 기본값 사용
+
+프로필 카드(기본 정보와 팔로워/팔로잉 수)는 (프로필, 조회자 유형)별로 캐시하고
+프로필 수정, 팔로우/언팔로우, 공개 설정 변경 commit 이후 signal로 삭제
+"""
+
+from dataclasses import dataclass
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Exists, OuterRef
+from accounts import privacy
+from accounts.models import DEFAULT_PRIVACY_FLAGS, PRIVACY_FLAG_BITS, Follow, User
+
+VIEWER_TYPES = ("self", "follower", "following", "others")
+
+# 항목별 공개 설정 필드 (PrivacySettings.<조회자 유형>_<설정>)
+SECTION_SETTINGS = {
+    "email": "can_see_email",
+    "bio": "can_see_bio",
+    "followers": "can_see_follower_list",
+    "following": "can_see_following_list",
+    "posts": "can_see_posts",
+    "products": "can_see_posts",
+}
+
+# 팔로우 목록별 (프로필 사용자의 Follow 필드, 목록에 표시할 사용자의 Follow 필드)
+FOLLOW_LISTS = {
+    "followers": ("following", "follower"),
+    "following": ("follower", "following"),
+}
+
+# 프로필 카드에 포함되는 User 필드 (이 필드가 바뀔 때만 캐시 삭제)
+CARD_FIELDS = frozenset(
+    [
+        "username",
+        "email",
+        "bio",
+        "profile_image",
+        "followers_count",
+        "following_count",
+    ]
+)
+
+
+@dataclass(frozen=True)
+class ProfileAccess:
+    """
+    조회자와 프로필 사용자의 관계, 조회자가 프로필에서 볼 수 없는 항목
+    is_following: 조회자가 프로필 사용자를 팔로우, is_follower: 프로필 사용자가 조회자를 팔로우
+    """
+
+    viewer_type: str
+    hidden: frozenset = frozenset()
+    is_following: bool = False
+    is_follower: bool = False
+
+    def can_see(self, section):
+        return section not in self.hidden
+
+
+def _viewer_type(is_following, is_follower):
+    """맞팔로우는 팔로워로 취급"""
+    if is_following:
+        return "follower"
+    if is_follower:
+        return "following"
+    return "others"
+
+
+def _hidden(viewer_type, flags):
+    return frozenset(
+        section
+        for section, setting in SECTION_SETTINGS.items()
+        if not flags & PRIVACY_FLAG_BITS[f"{viewer_type}_{setting}"]
+    )
+
+
+def fetch_access(viewer, owner_ids):
+    """
+    조회자와 여러 사용자의 팔로우 관계, 공개 설정을 한 번의 쿼리로 조회
+    (로그인하지 않은 조회자이고 공개 설정이 모두 LRU에 있으면 쿼리 없음)
+    반환값: {사용자 id: ProfileAccess} (쿼리를 실행한 경우 존재하지 않는 사용자는 제외)
+    """
+    owner_ids = set(owner_ids)
+    result = {}
+    if viewer.is_authenticated and viewer.pk in owner_ids:
+        owner_ids.discard(viewer.pk)
+        result[viewer.pk] = ProfileAccess("self")
+    if not owner_ids:
+        return result
+
+    # 공개 설정은 LRU에서 먼저 찾고, 없는 사용자만 관계 조회 쿼리에 LEFT JOIN으로 함께 조회
+    found, versions = privacy.lookup(owner_ids)
+    missing = owner_ids - found.keys()
+    relations = {owner_id: (False, False) for owner_id in owner_ids}
+    if viewer.is_authenticated or missing:
+        queryset = User.objects.filter(pk__in=owner_ids)
+        fields = ["pk"]
+        if viewer.is_authenticated:
+            queryset = queryset.annotate(
+                is_following=Exists(
+                    Follow.objects.filter(follower=viewer.pk, following=OuterRef("pk"))
+                ),
+                is_follower=Exists(
+                    Follow.objects.filter(follower=OuterRef("pk"), following=viewer.pk)
+                ),
+            )
+            fields += ["is_following", "is_follower"]
+        if missing:
+            fields += ["privacy_settings__pk", "privacy_settings__flags"]
+
+        loaded = {}
+        relations = {}
+        for row in queryset.values(*fields):
+            relations[row["pk"]] = (
+                row.get("is_following", False),
+                row.get("is_follower", False),
+            )
+            if row["pk"] in missing:
+                if row["privacy_settings__pk"] is None:
+                    loaded[row["pk"]] = (None, DEFAULT_PRIVACY_FLAGS)
+                else:
+                    loaded[row["pk"]] = (
+                        row["privacy_settings__pk"],
+                        row["privacy_settings__flags"],
+                    )
+        privacy.store(loaded, versions)
+        found.update(loaded)
+
+    for owner_id, (is_following, is_follower) in relations.items():
+        viewer_type = _viewer_type(is_following, is_follower)
+        result[owner_id] = ProfileAccess(
+            viewer_type,
+            _hidden(viewer_type, found[owner_id][1]),
+            is_following=is_following,
+            is_follower=is_follower,
+        )
+    return result
+
+
+def get_access_many(request, owners):
+    """
+    요청 사용자와 여러 사용자의 ProfileAccess (요청 단위로 저장해서 다시 조회하지 않음)
+    반환값: {사용자 id: ProfileAccess}
+    """
+    viewer = request.user
+    # DRF Request와 Django HttpRequest 어느 쪽으로 호출해도 같은 저장소 사용
+    request = getattr(request, "_request", request)
+    memo = request.__dict__.setdefault("_profile_access", {})
+    missing = {owner.pk for owner in owners} - memo.keys()
+    if missing:
+        memo.update(fetch_access(viewer, missing))
+    return memo
+
+
+def get_access(request, owner):
+    return get_access_many(request, [owner])[owner.pk]
+
+
+def follow_list(owner, section):
+    """
+    팔로워(followers) 또는 팔로잉(following) 목록의 Follow queryset (최신순)
+    accounts_follow_followers_idx, accounts_follow_following_idx 인덱스 순서와 같음
+    """
+    owner_field, user_field = FOLLOW_LISTS[section]
+    return (
+        Follow.objects.filter(**{owner_field: owner})
+        .select_related(user_field)
+        .order_by("-created_at", "-id")
+    )
+
+
+def _card_key(user_id, viewer_type):
+    return f"profile_card:{user_id}:{viewer_type}"
+
+
+def get_card(user_id, viewer_type, build):
+    """캐시된 프로필 카드, 없으면 build()로 생성해서 저장"""
+    key = _card_key(user_id, viewer_type)
+    card = cache.get(key)
+    if card is None:
+        card = dict(build())
+        cache.set(key, card, settings.PROFILE_CARD_CACHE_TIMEOUT)
+    return card
+
+
+def invalidate_cards(*user_ids):
+    """사용자들의 모든 조회자 유형별 프로필 카드 삭제"""
+    cache.delete_many(
+        [
+            _card_key(user_id, viewer_type)
+            for user_id in user_ids
+            for viewer_type in VIEWER_TYPES
+        ]
+    )
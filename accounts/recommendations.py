@@ -0,0 +1,234 @@
+"""
+친구 추천
+주기적인 배치 작업(build_recommendations 명령어)이 팔로우 그래프와 게시물 태그로 사용자별 추천 후보 점수를 계산해서
+상위 RECOMMENDATION_TOP_K명을 캐시에 저장하고, API는 캐시 조회 한 번으로 응답
+
+후보 점수 (앞의 값이 클수록 우선)
+- common_following: 내가 팔로우하는 사용자 중 후보를 팔로우하는 사용자 수 (친구의 친구)
+- common_tags: 내 게시물 태그 중 후보의 게시물에도 사용된 태그 수
+- followers_count: 후보의 팔로워 수 (인기 사용자)
+
+팔로우하면 캐시된 목록을 바로 갱신하고, 언팔로우하면 캐시를 삭제해서 다음 조회 시 다시 계산
+"""
+
+from collections import Counter, defaultdict
+from django.conf import settings
+from django.core.cache import cache
+from accounts import leaderboard
+from accounts.models import Follow, User
+from insta.models import Post
+
+CACHE_BATCH_SIZE = 1000
+
+
+def _key(user_id):
+    return f"accounts:recommendations:{user_id}"
+
+
+def _sort_key(entry):
+    user_id, common_following, common_tags, followers_count = entry
+    return (-common_following, -common_tags, -followers_count, user_id)
+
+
+def score_candidates(
+    user_id, following_ids, following_of, tag_ids, users_by_tag, followers_count
+):
+    """
+    한 사용자의 추천 후보 점수 계산
+    following_of: 팔로우 중인 사용자별 팔로잉 id 집합, users_by_tag: 태그별 게시물 작성자 id 집합
+    반환값: (user_id, common_following, common_tags, followers_count) 목록, 점수순 상위 RECOMMENDATION_TOP_K개
+    """
+    common_following = Counter()
+    for followee_id in following_ids:
+        common_following.update(following_of.get(followee_id, ()))
+
+    common_tags = Counter()
+    for tag_id in tag_ids:
+        common_tags.update(users_by_tag.get(tag_id, ()))
+
+    excluded = set(following_ids) | {user_id}
+    candidates = (common_following.keys() | common_tags.keys()) - excluded
+    entries = [
+        (
+            candidate_id,
+            common_following[candidate_id],
+            common_tags[candidate_id],
+            followers_count.get(candidate_id, 0),
+        )
+        for candidate_id in candidates
+    ]
+    entries.sort(key=_sort_key)
+    return entries[: settings.RECOMMENDATION_TOP_K]
+
+
+def _fill_with_popular(entries, user_id, following_ids, popular):
+    """친구의 친구, 공통 관심사 후보가 부족하면 인기 사용자로 채움"""
+    top_k = settings.RECOMMENDATION_TOP_K
+    if len(entries) >= top_k:
+        return entries
+    excluded = set(following_ids) | {user_id} | {entry[0] for entry in entries}
+    for candidate_id, followers_count in popular:
+        if len(entries) >= top_k:
+            break
+        if candidate_id not in excluded:
+            entries.append((candidate_id, 0, 0, followers_count))
+    return entries
+
+
+def compute_for_user(user_id):
+    """
+    한 사용자의 추천 목록을 계산해서 캐시에 저장
+    배치 작업 이후 가입했거나 언팔로우로 캐시가 삭제된 사용자의 조회 시 사용
+    """
+    following_ids = set(
+        Follow.objects.filter(follower_id=user_id).values_list(
+            "following_id", flat=True
+        )
+    )
+    following_of = defaultdict(set)
+    for follower_id, following_id in Follow.objects.filter(
+        follower_id__in=following_ids
+    ).values_list("follower_id", "following_id"):
+        following_of[follower_id].add(following_id)
+
+    tag_ids = set(
+        Post.objects.filter(user_id=user_id, tags__isnull=False).values_list(
+            "tags", flat=True
+        )
+    )
+    users_by_tag = defaultdict(set)
+    for author_id, tag_id in (
+        Post.objects.filter(tags__in=tag_ids).values_list("user_id", "tags").distinct()
+    ):
+        users_by_tag[tag_id].add(author_id)
+
+    candidate_ids = set().union(*following_of.values(), *users_by_tag.values())
+    followers_count = dict(
+        User.objects.filter(id__in=candidate_ids).values_list("id", "followers_count")
+    )
+
+    entries = score_candidates(
+        user_id, following_ids, following_of, tag_ids, users_by_tag, followers_count
+    )
+    popular = leaderboard.top_users(
+        settings.RECOMMENDATION_TOP_K + len(following_ids) + 1
+    )
+    entries = _fill_with_popular(entries, user_id, following_ids, popular)
+    cache.set(_key(user_id), entries, settings.RECOMMENDATION_CACHE_TIMEOUT)
+    return entries
+
+
+def build_all(user_ids=None):
+    """
+    전체(또는 지정한) 사용자의 추천 목록을 한 번에 계산해서 캐시에 저장
+    팔로우 그래프와 태그-작성자 관계를 메모리에 한 번씩만 읽고 집합 연산으로 점수를 계산하므로
+    사용자 수와 관계없이 DB 조회 횟수가 일정함
+    반환값: 추천 목록을 저장한 사용자 수
+    """
+    following_of = defaultdict(set)
+    for follower_id, following_id in Follow.objects.values_list(
+        "follower_id", "following_id"
+    ).iterator(chunk_size=10_000):
+        following_of[follower_id].add(following_id)
+
+    tags_of = defaultdict(set)
+    users_by_tag = defaultdict(set)
+    for author_id, tag_id in (
+        Post.objects.filter(tags__isnull=False)
+        .values_list("user_id", "tags")
+        .distinct()
+        .iterator(chunk_size=10_000)
+    ):
+        tags_of[author_id].add(tag_id)
+        users_by_tag[tag_id].add(author_id)
+
+    followers_count = dict(
+        User.objects.filter(followers_count__gt=0).values_list("id", "followers_count")
+    )
+    # 팔로우 중인 사용자를 제외해도 RECOMMENDATION_TOP_K명을 채울 수 있을 만큼 조회
+    max_following = max((len(ids) for ids in following_of.values()), default=0)
+    popular = leaderboard.top_users(settings.RECOMMENDATION_TOP_K + max_following + 1)
+
+    if user_ids is None:
+        user_ids = User.objects.values_list("id", flat=True).iterator(chunk_size=10_000)
+
+    built = 0
+    batch = {}
+    for user_id in user_ids:
+        following_ids = following_of.get(user_id, set())
+        entries = score_candidates(
+            user_id,
+            following_ids,
+            following_of,
+            tags_of.get(user_id, set()),
+            users_by_tag,
+            followers_count,
+        )
+        entries = _fill_with_popular(entries, user_id, following_ids, popular)
+        batch[_key(user_id)] = entries
+        built += 1
+        if len(batch) >= CACHE_BATCH_SIZE:
+            cache.set_many(batch, settings.RECOMMENDATION_CACHE_TIMEOUT)
+            batch = {}
+    if batch:
+        cache.set_many(batch, settings.RECOMMENDATION_CACHE_TIMEOUT)
+    return built
+
+
+def get_recommended_ids(user_id, limit=None):
+    """캐시된 추천 목록에서 사용자 id 목록 반환 (캐시가 없으면 이 사용자만 계산)"""
+    limit = limit or settings.RECOMMENDATION_SIZE
+    entries = cache.get(_key(user_id))
+    if entries is None:
+        entries = compute_for_user(user_id)
+    return [entry[0] for entry in entries[:limit]]
+
+
+def on_follow(follower_id, following_id):
+    """
+    팔로우 시 팔로워의 캐시된 추천 목록 갱신
+    팔로우한 사용자는 목록에서 제거하고, 그 사용자가 팔로우하는 사용자들의 common_following 증가
+    """
+    key = _key(follower_id)
+    entries = cache.get(key)
+    if entries is None:
+        return
+
+    already_following = set(
+        Follow.objects.filter(follower_id=follower_id).values_list(
+            "following_id", flat=True
+        )
+    )
+    scores = {entry[0]: list(entry) for entry in entries if entry[0] != following_id}
+    new_candidates = set(
+        Follow.objects.filter(follower_id=following_id).values_list(
+            "following_id", flat=True
+        )
+    ) - (already_following | {follower_id})
+    counts = dict(
+        User.objects.filter(id__in=new_candidates - scores.keys()).values_list(
+            "id", "followers_count"
+        )
+    )
+    for candidate_id in new_candidates:
+        if candidate_id in scores:
+            scores[candidate_id][1] += 1
+        else:
+            scores[candidate_id] = [candidate_id, 1, 0, counts.get(candidate_id, 0)]
+
+    entries = sorted((tuple(entry) for entry in scores.values()), key=_sort_key)
+    cache.set(
+        key,
+        entries[: settings.RECOMMENDATION_TOP_K],
+        settings.RECOMMENDATION_CACHE_TIMEOUT,
+    )
+
+
+def on_unfollow(follower_id, following_id):
+    """언팔로우 시 점수를 되돌리기 어려우므로 캐시를 삭제하고 다음 조회 시 다시 계산"""
+    cache.delete(_key(follower_id))
+
+
+def invalidate(user_ids):
+    """일괄 팔로우 시 사용자별로 갱신하지 않고 캐시를 삭제해서 다음 조회 시 다시 계산"""
+    cache.delete_many([_key(user_id) for user_id in user_ids])
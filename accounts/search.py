@@ -0,0 +1,47 @@
+"""
+프로필 검색
+사용자명 검색은 pg_trgm GIN 인덱스(accounts_user_name_trgm_idx)로 부분 일치를 찾고
+유사도와 팔로워 수 순서로 정렬
+자동완성은 접두사 인덱스(accounts_user_name_prefix_idx)로 사용자명 앞부분이 일치하는 사용자만 조회
+
+이메일은 부분 일치 검색 시 다른 사용자의 이메일을 추측할 수 있으므로 정확히 일치할 때만 검색
+"""
+
+from django.conf import settings
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db.models import Q
+from accounts.models import User
+
+# trigram은 3글자 단위이므로 더 짧은 검색어는 접두사 인덱스로 조회
+MIN_TRIGRAM_LENGTH = 3
+
+
+def _email_filter(value):
+    if "@" not in value:
+        return Q(pk__in=[])
+    return Q(email=User.objects.normalize_email(value))
+
+
+def search_users(queryset, value):
+    """
+    사용자명 부분 일치 또는 이메일 정확히 일치하는 사용자
+    유사도가 높은 순, 같으면 팔로워 수가 많은 순으로 정렬
+    """
+    value = value.strip()
+    if len(value) < MIN_TRIGRAM_LENGTH:
+        username_filter = Q(username__istartswith=value)
+    else:
+        username_filter = Q(username__icontains=value)
+    return (
+        queryset.filter(username_filter | _email_filter(value))
+        .annotate(similarity=TrigramSimilarity("username", value))
+        .order_by("-similarity", "-followers_count", "id")
+    )
+
+
+def autocomplete(queryset, prefix, limit=None):
+    """사용자명이 prefix로 시작하는 사용자를 팔로워 수가 많은 순서로 최대 limit명"""
+    limit = limit or settings.PROFILE_AUTOCOMPLETE_SIZE
+    return queryset.filter(username__istartswith=prefix.strip()).order_by(
+        "-followers_count", "id"
+    )[:limit]
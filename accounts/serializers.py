@@ -1,14 +1,17 @@
 from rest_framework import serializers
 from drf_spectacular.utils import extend_schema_field
 from drf_spectacular.types import OpenApiTypes
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
 from django.core.files.uploadedfile import InMemoryUploadedFile
+from django.urls import reverse
+from rest_framework.utils.urls import replace_query_param
 from allauth.socialaccount.models import SocialAccount
-from market.models import Product
-from market.serializers import ProductSerializer
-from .models import PrivacySettings
-from insta.models import Post
+from config import image_pipeline
+from config.pagination import CursorPagination
+from . import profiles
+from .models import PRIVACY_FLAG_BITS, PrivacySettings
 
 User = get_user_model()
 
@@ -44,8 +47,10 @@ class UserSerializer(serializers.ModelSerializer):
             "bio",
             "profile_image",
             "profile_image_thumbnail",
+            "profile_image_status",
             "social_accounts",
         )
+        read_only_fields = ("profile_image_status",)
         extra_kwargs = {
             "password": {"write_only": True},
             "email": {"required": True},
@@ -72,8 +77,11 @@ class UserSerializer(serializers.ModelSerializer):
         return value
 
     def create(self, validated_data):
-        """통과하면 생성"""
+        """통과하면 생성 (프로필 이미지는 비동기로 처리)"""
+        profile_image = validated_data.pop("profile_image", None)
         user = User.objects.create_user(**validated_data)
+        if profile_image:
+            image_pipeline.stage(user, profile_image, "profile_image")
         return user
 
 
@@ -140,20 +148,77 @@ class FollowSerializer(serializers.ModelSerializer):
         fields = ("id", "username", "profile_image")
 
 
-class ProfileSerializer(serializers.ModelSerializer):
+class RelationshipListSerializer(serializers.ListSerializer):
     """
-    프로필 정보 표시
-    기본 정보, 마켓 정보, 팔로우 관계와 수, 댓글 단 post 내용
-    get_<field명> 메서드로 데이터 직렬화
+    목록의 모든 사용자와 요청 사용자의 팔로우 관계를 직렬화 전에 한 번의 쿼리로 조회
     """
 
-    followers = serializers.SerializerMethodField()
-    following = serializers.SerializerMethodField()
-    followers_count = serializers.SerializerMethodField()
-    following_count = serializers.SerializerMethodField()
-    products = serializers.SerializerMethodField()
-    posts = serializers.SerializerMethodField()
-    is_self = serializers.SerializerMethodField()
+    def to_representation(self, data):
+        users = list(data.all() if hasattr(data, "all") else data)
+        request = self.context.get("request")
+        if request is not None:
+            profiles.get_access_many(request, users)
+        return super().to_representation(users)
+
+
+class RelationshipMixin(serializers.Serializer):
+    """
+    요청 사용자와의 팔로우 관계 필드
+    is_following: 요청 사용자가 팔로우 중, is_follower: 요청 사용자를 팔로우 중
+    """
+
+    is_following = serializers.SerializerMethodField()
+    is_follower = serializers.SerializerMethodField()
+
+    def get_access(self, obj):
+        request = self.context.get("request")
+        if request is None:
+            return profiles.ProfileAccess("others")
+        return profiles.get_access(request, obj)
+
+    def get_is_following(self, obj) -> bool:
+        return self.get_access(obj).is_following
+
+    def get_is_follower(self, obj) -> bool:
+        return self.get_access(obj).is_follower
+
+
+class FollowUserSerializer(RelationshipMixin, FollowSerializer):
+    """
+    팔로워/팔로잉 목록의 사용자
+    """
+
+    class Meta(FollowSerializer.Meta):
+        fields = FollowSerializer.Meta.fields + ("is_following", "is_follower")
+        list_serializer_class = RelationshipListSerializer
+
+
+class BulkFollowSerializer(serializers.Serializer):
+    """
+    일괄 팔로우/언팔로우 serializer
+    요청 한 번에 FOLLOW_BULK_MAX_USERS명까지
+    """
+
+    user_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), allow_empty=False
+    )
+
+    def validate_user_ids(self, value):
+        if len(value) > settings.FOLLOW_BULK_MAX_USERS:
+            raise serializers.ValidationError(
+                f"한 번에 최대 {settings.FOLLOW_BULK_MAX_USERS}명까지 요청할 수 있습니다."
+            )
+        return list(dict.fromkeys(value))
+
+
+class ProfileCardSerializer(serializers.ModelSerializer):
+    """
+    프로필 카드 (기본 정보와 팔로워/팔로잉 수)
+    context["profile_access"]에서 숨겨진 항목은 직렬화 필드에서 제외
+    """
+
+    followers_count = serializers.IntegerField(read_only=True)
+    following_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = User
@@ -163,12 +228,40 @@ class ProfileSerializer(serializers.ModelSerializer):
             "email",
             "bio",
             "profile_image",
-            "followers",
-            "following",
             "followers_count",
             "following_count",
-            "products",
-            "posts",
+        )
+
+    def get_fields(self):
+        fields = super().get_fields()
+        access = self.context.get("profile_access")
+        if access is not None:
+            for section in access.hidden:
+                fields.pop(section, None)
+        return fields
+
+
+class ProfileSerializer(ProfileCardSerializer):
+    """
+    프로필 정보 표시
+    조회자 유형과 프라이버시 설정으로 숨길 항목을 먼저 결정하고 공개된 항목만 조회
+    기본 정보는 (프로필, 조회자 유형)별로 캐시된 프로필 카드 사용
+    팔로워/팔로잉은 첫 페이지만 포함하고 나머지는 <목록>_next 링크(목록 API)로 조회
+    게시물과 상품은 별도 목록 API(profile/<username>/posts/, products/)로 조회
+    """
+
+    followers = serializers.SerializerMethodField()
+    followers_next = serializers.URLField(read_only=True, allow_null=True)
+    following = serializers.SerializerMethodField()
+    following_next = serializers.URLField(read_only=True, allow_null=True)
+    is_self = serializers.SerializerMethodField()
+
+    class Meta(ProfileCardSerializer.Meta):
+        fields = ProfileCardSerializer.Meta.fields + (
+            "followers",
+            "followers_next",
+            "following",
+            "following_next",
             "is_self",
         )
 
@@ -182,90 +275,61 @@ class ProfileSerializer(serializers.ModelSerializer):
             return obj == request.user
         return False
 
-    @extend_schema_field(FollowSerializer(many=True))
+    def get_follow_page(self, obj, section):
+        """
+        팔로우 목록의 첫 페이지 (사용자 목록, 다음 페이지 링크)
+        다음 페이지는 profile/<username>/followers/, following/ 목록 API의 커서 링크
+        """
+        paginator = CursorPagination()
+        follows = list(profiles.follow_list(obj, section)[: paginator.page_size + 1])
+        next_link = None
+        if len(follows) > paginator.page_size:
+            follows = follows[: paginator.page_size]
+            url = self.context["request"].build_absolute_uri(
+                reverse(
+                    f"accounts:profile_{section}", kwargs={"username": obj.username}
+                )
+            )
+            cursor = paginator.encode_position(paginator.get_position(follows[-1]))
+            next_link = replace_query_param(url, paginator.cursor_query_param, cursor)
+
+        user_field = profiles.FOLLOW_LISTS[section][1]
+        users = [getattr(follow, user_field) for follow in follows]
+        return (
+            FollowUserSerializer(users, many=True, context=self.context).data,
+            next_link,
+        )
+
+    @extend_schema_field(FollowUserSerializer(many=True))
     def get_followers(self, obj):
-        followers = obj.followers.all().select_related("follower")
-        return FollowSerializer(
-            [follow.follower for follow in followers], many=True
-        ).data
+        return self.get_follow_page(obj, "followers")[0]
 
-    @extend_schema_field(FollowSerializer(many=True))
+    @extend_schema_field(FollowUserSerializer(many=True))
     def get_following(self, obj):
-        following = obj.following.all().select_related("following")
-        return FollowSerializer(
-            [follow.following for follow in following], many=True
-        ).data
-
-    @extend_schema_field(OpenApiTypes.INT)
-    def get_followers_count(self, obj):
-        return obj.followers.count()
-
-    @extend_schema_field(OpenApiTypes.INT)
-    def get_following_count(self, obj):
-        return obj.following.count()
-
-    @extend_schema_field(ProductSerializer(many=True))
-    def get_products(self, obj):
-        products = Product.objects.filter(user=obj)
-        return ProductSerializer(products, many=True, context=self.context).data
-
-    @extend_schema_field(serializers.ListSerializer(child=serializers.DictField()))
-    def get_posts(self, obj):
-        from insta.serializers import PostSerializer
-
-        posts = Post.objects.filter(user=obj)
-        return PostSerializer(posts, many=True, context=self.context).data
-
-    def get_viewer_type(self, viewer, profile_owner):
-        """
-        프로필 열람 타입 구분 메서드
-        팔로워 기준 값 리턴
-        """
-        is_follower = viewer.following.filter(following=profile_owner).exists()
-        is_following = viewer.followers.filter(follower=profile_owner).exists()
-
-        if is_follower and is_following:
-            return "follower"
-        elif is_follower:
-            return "follower"
-        elif is_following:
-            return "following"
-        else:
-            return "others"
+        return self.get_follow_page(obj, "following")[0]
 
     def to_representation(self, instance):
         """
-        요청한 사용자가 프로필 소유자가 아닌 경우 프라이버시 설정을 적용
-        요청한 사용자의 유형(팔로워, 팔로잉, 기타)을 확인
-        프라이버시 설정에 따라 특정 필드 필터링
-        항상 표시되어야 하는 필드들 설정
+        요청한 사용자가 볼 수 없는 항목은 조회하지 않음
+        프로필 카드는 캐시에서 가져오고, 팔로우 목록은 공개된 경우에만 첫 페이지 조회
         """
-        data = super().to_representation(instance)
         request = self.context.get("request")
-        if request and request.user != instance:
-            viewer_type = self.get_viewer_type(request.user, instance)
-            privacy_settings = PrivacySettings.objects.get_or_create(user=instance)[0]
-
-            fields_to_check = {
-                "email": f"{viewer_type}_can_see_email",
-                "bio": f"{viewer_type}_can_see_bio",
-                "followers": f"{viewer_type}_can_see_follower_list",
-                "following": f"{viewer_type}_can_see_following_list",
-                "products": f"{viewer_type}_can_see_posts",
-                "posts": f"{viewer_type}_can_see_posts",
-            }
-
-            for field, setting in fields_to_check.items():
-                if not getattr(privacy_settings, setting, True):
-                    data.pop(field, None)
-
-            always_visible = [
-                "id",
-                "username",
-                "profile_image",
-            ]
-            data = {k: v for k, v in data.items() if k in always_visible or k in data}
-
+        access = self.context.get("profile_access")
+        if access is None:
+            access = profiles.get_access(request, instance)
+        context = {**self.context, "profile_access": access}
+
+        data = profiles.get_card(
+            instance.pk,
+            access.viewer_type,
+            lambda: ProfileCardSerializer(instance, context=context).data,
+        )
+        for section in profiles.FOLLOW_LISTS:
+            if access.can_see(section):
+                data[section], data[f"{section}_next"] = self.get_follow_page(
+                    instance, section
+                )
+        data["is_self"] = self.get_is_self(instance)
         return data
 
 
@@ -283,7 +347,9 @@ class ProfileUpdateSerializer(serializers.ModelSerializer):
             "bio",
             "profile_image",
             "profile_image_thumbnail",
+            "profile_image_status",
         ]
+        read_only_fields = ["profile_image_status"]
         extra_kwargs = {
             "username": {"required": False},
             "profile_image": {"required": False},
@@ -305,30 +371,34 @@ class ProfileUpdateSerializer(serializers.ModelSerializer):
     def update(self, instance, validated_data):
         """
         업데이트된 이미지 파일 받아옴
-        기존 프로필이 있다면 제거 후 생성
+        이미지는 비동기로 처리하고, 처리가 끝나면 기존 프로필 이미지를 제거 후 교체
         다른 필드도 업데이트
         """
-        profile_image = validated_data.get("profile_image")
-        if profile_image and isinstance(profile_image, InMemoryUploadedFile):
-            if instance.profile_image:
-                instance.profile_image.delete(save=False)
-            instance.profile_image = profile_image
-
         instance.bio = validated_data.get("bio", instance.bio)
         instance.username = validated_data.get("username", instance.username)
 
         instance.save()
+
+        profile_image = validated_data.get("profile_image")
+        if profile_image and isinstance(profile_image, InMemoryUploadedFile):
+            image_pipeline.stage(instance, profile_image, "profile_image")
         return instance
 
 
 class PrivacySettingsSerializer(serializers.ModelSerializer):
     """
     프로필 설정 serializer
+    항목별 공개 여부는 flags의 비트를 읽고 쓰는 모델 속성을 불리언 필드로 사용
     """
 
     class Meta:
         model = PrivacySettings
-        exclude = ("user",)
+        fields = ("id", *PRIVACY_FLAG_BITS)
+
+    def build_property_field(self, field_name, model_class):
+        if field_name in PRIVACY_FLAG_BITS:
+            return serializers.BooleanField, {"required": False}
+        return super().build_property_field(field_name, model_class)
 
     def validate(self, data):
         """
@@ -357,11 +427,11 @@ class PrivacySettingsSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("잘못된 뷰어 유형입니다.")
 
         visible_fields = []
-        for field in self.Meta.model._meta.fields:
-            if field.name.startswith(f"{viewer_type}_can_see_") and getattr(
-                self.instance, field.name
+        for name in PRIVACY_FLAG_BITS:
+            if name.startswith(f"{viewer_type}_can_see_") and getattr(
+                self.instance, name
             ):
-                visible_fields.append(field.name.replace(f"{viewer_type}_can_see_", ""))
+                visible_fields.append(name.replace(f"{viewer_type}_can_see_", ""))
 
         return visible_fields
 
@@ -374,3 +444,13 @@ class ProfileSearchSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ["id", "username", "profile_image"]
+
+
+class ProfileSearchResultSerializer(RelationshipMixin, ProfileSearchSerializer):
+    """
+    프로필 검색 결과 (요청 사용자와의 팔로우 관계 포함)
+    """
+
+    class Meta(ProfileSearchSerializer.Meta):
+        fields = ProfileSearchSerializer.Meta.fields + ["is_following", "is_follower"]
+        list_serializer_class = RelationshipListSerializer
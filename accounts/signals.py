@@ -0,0 +1,166 @@
+from collections import Counter
+from django.db import transaction
+from django.db.models import Case, F, Value, When
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import Signal, receiver
+from accounts import leaderboard, privacy, profiles, recommendations
+from accounts.models import Follow, PrivacySettings, User
+from config.image_pipeline import image_processed
+
+# accounts.follows.create_follows가 생성한 팔로우 목록 (INSERT를 직접 실행하므로 post_save가 발생하지 않음)
+# receiver 인자: follows, notify (False이면 알림을 생성하지 않음)
+follows_created = Signal()
+
+
+@receiver(post_save, sender=Follow)
+def increase_follow_counts(sender, instance, created, **kwargs):
+    """
+    팔로우 시 상대방의 팔로워 수와 본인의 팔로잉 수 증가
+    """
+    if created:
+        User.objects.filter(pk=instance.following_id).update(
+            followers_count=F("followers_count") + 1
+        )
+        User.objects.filter(pk=instance.follower_id).update(
+            following_count=F("following_count") + 1
+        )
+
+
+@receiver(post_delete, sender=Follow)
+def decrease_follow_counts(sender, instance, **kwargs):
+    """
+    언팔로우 시 상대방의 팔로워 수와 본인의 팔로잉 수 감소
+    """
+    User.objects.filter(pk=instance.following_id, followers_count__gt=0).update(
+        followers_count=F("followers_count") - 1
+    )
+    User.objects.filter(pk=instance.follower_id, following_count__gt=0).update(
+        following_count=F("following_count") - 1
+    )
+
+
+@receiver(post_save, sender=Follow)
+def update_recommendations_on_follow(sender, instance, created, **kwargs):
+    """
+    팔로우 시 팔로워의 캐시된 친구 추천 목록 갱신
+    """
+    if created:
+        transaction.on_commit(
+            lambda: recommendations.on_follow(
+                instance.follower_id, instance.following_id
+            )
+        )
+
+
+@receiver(post_delete, sender=Follow)
+def update_recommendations_on_unfollow(sender, instance, **kwargs):
+    """
+    언팔로우 시 팔로워의 캐시된 친구 추천 목록 삭제
+    """
+    transaction.on_commit(
+        lambda: recommendations.on_unfollow(instance.follower_id, instance.following_id)
+    )
+
+
+@receiver(post_save, sender=Follow)
+def update_leaderboard_on_follow(sender, instance, created, **kwargs):
+    """
+    팔로우 시 인기 사용자 순위 점수 증가
+    """
+    if created:
+        transaction.on_commit(
+            lambda: leaderboard.record_follow(instance.following_id, 1)
+        )
+
+
+@receiver(post_delete, sender=Follow)
+def update_leaderboard_on_unfollow(sender, instance, **kwargs):
+    """
+    언팔로우 시 인기 사용자 순위 점수 감소
+    """
+    transaction.on_commit(lambda: leaderboard.record_follow(instance.following_id, -1))
+
+
+@receiver(post_delete, sender=User)
+def remove_from_leaderboard(sender, instance, **kwargs):
+    """
+    회원 탈퇴 시 인기 사용자 순위에서 제거
+    """
+    transaction.on_commit(lambda: leaderboard.remove_user(instance.pk))
+
+
+@receiver(post_save, sender=User)
+def invalidate_profile_card(sender, instance, created, update_fields, **kwargs):
+    """
+    프로필 카드에 포함된 필드가 바뀔 수 있는 저장 시 캐시된 프로필 카드 삭제
+    (로그인 시 last_login만 저장하는 경우 등은 제외)
+    """
+    if created or (
+        update_fields is not None and not profiles.CARD_FIELDS & set(update_fields)
+    ):
+        return
+    transaction.on_commit(lambda: profiles.invalidate_cards(instance.pk))
+
+
+@receiver(image_processed, sender=User)
+def invalidate_profile_card_on_image(sender, pk, **kwargs):
+    """프로필 이미지 처리가 끝나면 캐시된 프로필 카드 삭제"""
+    profiles.invalidate_cards(pk)
+
+
+@receiver(post_save, sender=Follow)
+@receiver(post_delete, sender=Follow)
+def invalidate_profile_cards_on_follow(sender, instance, **kwargs):
+    """
+    팔로우/언팔로우 시 양쪽 사용자의 캐시된 프로필 카드 삭제 (팔로워/팔로잉 수 변경)
+    """
+    transaction.on_commit(
+        lambda: profiles.invalidate_cards(instance.follower_id, instance.following_id)
+    )
+
+
+@receiver(post_save, sender=PrivacySettings)
+@receiver(post_delete, sender=PrivacySettings)
+def invalidate_privacy_settings(sender, instance, **kwargs):
+    """
+    공개 설정 변경 시 캐시된 공개 설정(새 버전으로 교체)과 프로필 카드 삭제
+    """
+
+    def invalidate():
+        privacy.invalidate(instance.user_id)
+        profiles.invalidate_cards(instance.user_id)
+
+    transaction.on_commit(invalidate)
+
+
+def _increment_counts(field, counts):
+    """사용자별 증가량({user_id: n})을 UPDATE 한 번으로 반영"""
+    User.objects.filter(pk__in=counts).update(
+        **{
+            field: F(field)
+            + Case(
+                *(When(pk=user_id, then=Value(n)) for user_id, n in counts.items()),
+                default=Value(0),
+            )
+        }
+    )
+
+
+@receiver(follows_created, sender=Follow)
+def update_on_bulk_follow(sender, follows, **kwargs):
+    """
+    일괄 팔로우 시 팔로워/팔로잉 수를 사용자별로 모아서 갱신하고
+    commit 이후 인기 사용자 순위, 친구 추천 캐시, 프로필 카드를 한 번에 갱신
+    """
+    followers_counts = Counter(follow.following_id for follow in follows)
+    following_counts = Counter(follow.follower_id for follow in follows)
+    _increment_counts("followers_count", followers_counts)
+    _increment_counts("following_count", following_counts)
+
+    def on_commit():
+        for user_id, n in followers_counts.items():
+            leaderboard.record_follow(user_id, n)
+        recommendations.invalidate(following_counts)
+        profiles.invalidate_cards(*(followers_counts.keys() | following_counts.keys()))
+
+    transaction.on_commit(on_commit)
@@ -0,0 +1,130 @@
+import os
+import tempfile
+from io import StringIO
+from django.core.management import CommandError, call_command
+from django.contrib.auth import get_user_model
+from rest_framework.test import APITransactionTestCase
+from accounts.models import Follow
+from alarm import dispatch
+from alarm.models import Alarm
+from insta.models import FeedEntry, Like, Post
+
+User = get_user_model()
+
+
+class ReconcileCountersCommandTestCase(APITransactionTestCase):
+    """
+    카운터 보정 명령어 테스트
+    """
+
+    def setUp(self):
+        self.user1 = User.objects.create_user(
+            username="testuser1",
+            email="testuser1@example.com",
+            password="testpassword123",
+        )
+        self.user2 = User.objects.create_user(
+            username="testuser2",
+            email="testuser2@example.com",
+            password="testpassword123",
+        )
+        Follow.objects.create(follower=self.user1, following=self.user2)
+        self.post = Post.objects.create(content="카운터 테스트", user=self.user2)
+        Like.objects.create(post=self.post, user=self.user1)
+
+    def test_reconcile_counters(self):
+        """어긋난 카운터가 실제 개수로 보정되는지 테스트"""
+        User.objects.filter(pk=self.user2.pk).update(followers_count=5)
+        Post.objects.filter(pk=self.post.pk).update(likes_count=0, comments_count=3)
+
+        call_command("reconcile_counters", stdout=StringIO())
+
+        self.user2.refresh_from_db()
+        self.post.refresh_from_db()
+        self.assertEqual(self.user2.followers_count, 1)
+        self.assertEqual(self.post.likes_count, 1)
+        self.assertEqual(self.post.comments_count, 0)
+
+    def test_reconcile_counters_dry_run(self):
+        """dry-run 시 카운터를 수정하지 않는지 테스트"""
+        User.objects.filter(pk=self.user2.pk).update(followers_count=5)
+
+        out = StringIO()
+        call_command("reconcile_counters", "--dry-run", stdout=out)
+
+        self.user2.refresh_from_db()
+        self.assertEqual(self.user2.followers_count, 5)
+        self.assertIn("User.followers_count: 1건 불일치", out.getvalue())
+
+
+class ImportFollowsCommandTestCase(APITransactionTestCase):
+    """
+    팔로우 관계 가져오기 명령어 테스트
+    """
+
+    def setUp(self):
+        self.users = [
+            User.objects.create(username=f"user{i}", email=f"user{i}@example.com")
+            for i in range(6)
+        ]
+        Follow.objects.create(follower=self.users[1], following=self.users[0])
+        self.addCleanup(dispatch.join)
+
+    def write_csv(self, rows):
+        file = tempfile.NamedTemporaryFile(
+            "w", suffix=".csv", delete=False, encoding="utf-8"
+        )
+        with file:
+            file.write("follower,following\n")
+            file.writelines(f"{follower},{following}\n" for follower, following in rows)
+        self.addCleanup(os.remove, file.name)
+        return file.name
+
+    def test_import_follows(self):
+        """청크 단위로 저장하고 카운터 갱신, 팔로우 대상별 알림을 하나로 묶음"""
+        path = self.write_csv(
+            [(f"user{i}", "user0") for i in range(1, 6)]
+            + [("user2", "user0"), ("user0", "user0"), ("unknown", "user0")]
+            + [("user0", "user1")]
+        )
+        out = StringIO()
+        call_command("import_follows", path, "--chunk-size", "10", stdout=out)
+        self.assertIn("9건 중 5건", out.getvalue())
+
+        self.users[0].refresh_from_db()
+        self.assertEqual(self.users[0].followers_count, 5)
+        self.assertEqual(self.users[0].following_count, 1)
+        self.assertEqual(Follow.objects.count(), 6)
+
+        dispatch.join()
+        # setUp의 팔로우 알림을 제외하고 가져온 팔로우 4건은 알림 하나로 묶임
+        alarm = Alarm.objects.exclude(sender=self.users[1]).get(recipient=self.users[0])
+        self.assertEqual(alarm.message, "user5님 외 3명이 당신을 팔로우했습니다.")
+        self.assertEqual(alarm.sender, self.users[5])
+        alarm = Alarm.objects.get(recipient=self.users[1])
+        self.assertEqual(alarm.message, "user0님이 당신을 팔로우했습니다.")
+
+    def test_import_follows_backfills_feed(self):
+        """가져온 팔로우 대상의 기존 게시물이 피드에 추가됨"""
+        post = Post.objects.create(user=self.users[3], content="Earlier post")
+        path = self.write_csv([("user2", "user3"), ("user4", "user3")])
+        call_command("import_follows", path, "--no-notify", stdout=StringIO())
+        for user in (self.users[2], self.users[4]):
+            self.assertTrue(FeedEntry.objects.filter(user=user, post=post).exists())
+
+    def test_import_follows_no_notify(self):
+        """--no-notify 옵션이면 알림을 생성하지 않음"""
+        path = self.write_csv([("user2", "user3"), ("user4", "user3")])
+        call_command("import_follows", path, "--no-notify", stdout=StringIO())
+        dispatch.join()
+        self.assertEqual(Follow.objects.filter(following=self.users[3]).count(), 2)
+        self.assertFalse(Alarm.objects.filter(recipient=self.users[3]).exists())
+
+    def test_import_follows_missing_columns(self):
+        """follower, following 열이 없으면 오류"""
+        file = tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False)
+        with file:
+            file.write("a,b\nuser1,user2\n")
+        self.addCleanup(os.remove, file.name)
+        with self.assertRaises(CommandError):
+            call_command("import_follows", file.name, stdout=StringIO())
@@ -0,0 +1,72 @@
+import uuid
+from io import StringIO
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+from django.test import override_settings
+from rest_framework.test import APITransactionTestCase
+from accounts import leaderboard
+from accounts.models import Follow
+from alarm import dispatch
+
+User = get_user_model()
+
+
+class LeaderboardTestCase(APITransactionTestCase):
+    """
+    인기 사용자 순위 테스트
+    """
+
+    def setUp(self):
+        self.users = [
+            User.objects.create_user(
+                username=f"testuser{i}",
+                email=f"testuser{i}@example.com",
+                password="testpassword123",
+            )
+            for i in range(4)
+        ]
+        # testuser1: 팔로워 3명, testuser2: 팔로워 1명
+        for follower in (self.users[0], self.users[2], self.users[3]):
+            Follow.objects.create(follower=follower, following=self.users[1])
+        Follow.objects.create(follower=self.users[0], following=self.users[2])
+
+    def tearDown(self):
+        # 팔로우 알림이 모두 처리된 후 테이블 초기화
+        dispatch.join()
+
+    def test_db_backend_orders_by_followers_count(self):
+        """db 백엔드는 팔로워 수 카운터 순서로 조회"""
+        self.assertEqual(
+            leaderboard.top_users(2), [(self.users[1].id, 3), (self.users[2].id, 1)]
+        )
+
+    def test_redis_backend_updated_incrementally(self):
+        """redis 백엔드는 rebuild 후 팔로우/언팔로우 시 점수가 증감"""
+        key = f"test:leaderboard:{uuid.uuid4()}"
+        with override_settings(LEADERBOARD_BACKEND="redis", LEADERBOARD_KEY=key):
+            client = leaderboard.get_redis()
+            try:
+                call_command("rebuild_leaderboard", stdout=StringIO())
+                self.assertEqual(
+                    leaderboard.top_user_ids(2), [self.users[1].id, self.users[2].id]
+                )
+
+                Follow.objects.create(follower=self.users[1], following=self.users[2])
+                Follow.objects.create(follower=self.users[3], following=self.users[2])
+                Follow.objects.filter(following=self.users[1]).first().delete()
+                self.assertEqual(
+                    leaderboard.top_users(2),
+                    [(self.users[2].id, 3), (self.users[1].id, 2)],
+                )
+
+                # ZSET 항목이 부족하면 카운터 인덱스로 조회
+                self.assertEqual(len(leaderboard.top_user_ids(4)), 4)
+            finally:
+                client.delete(key)
+
+    def test_rebuild_requires_redis_backend(self):
+        """db 백엔드에서는 rebuild_leaderboard 명령어 실행 불가"""
+        self.assertEqual(settings.LEADERBOARD_BACKEND, "db")
+        with self.assertRaises(CommandError):
+            call_command("rebuild_leaderboard", stdout=StringIO())
@@ -0,0 +1,150 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase, override_settings
+from accounts import privacy, profiles
+from accounts.models import DEFAULT_PRIVACY_FLAGS, Follow, PrivacySettings
+
+User = get_user_model()
+
+
+class ProfileAccessTestCase(TestCase):
+    """
+    조회자와 프로필 사용자의 관계, 공개 범위 조회 테스트
+    """
+
+    def setUp(self):
+        cache.clear()
+        privacy.clear()
+        self.viewer, self.mutual, self.fan, self.stranger = [
+            User.objects.create_user(
+                username=f"testuser{i}",
+                email=f"testuser{i}@example.com",
+                password="testpassword123",
+            )
+            for i in range(4)
+        ]
+        Follow.objects.create(follower=self.viewer, following=self.mutual)
+        Follow.objects.create(follower=self.mutual, following=self.viewer)
+        Follow.objects.create(follower=self.fan, following=self.viewer)
+        PrivacySettings.objects.create(user=self.stranger, others_can_see_bio=False)
+
+    def test_fetch_access_single_query(self):
+        """여러 사용자의 관계와 공개 설정을 한 번의 쿼리로 조회"""
+        owners = [self.viewer, self.mutual, self.fan, self.stranger]
+        with self.assertNumQueries(1):
+            access = profiles.fetch_access(self.viewer, [user.pk for user in owners])
+
+        self.assertEqual(access[self.viewer.pk].viewer_type, "self")
+        self.assertEqual(access[self.mutual.pk].viewer_type, "follower")
+        self.assertTrue(access[self.mutual.pk].is_follower)
+        self.assertEqual(access[self.fan.pk].viewer_type, "following")
+        self.assertFalse(access[self.fan.pk].is_following)
+        self.assertEqual(access[self.stranger.pk].viewer_type, "others")
+        self.assertFalse(access[self.stranger.pk].can_see("bio"))
+        # 공개 설정 행이 없으면 기본값 사용
+        self.assertFalse(access[self.fan.pk].can_see("email"))
+        self.assertTrue(access[self.fan.pk].can_see("followers"))
+
+    def test_fetch_access_does_not_create_privacy_settings(self):
+        """조회 중에 공개 설정 행을 생성하지 않음"""
+        profiles.fetch_access(self.viewer, [self.fan.pk])
+        self.assertFalse(PrivacySettings.objects.filter(user=self.fan).exists())
+
+    def test_fetch_access_anonymous(self):
+        """로그인하지 않은 조회자는 others"""
+        access = profiles.fetch_access(AnonymousUser(), [self.mutual.pk])
+        self.assertEqual(access[self.mutual.pk].viewer_type, "others")
+        self.assertFalse(access[self.mutual.pk].can_see("followers"))
+
+    def test_get_access_memoized_per_request(self):
+        """같은 요청 안에서는 이미 조회한 사용자를 다시 조회하지 않음"""
+        request = RequestFactory().get("/")
+        request.user = self.viewer
+        with self.assertNumQueries(1):
+            profiles.get_access_many(request, [self.mutual, self.fan])
+            profiles.get_access(request, self.mutual)
+        with self.assertNumQueries(1):
+            profiles.get_access(request, self.stranger)
+
+    def test_anonymous_access_cached(self):
+        """로그인하지 않은 조회자는 공개 설정이 LRU에 있으면 쿼리 없이 조회"""
+        profiles.fetch_access(AnonymousUser(), [self.stranger.pk])
+        with self.assertNumQueries(0):
+            access = profiles.fetch_access(AnonymousUser(), [self.stranger.pk])
+        self.assertFalse(access[self.stranger.pk].can_see("bio"))
+
+
+class PrivacySettingsTestCase(TestCase):
+    """
+    공개 설정 flags 저장과 LRU 캐시 테스트
+    """
+
+    def setUp(self):
+        cache.clear()
+        privacy.clear()
+        self.users = [
+            User.objects.create_user(
+                username=f"testuser{i}",
+                email=f"testuser{i}@example.com",
+                password="testpassword123",
+            )
+            for i in range(3)
+        ]
+
+    def test_flags_properties(self):
+        """항목별 속성은 flags의 비트를 읽고 씀"""
+        privacy_settings = PrivacySettings(user=self.users[0])
+        self.assertEqual(privacy_settings.flags, DEFAULT_PRIVACY_FLAGS)
+        self.assertFalse(privacy_settings.follower_can_see_email)
+        self.assertTrue(privacy_settings.others_can_see_posts)
+
+        privacy_settings.follower_can_see_email = True
+        privacy_settings.others_can_see_posts = False
+        privacy_settings.save()
+        privacy_settings.refresh_from_db()
+        self.assertTrue(privacy_settings.follower_can_see_email)
+        self.assertFalse(privacy_settings.others_can_see_posts)
+        self.assertTrue(privacy_settings.others_can_see_bio)
+
+    def test_flags_column_fits_more_flags(self):
+        """항목을 추가해도 저장할 수 있도록 flags는 16번째 이후 비트도 저장"""
+        privacy_settings = PrivacySettings.objects.create(
+            user=self.users[0], flags=DEFAULT_PRIVACY_FLAGS | 1 << 30
+        )
+        privacy_settings.refresh_from_db()
+        self.assertEqual(privacy_settings.flags, DEFAULT_PRIVACY_FLAGS | 1 << 30)
+
+    def test_get_flags_many_cached(self):
+        """LRU에 있는 공개 설정은 다시 조회하지 않고, 행이 없으면 기본값"""
+        PrivacySettings.objects.create(user=self.users[0], others_can_see_bio=False)
+        user_ids = [user.pk for user in self.users]
+        with self.assertNumQueries(1):
+            flags = privacy.get_flags_many(user_ids)
+        with self.assertNumQueries(0):
+            self.assertEqual(privacy.get_flags_many(user_ids), flags)
+        self.assertEqual(flags[self.users[1].pk], (None, DEFAULT_PRIVACY_FLAGS))
+        self.assertFalse(privacy.get_settings(self.users[0]).others_can_see_bio)
+
+    def test_invalidate_changes_version(self):
+        """버전이 바뀌면 다른 프로세스에서 저장한 LRU 항목도 사용하지 않음"""
+        user = self.users[0]
+        privacy.get_flags_many([user.pk])
+        PrivacySettings.objects.create(user=user, others_can_see_bio=False)
+        # 다른 프로세스에서 변경한 경우처럼 공유 캐시의 버전만 교체
+        cache.delete(f"privacy_settings_version:{user.pk}")
+        with self.assertNumQueries(1):
+            self.assertFalse(privacy.get_settings(user).others_can_see_bio)
+
+    @override_settings(PRIVACY_SETTINGS_CACHE_SIZE=2)
+    def test_lru_evicts_least_recently_used(self):
+        """LRU 크기를 넘으면 가장 오래 사용하지 않은 항목 삭제"""
+        first, second, third = [user.pk for user in self.users]
+        privacy.get_flags_many([first])
+        privacy.get_flags_many([second])
+        privacy.get_flags_many([first])
+        privacy.get_flags_many([third])
+        with self.assertNumQueries(0):
+            privacy.get_flags_many([first, third])
+        with self.assertNumQueries(1):
+            privacy.get_flags_many([second])
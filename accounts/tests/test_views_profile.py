@@ -1,8 +1,22 @@
+import os
+import tempfile
+from io import BytesIO
+from PIL import Image
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection, transaction
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework.test import APITransactionTestCase
 from rest_framework import status
 from django.contrib.auth import get_user_model
+from accounts.follows import create_follows
 from accounts.models import Follow, PrivacySettings
+from alarm import dispatch
+from alarm.models import Alarm
+from config import image_pipeline
+from insta.models import FeedEntry, Post
 
 User = get_user_model()
 
@@ -24,6 +38,7 @@ class ProfileDetailViewTestCase(APITransactionTestCase):
             password="testpassword123",
         )
         self.client.force_authenticate(user=self.user1)
+        cache.clear()
 
     def test_profile_detail_view(self):
         """프로필 조회 테스트"""
@@ -40,6 +55,87 @@ class ProfileDetailViewTestCase(APITransactionTestCase):
         response = self.client.get(url)
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
+    def test_profile_detail_does_not_create_privacy_settings(self):
+        """프로필 조회 중에 공개 설정 행을 생성하지 않음"""
+        url = reverse(
+            "accounts:profile_detail", kwargs={"username": self.user2.username}
+        )
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(PrivacySettings.objects.filter(user=self.user2).exists())
+
+    def test_profile_card_cached(self):
+        """프로필 카드는 (프로필, 조회자 유형)별로 캐시하고 게시물, 상품은 포함하지 않음"""
+        url = reverse(
+            "accounts:profile_detail", kwargs={"username": self.user2.username}
+        )
+        response = self.client.get(url)
+        card = cache.get(f"profile_card:{self.user2.pk}:others")
+        self.assertEqual(card["username"], self.user2.username)
+        self.assertNotIn("email", card)
+
+        # 사용자 조회와 관계/공개 설정 조회만 실행
+        with CaptureQueriesContext(connection) as queries:
+            cached = self.client.get(url)
+        self.assertEqual(len(queries), 2)
+        self.assertEqual(cached.data, response.data)
+        self.assertNotIn("posts", response.data)
+        self.assertNotIn("products", response.data)
+
+    def test_profile_card_invalidated_on_follow(self):
+        """팔로우 시 캐시된 프로필 카드의 팔로워 수 갱신"""
+        url = reverse(
+            "accounts:profile_detail", kwargs={"username": self.user2.username}
+        )
+        self.assertEqual(self.client.get(url).data["followers_count"], 0)
+        Follow.objects.create(follower=self.user1, following=self.user2)
+        response = self.client.get(url)
+        self.assertEqual(response.data["followers_count"], 1)
+        self.assertEqual(len(response.data["followers"]), 1)
+
+    def test_profile_card_invalidated_on_privacy_change(self):
+        """공개 설정 변경 시 캐시된 프로필 카드에서 숨긴 항목 제외"""
+        url = reverse(
+            "accounts:profile_detail", kwargs={"username": self.user2.username}
+        )
+        self.assertIn("bio", self.client.get(url).data)
+        PrivacySettings.objects.update_or_create(
+            user=self.user2, defaults={"others_can_see_bio": False}
+        )
+        response = self.client.get(url)
+        self.assertNotIn("bio", response.data)
+        self.assertNotIn("followers", response.data)
+
+    def test_profile_posts_paginated(self):
+        """공개된 게시물은 페이지 단위로 조회"""
+        for i in range(3):
+            Post.objects.create(user=self.user2, content=f"post {i}")
+        url = reverse(
+            "accounts:profile_posts", kwargs={"username": self.user2.username}
+        )
+        response = self.client.get(url, {"page_size": 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 2)
+        self.assertIsNotNone(response.data["next"])
+
+    def test_profile_hidden_sections_forbidden(self):
+        """비공개 게시물, 상품 목록 요청은 403 반환"""
+        PrivacySettings.objects.update_or_create(
+            user=self.user2, defaults={"others_can_see_posts": False}
+        )
+        for name in ("accounts:profile_posts", "accounts:profile_products"):
+            url = reverse(name, kwargs={"username": self.user2.username})
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        self.client.force_authenticate(user=self.user2)
+        url = reverse(
+            "accounts:profile_products", kwargs={"username": self.user2.username}
+        )
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 0)
+
 
 class ProfileUpdateViewTestCase(APITransactionTestCase):
     """
@@ -71,6 +167,39 @@ class ProfileUpdateViewTestCase(APITransactionTestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data["bio"], "Partially updated bio")
 
+    def test_profile_image_update_view(self):
+        """프로필 이미지는 처리가 끝날 때까지 기존 이미지를 유지하고, 처리 후 교체"""
+        url = reverse("accounts:profile_update")
+        with tempfile.TemporaryDirectory() as media_root, override_settings(
+            MEDIA_ROOT=media_root,
+            IMAGE_STAGING_ROOT=os.path.join(media_root, "staging"),
+        ):
+            paths = []
+            for size in ((800, 600), (300, 300)):
+                buffer = BytesIO()
+                Image.new("RGB", size).save(buffer, format="JPEG")
+                upload = SimpleUploadedFile("profile.jpg", buffer.getvalue())
+                with transaction.atomic():
+                    response = self.client.patch(
+                        url, {"profile_image": upload}, format="multipart"
+                    )
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(
+                    response.data["profile_image_status"], image_pipeline.PENDING
+                )
+                image_pipeline.join()
+
+                self.user.refresh_from_db()
+                self.assertEqual(self.user.profile_image_status, image_pipeline.READY)
+                with Image.open(self.user.profile_image.path) as processed:
+                    self.assertEqual(processed.size, (400, 400))
+                self.assertTrue(os.path.exists(self.user.profile_image_thumbnail.path))
+                paths.append(self.user.profile_image.path)
+
+            # 새 이미지로 교체되면 기존 이미지 파일은 삭제
+            self.assertFalse(os.path.exists(paths[0]))
+            self.assertTrue(os.path.exists(paths[1]))
+
 
 class PrivacySettingsViewTestCase(APITransactionTestCase):
     """
@@ -156,6 +285,36 @@ class PrivacySettingsViewTestCase(APITransactionTestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn("follower_can_see_email", response.data)
 
+    def test_privacy_settings_get_does_not_create(self):
+        """설정이 없으면 기본값을 반환하고 행은 수정할 때 생성"""
+        response = self.client.get(self.url)
+        self.assertFalse(response.data["follower_can_see_email"])
+        self.assertTrue(response.data["follower_can_see_bio"])
+        self.assertFalse(PrivacySettings.objects.filter(user=self.user).exists())
+
+        for value in (False, True):
+            response = self.client.patch(self.url, {"others_can_see_posts": value})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+        privacy_settings = PrivacySettings.objects.get(user=self.user)
+        self.assertTrue(privacy_settings.others_can_see_posts)
+
+    def test_privacy_settings_update_invalidates_cache(self):
+        """설정 수정 후 다른 사용자의 프로필 조회에 바로 반영"""
+        viewer = User.objects.create_user(
+            username="viewer", email="viewer@example.com", password="testpassword123"
+        )
+        profile_url = reverse(
+            "accounts:profile_detail", kwargs={"username": self.user.username}
+        )
+        self.client.force_authenticate(user=viewer)
+        self.assertIn("bio", self.client.get(profile_url).data)
+
+        self.client.force_authenticate(user=self.user)
+        self.client.patch(self.url, {"others_can_see_bio": False})
+
+        self.client.force_authenticate(user=viewer)
+        self.assertNotIn("bio", self.client.get(profile_url).data)
+
 
 class FollowViewTestCase(APITransactionTestCase):
     """
@@ -187,6 +346,17 @@ class FollowViewTestCase(APITransactionTestCase):
         print(f"Response status code: {response.status_code}")
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
 
+    def test_follow_updates_counts(self):
+        """팔로우 시 팔로워/팔로잉 카운터 증가 테스트"""
+        url = reverse("accounts:follow", kwargs={"pk": self.user2.id})
+        response = self.client.post(url)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        self.user1.refresh_from_db()
+        self.user2.refresh_from_db()
+        self.assertEqual(self.user1.following_count, 1)
+        self.assertEqual(self.user2.followers_count, 1)
+
     def test_follow_self(self):
         """자기 자신을 팔로우하려는 경우 에러"""
         url = reverse("accounts:follow", kwargs={"pk": self.user1.id})
@@ -251,6 +421,61 @@ class FollowViewTestCase(APITransactionTestCase):
         self.assertIn(self.user2.username, usernames)
         self.assertIn(self.user3.username, usernames)
 
+    def test_follower_list_paginated(self):
+        """팔로워 목록은 최근 팔로우한 순서로 커서 페이지네이션"""
+        followers = [
+            User.objects.create(username=f"follower{i}", email=f"f{i}@example.com")
+            for i in range(3)
+        ]
+        for follower in followers:
+            Follow.objects.create(follower=follower, following=self.user1)
+
+        url = reverse("accounts:profile_followers", kwargs={"username": "testuser1"})
+        response = self.client.get(url, {"page_size": 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [user["username"] for user in response.data["results"]],
+            ["follower2", "follower1"],
+        )
+        response = self.client.get(response.data["next"])
+        self.assertEqual(
+            [user["username"] for user in response.data["results"]], ["follower0"]
+        )
+        self.assertIsNone(response.data["next"])
+
+        # follower0이 요청 사용자를 팔로우하므로 팔로잉 목록 공개 (following 유형)
+        url = reverse("accounts:profile_following", kwargs={"username": "follower0"})
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"][0]["username"], "testuser1")
+
+    def test_follow_list_hidden(self):
+        """팔로워 목록 비공개(others 기본값)이면 403 반환"""
+        url = reverse("accounts:profile_followers", kwargs={"username": "testuser2"})
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_profile_follow_list_first_page(self):
+        """프로필에는 팔로워 첫 페이지와 다음 페이지 링크만 포함"""
+        for i in range(12):
+            follower = User.objects.create(
+                username=f"follower{i}", email=f"f{i}@example.com"
+            )
+            Follow.objects.create(follower=follower, following=self.user1)
+
+        url = reverse("accounts:profile_detail", kwargs={"username": "testuser1"})
+        response = self.client.get(url)
+        self.assertEqual(response.data["followers_count"], 12)
+        self.assertEqual(len(response.data["followers"]), 10)
+        self.assertEqual(response.data["followers"][0]["username"], "follower11")
+        self.assertIsNone(response.data["following_next"])
+
+        response = self.client.get(response.data["followers_next"])
+        self.assertEqual(
+            [user["username"] for user in response.data["results"]],
+            ["follower1", "follower0"],
+        )
+
 
 class UnfollowViewTestCase(APITransactionTestCase):
     """
@@ -277,6 +502,16 @@ class UnfollowViewTestCase(APITransactionTestCase):
         response = self.client.delete(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    def test_unfollow_updates_counts(self):
+        """언팔로우 시 팔로워/팔로잉 카운터 감소 테스트"""
+        url = reverse("accounts:unfollow", kwargs={"pk": self.user2.id})
+        self.client.delete(url)
+
+        self.user1.refresh_from_db()
+        self.user2.refresh_from_db()
+        self.assertEqual(self.user1.following_count, 0)
+        self.assertEqual(self.user2.followers_count, 0)
+
     def test_unfollow_not_following(self):
         """언팔로우할 사용자가 팔로우하지 않은 경우 에러"""
         Follow.objects.filter(follower=self.user1, following=self.user2).delete()
@@ -297,6 +532,125 @@ class UnfollowViewTestCase(APITransactionTestCase):
         )
 
 
+class BulkFollowViewTestCase(APITransactionTestCase):
+    """
+    일괄 팔로우/언팔로우 테스트
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="testuser@example.com",
+            password="testpassword123",
+        )
+        self.others = [
+            User.objects.create(username=f"other{i}", email=f"other{i}@example.com")
+            for i in range(6)
+        ]
+        self.client.force_authenticate(user=self.user)
+        # 팔로우 알림이 모두 처리된 후 테이블 초기화
+        self.addCleanup(dispatch.join)
+
+    def test_bulk_follow(self):
+        """새 관계만 생성하고 자기 자신, 없는 사용자, 이미 팔로우한 사용자는 건너뜀"""
+        Follow.objects.create(follower=self.user, following=self.others[0])
+        user_ids = [user.id for user in self.others[:3]] + [self.user.id, 99999]
+        response = self.client.post(
+            reverse("accounts:bulk_follow"), {"user_ids": user_ids}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["created"], user_ids[1:3])
+        self.assertEqual(response.data["skipped"], [user_ids[0], *user_ids[3:]])
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.following_count, 3)
+        self.others[1].refresh_from_db()
+        self.assertEqual(self.others[1].followers_count, 1)
+
+        dispatch.join()
+        alarm = Alarm.objects.get(recipient=self.others[1])
+        self.assertEqual(alarm.message, "testuser님이 당신을 팔로우했습니다.")
+
+    @override_settings(FEED_FANOUT_MAX_FOLLOWERS=2, FEED_BACKFILL_LIMIT=2)
+    def test_bulk_follow_backfills_feed(self):
+        """팔로우한 사용자들의 최근 게시물을 피드에 추가하고 대형 계정은 제외"""
+        posts = [
+            Post.objects.create(user=user, content=f"{user.username} {i}")
+            for user in self.others[:2]
+            for i in range(3)
+        ]
+        # 팔로워 2명인 대형 계정 (일괄 팔로우 후 3명)
+        for user in self.others[2:4]:
+            Follow.objects.create(follower=user, following=self.others[1])
+        self.client.post(
+            reverse("accounts:bulk_follow"),
+            {"user_ids": [user.id for user in self.others[:2]]},
+            format="json",
+        )
+        self.assertEqual(
+            set(
+                FeedEntry.objects.filter(user=self.user).values_list(
+                    "post_id", flat=True
+                )
+            ),
+            {posts[1].id, posts[2].id},
+        )
+
+    def test_bulk_follow_skips_concurrent_follow(self):
+        """다른 요청이 먼저 저장한 관계는 생성 결과와 카운터에 포함하지 않음"""
+        # signal 없이 저장해서 동시에 생성된 관계처럼 카운터는 그대로 둠
+        Follow.objects.bulk_create(
+            [Follow(follower=self.user, following=self.others[0])]
+        )
+        follows = create_follows(
+            [(self.user.id, self.others[0].id), (self.user.id, self.others[1].id)]
+        )
+        self.assertEqual(
+            [follow.following_id for follow in follows], [self.others[1].id]
+        )
+        self.assertTrue(all(follow.pk and follow.created_at for follow in follows))
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.following_count, 1)
+        self.others[0].refresh_from_db()
+        self.assertEqual(self.others[0].followers_count, 0)
+
+    def test_bulk_follow_query_count(self):
+        """팔로우할 사용자 수와 관계없이 쿼리 수가 일정"""
+        url = reverse("accounts:bulk_follow")
+        with CaptureQueriesContext(connection) as few:
+            self.client.post(url, {"user_ids": [self.others[0].id]}, format="json")
+        with CaptureQueriesContext(connection) as many:
+            self.client.post(
+                url, {"user_ids": [user.id for user in self.others[1:]]}, format="json"
+            )
+        self.assertEqual(len(many), len(few))
+
+    @override_settings(FOLLOW_BULK_MAX_USERS=2)
+    def test_bulk_follow_limit(self):
+        """최대 사용자 수를 넘으면 400 반환"""
+        response = self.client.post(
+            reverse("accounts:bulk_follow"),
+            {"user_ids": [user.id for user in self.others[:3]]},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Follow.objects.exists())
+
+    def test_bulk_unfollow(self):
+        """팔로우 중인 사용자만 언팔로우"""
+        for user in self.others[:2]:
+            Follow.objects.create(follower=self.user, following=user)
+        response = self.client.post(
+            reverse("accounts:bulk_unfollow"),
+            {"user_ids": [self.others[0].id, self.others[2].id]},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["deleted"], [self.others[0].id])
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.following_count, 1)
+
+
 class ProfileSearchViewTestCase(APITransactionTestCase):
     def setUp(self):
         User.objects.all().delete()
@@ -344,6 +698,73 @@ class ProfileSearchViewTestCase(APITransactionTestCase):
         print(f"Response data: {response.data}")
         self.assertEqual(response.data["count"], 0)
 
+    def test_profile_search_ranking(self):
+        """유사도가 높은 순, 같으면 팔로워 수가 많은 순으로 정렬"""
+        User.objects.filter(id=self.user3.id).update(
+            username="my_testuser_account", followers_count=10
+        )
+        User.objects.create_user(
+            username="testuser3", password="12345", email="test3@example.com"
+        )
+        User.objects.filter(username="testuser3").update(followers_count=5)
+
+        url = reverse("accounts:profile_search")
+        response = self.client.get(url, {"q": "testuser"})
+        self.assertEqual(
+            [user["username"] for user in response.data["results"]],
+            ["testuser3", "testuser2", "my_testuser_account"],
+        )
+
+    def test_profile_search_email_exact_only(self):
+        """이메일은 정확히 일치할 때만 검색"""
+        url = reverse("accounts:profile_search")
+        response = self.client.get(url, {"q": "other@example"})
+        self.assertEqual(response.data["count"], 0)
+
+        response = self.client.get(url, {"q": "other@example.com"})
+        self.assertEqual(response.data["count"], 1)
+        self.assertEqual(response.data["results"][0]["username"], "otheruser")
+
+    def test_profile_search_relationship(self):
+        """검색 결과의 팔로우 관계는 결과 수와 관계없이 한 번의 쿼리로 조회"""
+        Follow.objects.create(follower=self.user1, following=self.user2)
+        url = reverse("accounts:profile_search")
+        with CaptureQueriesContext(connection) as single:
+            self.client.get(url, {"q": "testuser"})
+        for i in range(3, 8):
+            User.objects.create_user(
+                username=f"testuser{i}", password="12345", email=f"t{i}@example.com"
+            )
+        with CaptureQueriesContext(connection) as many:
+            response = self.client.get(url, {"q": "testuser"})
+
+        self.assertEqual(len(many), len(single))
+        results = {user["username"]: user for user in response.data["results"]}
+        self.assertTrue(results["testuser2"]["is_following"])
+        self.assertFalse(results["testuser2"]["is_follower"])
+        self.assertFalse(results["testuser3"]["is_following"])
+
+    def test_profile_autocomplete(self):
+        """사용자명 접두사 일치, 팔로워 수 순서, PROFILE_AUTOCOMPLETE_SIZE명까지 반환"""
+        User.objects.filter(id=self.user3.id).update(followers_count=3)
+        for i in range(12):
+            User.objects.create_user(
+                username=f"other{i:02d}", password="12345", email=f"o{i}@example.com"
+            )
+
+        url = reverse("accounts:profile_autocomplete")
+        response = self.client.get(url, {"q": "OTHER"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 10)
+        self.assertEqual(response.data[0]["username"], "otheruser")
+        self.assertEqual(response.data[1]["username"], "other00")
+
+        response = self.client.get(url, {"q": "user"})
+        self.assertEqual(response.data, [])
+
+        response = self.client.get(url)
+        self.assertEqual(response.data, [])
+
     def tearDown(self):
         User.objects.all().delete()
         print(f"User count after tearDown: {User.objects.count()}")
@@ -1,10 +1,15 @@
 from rest_framework.test import APITestCase
+from django.core.cache import cache
+from django.core.management import call_command
 from django.urls import reverse
 from rest_framework import status
 from django.contrib.auth import get_user_model
+from accounts import recommendations
+from accounts.models import Follow
 from insta.models import Post
 from taggit.models import Tag
 from itertools import count
+from io import StringIO
 
 User = get_user_model()
 
@@ -24,6 +29,7 @@ class FriendRecommendationViewTestCase(APITestCase):
         )
         self.client.force_authenticate(user=self.user)
         self.user_counter = count(1)
+        cache.clear()
 
     def create_user(self, username=None):
         counter = next(self.user_counter)
@@ -101,6 +107,60 @@ class FriendRecommendationViewTestCase(APITestCase):
         print(f"Response data: {response.data}")
         self.assertTrue(len(response.data) <= 15)
 
+    def test_friends_of_friends_ranked_first(self):
+        """
+        내가 팔로우하는 사용자들이 많이 팔로우하는 사용자가 먼저 추천되는지 테스트
+        """
+        friend1 = self.create_user("friend1")
+        friend2 = self.create_user("friend2")
+        both = self.create_user("both")
+        one = self.create_user("one")
+        Follow.objects.create(follower=self.user, following=friend1)
+        Follow.objects.create(follower=self.user, following=friend2)
+        Follow.objects.create(follower=friend1, following=both)
+        Follow.objects.create(follower=friend2, following=both)
+        Follow.objects.create(follower=friend1, following=one)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        usernames = [r["username"] for r in response.data]
+        self.assertEqual(usernames[:2], ["both", "one"])
+        self.assertNotIn("friend1", usernames)
+        self.assertNotIn("testuser", usernames)
+
+    def test_recommendations_served_from_cache(self):
+        """
+        배치 작업으로 저장한 추천 목록을 사용자 조회 쿼리 한 번으로 반환하는지 테스트
+        """
+        for i in range(5):
+            self.create_user(f"user{i}")
+        call_command("build_recommendations", stdout=StringIO())
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 5)
+
+    def test_follow_updates_cached_recommendations(self):
+        """
+        팔로우하면 캐시된 추천 목록에서 제외되고, 그 사용자가 팔로우하는 사용자가 추천되는지 테스트
+        """
+        friend = self.create_user("friend")
+        friend_of_friend = self.create_user("friend_of_friend")
+        Follow.objects.create(follower=friend, following=friend_of_friend)
+        call_command("build_recommendations", stdout=StringIO())
+
+        # signal은 commit 이후 갱신하므로 직접 호출
+        Follow.objects.create(follower=self.user, following=friend)
+        recommendations.on_follow(self.user.id, friend.id)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+        usernames = [r["username"] for r in response.data]
+        self.assertEqual(usernames[0], "friend_of_friend")
+        self.assertNotIn("friend", usernames)
+
     def test_authenticated_user_required(self):
         """인증된 사용자 테스트"""
         self.client.force_authenticate(user=None)
@@ -31,6 +31,26 @@ urlpatterns = [
         profile.ProfileDetailView.as_view(),
         name="profile_detail",
     ),
+    path(
+        "profile/<str:username>/followers/",
+        profile.ProfileFollowerListView.as_view(),
+        name="profile_followers",
+    ),
+    path(
+        "profile/<str:username>/following/",
+        profile.ProfileFollowingListView.as_view(),
+        name="profile_following",
+    ),
+    path(
+        "profile/<str:username>/posts/",
+        profile.ProfilePostListView.as_view(),
+        name="profile_posts",
+    ),
+    path(
+        "profile/<str:username>/products/",
+        profile.ProfileProductListView.as_view(),
+        name="profile_products",
+    ),
     path("profile/", profile.ProfileUpdateView.as_view(), name="profile_update"),
     path(
         "privacy-settings/<str:username>/",
@@ -39,8 +59,15 @@ urlpatterns = [
     ),
     path("follow/<int:pk>/", profile.FollowView.as_view(), name="follow"),
     path("unfollow/<int:pk>/", profile.UnfollowView.as_view(), name="unfollow"),
+    path("follow/bulk/", profile.BulkFollowView.as_view(), name="bulk_follow"),
+    path("unfollow/bulk/", profile.BulkUnfollowView.as_view(), name="bulk_unfollow"),
     # 프로필 검색
     path("search/", profile.ProfileSearchView.as_view(), name="profile_search"),
+    path(
+        "search/autocomplete/",
+        profile.ProfileAutocompleteView.as_view(),
+        name="profile_autocomplete",
+    ),
     # 친구 추천
     path(
         "recommend/",
@@ -1,4 +1,5 @@
 from django.contrib.auth import get_user_model
+from django.db import transaction
 from django.shortcuts import get_object_or_404
 from django_filters import rest_framework as filters
 from django.core.exceptions import PermissionDenied
@@ -14,14 +15,24 @@ from drf_spectacular.utils import (
 )
 from drf_spectacular.types import OpenApiTypes
 from accounts.serializers import (
+    BulkFollowSerializer,
     FollowSerializer,
+    FollowUserSerializer,
     ProfileSerializer,
     ProfileUpdateSerializer,
     PrivacySettingsSerializer,
     ProfileSearchSerializer,
+    ProfileSearchResultSerializer,
 )
+from accounts import privacy, profiles, search
+from accounts.follows import create_follows
 from accounts.filters import ProfileFilter
-from accounts.models import Follow, PrivacySettings
+from accounts.models import Follow
+from config.pagination import CursorPagination, PageNumberPagination
+from insta.models import Post
+from insta.serializers import PostSerializer
+from market.models import Product
+from market.serializers import ProductListSerializer
 
 User = get_user_model()
 
@@ -35,7 +46,11 @@ class ProfileDetailView(generics.RetrieveAPIView):
 
     @extend_schema(
         summary="사용자 프로필 조회",
-        description="지정된 사용자명의 프로필 정보를 조회합니다. 조회자의 권한에 따라 정보 표시가 다를 수 있습니다.",
+        description=(
+            "지정된 사용자명의 프로필 정보를 조회합니다. 조회자의 권한에 따라 정보 표시가 다를 수 있습니다. "
+            "팔로워/팔로잉 목록은 첫 페이지만 포함하며 다음 페이지는 followers_next, following_next 링크로 조회합니다. "
+            "게시물과 상품은 profile/{username}/posts/, profile/{username}/products/에서 페이지 단위로 조회합니다."
+        ),
         parameters=[
             OpenApiParameter(
                 name="username",
@@ -61,6 +76,19 @@ class ProfileDetailView(generics.RetrieveAPIView):
                     "profile_image": "http://example.com/profile.jpg",
                     "followers_count": 10,
                     "following_count": 20,
+                    "followers": [
+                        {
+                            "id": "2",
+                            "username": "follower_user",
+                            "profile_image": None,
+                            "is_following": True,
+                            "is_follower": True,
+                        }
+                    ],
+                    "followers_next": "http://example.com/accounts/profile/example_user/followers/?cursor=eyJwIjogWyIyMDI0LTAxLTAxVDAwOjAwOjAwKzAwOjAwIiwgIjEwIl0sICJyIjogMH0%3D",
+                    "following": [],
+                    "following_next": None,
+                    "is_self": False,
                 },
                 response_only=True,
             ),
@@ -71,6 +99,144 @@ class ProfileDetailView(generics.RetrieveAPIView):
         return super().get(request, *args, **kwargs)
 
 
+class ProfileSectionMixin:
+    """
+    프로필 하위 목록(팔로워, 팔로잉, 게시물, 상품) 공통 처리
+    username으로 프로필 사용자를 찾고, 조회자가 볼 수 없는 항목이면 403 반환
+    """
+
+    section = None
+
+    def get_owner(self):
+        owner = get_object_or_404(User, username=self.kwargs["username"])
+        access = profiles.get_access(self.request, owner)
+        if not access.can_see(self.section):
+            raise PermissionDenied("이 정보를 볼 수 있는 권한이 없습니다.")
+        return owner
+
+
+class ProfileFollowListView(ProfileSectionMixin, generics.ListAPIView):
+    """
+    팔로워/팔로잉 목록
+    Follow.created_at 최신순 커서 페이지네이션으로 Follow를 조회하고 목록의 사용자를 직렬화
+    """
+
+    serializer_class = FollowUserSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = CursorPagination
+
+    def get_queryset(self):
+        return profiles.follow_list(self.get_owner(), self.section)
+
+    def list(self, request, *args, **kwargs):
+        page = self.paginate_queryset(self.get_queryset())
+        user_field = profiles.FOLLOW_LISTS[self.section][1]
+        serializer = self.get_serializer(
+            [getattr(follow, user_field) for follow in page], many=True
+        )
+        return self.get_paginated_response(serializer.data)
+
+
+FOLLOW_LIST_PARAMETERS = [
+    OpenApiParameter(
+        name="cursor",
+        description="이전 응답의 next/previous 링크에 포함된 커서 값",
+        required=False,
+        type=str,
+    ),
+    OpenApiParameter(
+        name="page_size",
+        description="한 페이지의 결과 수 (최대 50)",
+        required=False,
+        type=int,
+    ),
+]
+
+
+@extend_schema(
+    summary="팔로워 목록 조회",
+    description="사용자를 팔로우한 사용자를 최근 팔로우한 순서로 조회합니다. 공개 설정에 따라 볼 수 없으면 403을 반환합니다.",
+    parameters=FOLLOW_LIST_PARAMETERS,
+    responses={
+        200: FollowUserSerializer(many=True),
+        403: OpenApiTypes.OBJECT,
+        404: OpenApiTypes.OBJECT,
+    },
+    tags=["profile"],
+)
+class ProfileFollowerListView(ProfileFollowListView):
+    section = "followers"
+
+
+@extend_schema(
+    summary="팔로잉 목록 조회",
+    description="사용자가 팔로우한 사용자를 최근 팔로우한 순서로 조회합니다. 공개 설정에 따라 볼 수 없으면 403을 반환합니다.",
+    parameters=FOLLOW_LIST_PARAMETERS,
+    responses={
+        200: FollowUserSerializer(many=True),
+        403: OpenApiTypes.OBJECT,
+        404: OpenApiTypes.OBJECT,
+    },
+    tags=["profile"],
+)
+class ProfileFollowingListView(ProfileFollowListView):
+    section = "following"
+
+
+@extend_schema(
+    summary="프로필 게시물 목록 조회",
+    description="사용자의 게시물을 최신순으로 조회합니다. 공개 설정에 따라 볼 수 없으면 403을 반환합니다.",
+    parameters=[
+        OpenApiParameter(
+            name="cursor",
+            description="이전 응답의 next/previous 링크에 포함된 커서 값",
+            required=False,
+            type=str,
+        ),
+    ],
+    responses={
+        200: PostSerializer(many=True),
+        403: OpenApiTypes.OBJECT,
+        404: OpenApiTypes.OBJECT,
+    },
+    tags=["profile"],
+)
+class ProfilePostListView(ProfileSectionMixin, generics.ListAPIView):
+    serializer_class = PostSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = CursorPagination
+    section = "posts"
+
+    def get_queryset(self):
+        return PostSerializer.setup_eager_loading(
+            Post.objects.filter(user=self.get_owner())
+        ).order_by("-created_at", "-id")
+
+
+@extend_schema(
+    summary="프로필 상품 목록 조회",
+    description="사용자의 상품을 최신순으로 조회합니다. 공개 설정에 따라 볼 수 없으면 403을 반환합니다.",
+    responses={
+        200: ProductListSerializer(many=True),
+        403: OpenApiTypes.OBJECT,
+        404: OpenApiTypes.OBJECT,
+    },
+    tags=["profile"],
+)
+class ProfileProductListView(ProfileSectionMixin, generics.ListAPIView):
+    serializer_class = ProductListSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = PageNumberPagination
+    section = "products"
+
+    def get_queryset(self):
+        return (
+            Product.objects.filter(user=self.get_owner())
+            .select_related("user", "primary_image")
+            .order_by("-created_at", "-id")
+        )
+
+
 class ProfileUpdateView(generics.UpdateAPIView):
 
     serializer_class = ProfileUpdateSerializer
@@ -144,7 +310,8 @@ class PrivacySettingsView(generics.RetrieveUpdateAPIView):
         if self.request.user != user:
             raise PermissionDenied("You don't have permission to access this settings.")
 
-        return PrivacySettings.objects.get_or_create(user=user)[0]
+        # 행이 없으면 기본값으로 만든 객체를 반환하고 수정할 때 생성
+        return privacy.get_settings(user)
 
     @extend_schema(
         summary="프로필 보안 설정 조회",
@@ -369,6 +536,97 @@ class FollowView(generics.CreateAPIView):
             )
 
 
+class BulkFollowView(generics.GenericAPIView):
+    """
+    여러 사용자를 한 번에 팔로우
+    관계는 INSERT 한 번으로 저장하고 카운터와 알림은 한 번에 처리 (accounts.follows)
+    """
+
+    serializer_class = BulkFollowSerializer
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        summary="일괄 팔로우",
+        description=(
+            "여러 사용자를 한 번에 팔로우합니다. 자기 자신, 존재하지 않는 사용자, 이미 팔로우한 사용자는 건너뜁니다. "
+            "팔로우된 사용자에게는 요청마다 알림이 하나씩 생성됩니다."
+        ),
+        request=BulkFollowSerializer,
+        responses={
+            status.HTTP_201_CREATED: OpenApiTypes.OBJECT,
+            status.HTTP_400_BAD_REQUEST: OpenApiTypes.OBJECT,
+            status.HTTP_401_UNAUTHORIZED: OpenApiTypes.OBJECT,
+        },
+        examples=[
+            OpenApiExample(
+                "요청 예시",
+                value={"user_ids": [2, 3, 4]},
+                request_only=True,
+            ),
+            OpenApiExample(
+                "성공 응답",
+                value={"created": [2, 4], "skipped": [3]},
+                response_only=True,
+                status_codes=["201"],
+            ),
+        ],
+        tags=["profile"],
+    )
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        user_ids = serializer.validated_data["user_ids"]
+
+        follows = create_follows((request.user.id, user_id) for user_id in user_ids)
+        created = {follow.following_id for follow in follows}
+        return Response(
+            {
+                "created": [user_id for user_id in user_ids if user_id in created],
+                "skipped": [user_id for user_id in user_ids if user_id not in created],
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
+
+class BulkUnfollowView(generics.GenericAPIView):
+    """여러 사용자를 한 번에 언팔로우"""
+
+    serializer_class = BulkFollowSerializer
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        summary="일괄 언팔로우",
+        description="여러 사용자를 한 번에 언팔로우합니다. 팔로우하지 않은 사용자는 건너뜁니다.",
+        request=BulkFollowSerializer,
+        responses={
+            status.HTTP_200_OK: OpenApiTypes.OBJECT,
+            status.HTTP_400_BAD_REQUEST: OpenApiTypes.OBJECT,
+            status.HTTP_401_UNAUTHORIZED: OpenApiTypes.OBJECT,
+        },
+        examples=[
+            OpenApiExample(
+                "성공 응답",
+                value={"deleted": [2, 4]},
+                response_only=True,
+                status_codes=["200"],
+            ),
+        ],
+        tags=["profile"],
+    )
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        with transaction.atomic():
+            follows = Follow.objects.filter(
+                follower=request.user,
+                following_id__in=serializer.validated_data["user_ids"],
+            )
+            deleted = list(follows.values_list("following_id", flat=True))
+            follows.delete()
+        return Response({"deleted": deleted})
+
+
 @extend_schema(
     summary="언팔로우",
     description="특정 사용자를 언팔로우합니다.",
@@ -429,23 +687,23 @@ class UnfollowView(generics.DestroyAPIView):
 
 
 class ProfileSearchView(generics.ListAPIView):
-    serializer_class = ProfileSearchSerializer
+    serializer_class = ProfileSearchResultSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = (filters.DjangoFilterBackend,)
     filterset_class = ProfileFilter
 
     @extend_schema(
         summary="프로필 검색",
-        description="사용자 이름, 이메일을 기반으로 프로필을 검색합니다.",
+        description="사용자 이름 부분 일치 또는 이메일 정확히 일치로 프로필을 검색합니다. 유사도, 팔로워 수 순서로 정렬됩니다.",
         parameters=[
             OpenApiParameter(
                 name="q",
-                description="검색 쿼리 (사용자 이름, 이메일)",
+                description="검색 쿼리 (사용자 이름 일부 또는 전체 이메일)",
                 required=False,
                 type=str,
             ),
         ],
-        responses={200: ProfileSearchSerializer(many=True)},
+        responses={200: ProfileSearchResultSerializer(many=True)},
         examples=[
             OpenApiExample(
                 "응답 예시",
@@ -454,11 +712,15 @@ class ProfileSearchView(generics.ListAPIView):
                         "id": 1,
                         "username": "john_doe",
                         "profile_image": "http://example.com/media/profile_images/john.jpg",
+                        "is_following": True,
+                        "is_follower": False,
                     },
                     {
                         "id": 2,
                         "username": "jane_doe",
                         "profile_image": "http://example.com/media/profile_images/jane.jpg",
+                        "is_following": False,
+                        "is_follower": False,
                     },
                 ],
                 response_only=True,
@@ -478,3 +740,39 @@ class ProfileSearchView(generics.ListAPIView):
         if not self.request.query_params.get("q"):
             return queryset.none()
         return filtered_queryset
+
+
+class ProfileAutocompleteView(generics.ListAPIView):
+    """
+    검색창 입력 중 자동완성
+    사용자명이 입력값으로 시작하는 사용자를 팔로워 수 순서로 PROFILE_AUTOCOMPLETE_SIZE명까지 반환
+    """
+
+    serializer_class = ProfileSearchSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = None
+
+    @extend_schema(
+        summary="프로필 자동완성",
+        description="사용자 이름이 입력값으로 시작하는 사용자를 팔로워 수가 많은 순서로 최대 10명 반환합니다.",
+        parameters=[
+            OpenApiParameter(
+                name="q",
+                description="사용자 이름 앞부분",
+                required=False,
+                type=str,
+            ),
+        ],
+        responses={200: ProfileSearchSerializer(many=True)},
+        tags=["profile"],
+    )
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
+    def get_queryset(self):
+        prefix = self.request.query_params.get("q", "").strip()
+        if not prefix:
+            return User.objects.none()
+        return search.autocomplete(
+            User.objects.exclude(id=self.request.user.id), prefix
+        )
@@ -2,10 +2,9 @@ from django.contrib.auth import get_user_model
 from rest_framework import generics, status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
-from django_filters import rest_framework as filters
 from drf_spectacular.utils import extend_schema, OpenApiResponse
+from accounts import recommendations
 from accounts.serializers import ProfileSearchSerializer
-from accounts.filters import FriendRecommendationFilter
 
 User = get_user_model()
 
@@ -13,12 +12,11 @@ User = get_user_model()
 class FriendRecommendationView(generics.ListAPIView):
     """
     친구 추천 view
+    추천 목록은 build_recommendations 배치 작업이 미리 계산해서 캐시에 저장한 값을 사용
     """
 
     serializer_class = ProfileSearchSerializer
     permission_classes = [IsAuthenticated]
-    filter_backends = (filters.DjangoFilterBackend,)
-    filterset_class = FriendRecommendationFilter
 
     @extend_schema(
         summary="친구 추천",
@@ -35,25 +33,12 @@ class FriendRecommendationView(generics.ListAPIView):
         tags=["profile"],
     )
     def list(self, request, *args, **kwargs):
-        queryset = self.filter_queryset(self.get_queryset())
-        recommended_users = set()
-
-        for recommendation_type in ["followers", "interests", "popular"]:
-            filtered_queryset = self.filterset_class(
-                data={"recommendation_type": recommendation_type},
-                queryset=queryset,
-                request=request,
-            ).qs
-
-            for user in filtered_queryset:
-                recommended_users.add(user.id)
-                if len(recommended_users) >= 15:
-                    break
-
-            if len(recommended_users) >= 15:
-                break
-
-        final_recommendations = User.objects.filter(id__in=recommended_users)[:15]
+        recommended_ids = recommendations.get_recommended_ids(request.user.id)
+        users = User.objects.in_bulk(recommended_ids)
+        # 추천 점수 순서 유지 (탈퇴한 사용자는 제외)
+        final_recommendations = [
+            users[user_id] for user_id in recommended_ids if user_id in users
+        ]
         serializer = self.get_serializer(final_recommendations, many=True)
         return Response(serializer.data)
 
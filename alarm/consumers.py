@@ -15,3 +15,8 @@ class AlarmConsumer(AsyncWebsocketConsumer):
     async def send_alarm(self, event):
         alarm = event["alarm"]
         await self.send(text_data=json.dumps({"alarm": alarm}))
+
+    async def send_alarms(self, event):
+        """알림 발송 파이프라인에서 수신자별로 묶어서 전송한 알림"""
+        for alarm in event["alarms"]:
+            await self.send(text_data=json.dumps({"alarm": alarm}))
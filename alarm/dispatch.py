@@ -0,0 +1,179 @@
+"""
+알림 발송 파이프라인
+signal은 알림 생성 요청(intent)만 등록하고, 트랜잭션 commit 이후 프로세스 내 큐에 추가
+워커 스레드가 큐에 쌓인 요청을 모아서 처리하므로 요청 처리 시간에 알림 저장과 Redis 전송이 포함되지 않음
+
+백엔드 (settings.ALARM_DISPATCH_BACKEND)
+- local: 워커 스레드가 Alarm을 bulk_create 후 채널 레이어로 일괄 전송
+- redis: 워커 스레드는 Redis 리스트에 적재만 하고, run_alarm_worker 명령어 프로세스가 처리
+"""
+
+import asyncio
+import json
+import logging
+import queue
+import threading
+import uuid
+from collections import defaultdict
+import redis
+from channels.layers import get_channel_layer
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from alarm.models import Alarm
+
+logger = logging.getLogger(__name__)
+
+_queue = queue.Queue()
+_worker = None
+_worker_lock = threading.Lock()
+
+
+def enqueue(recipient_id, sender_id, alarm_type, message, related_object_id=None):
+    """
+    알림 생성 요청 등록
+    트랜잭션 commit 이후에 큐에 추가되며, 롤백되면 함께 폐기됨
+    """
+    if isinstance(related_object_id, uuid.UUID):
+        related_object_id = str(related_object_id)
+
+    intent = {
+        "recipient_id": recipient_id,
+        "sender_id": sender_id,
+        "alarm_type": alarm_type,
+        "message": message,
+        "related_object_id": related_object_id,
+    }
+    transaction.on_commit(lambda: _put(intent))
+
+
+def join():
+    """큐에 추가된 알림 요청이 모두 처리될 때까지 대기"""
+    _queue.join()
+
+
+def _put(intent):
+    _ensure_worker()
+    _queue.put(intent)
+
+
+def _ensure_worker():
+    global _worker
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(
+                target=_run_local_worker, name="alarm-dispatch", daemon=True
+            )
+            _worker.start()
+
+
+def _collect_batch():
+    """첫 요청이 들어올 때까지 대기한 뒤, 이미 쌓여 있는 요청을 배치 크기만큼 함께 꺼냄"""
+    batch = [_queue.get()]
+    while len(batch) < settings.ALARM_DISPATCH_BATCH_SIZE:
+        try:
+            batch.append(_queue.get_nowait())
+        except queue.Empty:
+            break
+    return batch
+
+
+def _run_local_worker():
+    loop = asyncio.new_event_loop()
+    client = None
+    while True:
+        batch = _collect_batch()
+        try:
+            if settings.ALARM_DISPATCH_BACKEND == "redis":
+                client = client or get_redis()
+                push_to_redis(client, batch)
+            else:
+                process_batch(batch, loop)
+        except Exception:
+            logger.exception("알림 %d건 처리에 실패했습니다.", len(batch))
+        finally:
+            close_old_connections()
+            for _ in batch:
+                _queue.task_done()
+
+
+def process_batch(intents, loop):
+    """알림을 한 번에 저장하고 수신자별로 묶어서 전송"""
+    alarms = Alarm.objects.bulk_create([Alarm(**intent) for intent in intents])
+    publish(alarms, loop)
+    return alarms
+
+
+def publish(alarms, loop):
+    """수신자별 알림 목록을 채널 레이어로 동시에 전송"""
+    messages = defaultdict(list)
+    for alarm in alarms:
+        messages[alarm.recipient_id].append(alarm.message)
+
+    channel_layer = get_channel_layer()
+
+    async def send_all():
+        await asyncio.gather(
+            *(
+                channel_layer.group_send(
+                    f"user_{recipient_id}_alarms",
+                    {"type": "send_alarms", "alarms": alarm_messages},
+                )
+                for recipient_id, alarm_messages in messages.items()
+            )
+        )
+
+    loop.run_until_complete(send_all())
+
+
+def get_redis():
+    return redis.Redis.from_url(settings.ALARM_DISPATCH_REDIS_URL)
+
+
+def push_to_redis(client, intents):
+    client.rpush(
+        settings.ALARM_DISPATCH_QUEUE_KEY, *[json.dumps(intent) for intent in intents]
+    )
+
+
+def pop_from_redis(client, timeout):
+    """
+    Redis 큐에서 배치 크기만큼 요청을 꺼냄
+    비어 있으면 timeout(초)만큼 대기 후 빈 리스트 반환
+    """
+    key = settings.ALARM_DISPATCH_QUEUE_KEY
+    item = client.blpop([key], timeout=timeout)
+    if item is None:
+        return []
+
+    size = settings.ALARM_DISPATCH_BATCH_SIZE
+    with client.pipeline() as pipe:
+        pipe.lrange(key, 0, size - 2)
+        pipe.ltrim(key, size - 1, -1)
+        rest, _ = pipe.execute()
+    return [json.loads(value) for value in [item[1], *rest]]
+
+
+def run_redis_worker(timeout=5, stop_when_empty=False):
+    """
+    Redis 큐의 알림 요청을 처리하는 워커 루프
+    처리한 알림 수를 반환
+    """
+    client = get_redis()
+    loop = asyncio.new_event_loop()
+    processed = 0
+    try:
+        while True:
+            intents = pop_from_redis(client, timeout)
+            if not intents:
+                if stop_when_empty:
+                    break
+                continue
+            try:
+                processed += len(process_batch(intents, loop))
+            except Exception:
+                logger.exception("알림 %d건 처리에 실패했습니다.", len(intents))
+            finally:
+                close_old_connections()
+    finally:
+        loop.close()
+    return processed
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+from alarm import dispatch
+
+
+class Command(BaseCommand):
+    """
+    Redis 알림 큐 워커 명령어
+    ALARM_DISPATCH_BACKEND가 redis일 때 웹 프로세스와 별도로 실행
+    """
+
+    help = "Redis 알림 큐에 쌓인 알림을 저장하고 WebSocket으로 전송합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--timeout",
+            type=int,
+            default=5,
+            help="큐가 비어 있을 때 대기할 시간(초)",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="큐가 빌 때까지만 처리하고 종료",
+        )
+
+    def handle(self, *args, **options):
+        processed = dispatch.run_redis_worker(
+            timeout=options["timeout"], stop_when_empty=options["once"]
+        )
+        self.stdout.write(self.style.SUCCESS(f"알림 {processed}건을 처리했습니다."))
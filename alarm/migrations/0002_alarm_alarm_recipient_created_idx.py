@@ -0,0 +1,22 @@
+# Generated by Django 5.1.2 on 2026-10-17 22:02
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("alarm", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="alarm",
+            index=models.Index(
+                fields=["recipient", "-created_at", "-id"],
+                name="alarm_recipient_created_idx",
+            ),
+        ),
+    ]
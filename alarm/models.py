@@ -26,6 +26,13 @@ class Alarm(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # 사용자별 알림 커서 페이지네이션 (created_at, id) 정렬용
+            models.Index(
+                fields=["recipient", "-created_at", "-id"],
+                name="alarm_recipient_created_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.get_alarm_type_display()} - {self.recipient.username}에게"
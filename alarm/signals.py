@@ -1,68 +1,59 @@
+from collections import Counter
 from django.db.models.signals import post_save
 from django.dispatch import receiver
-from asgiref.sync import async_to_sync
-from channels.layers import get_channel_layer
-from accounts.models import Follow
-from alarm.models import Alarm
-from chat.models import Message, WebSocketConnection
+from accounts.models import Follow, User
+from accounts.signals import follows_created
+from alarm import dispatch
+from chat import presence
+from chat.models import ChatRoom, Message
+from chat.signals import messages_bulk_created
 from insta.models import Comment, Like
 
 
-@receiver(post_save, sender=Alarm)
-def send_alarm_via_websocket(sender, instance, created, **kwargs):
-    if created:
-        channel_layer = get_channel_layer()
-        recipient_id = str(instance.recipient.id)
-
-        async_to_sync(channel_layer.group_send)(
-            f"user_{recipient_id}_alarms",
-            {"type": "send_alarm", "alarm": instance.message},
-        )
+def create_alarms_for_messages(messages):
+    """
+    메시지를 보낸 사람을 제외한 참여자 중 채팅방에 접속하지 않은 사용자에게 알림을 생성
+    참여자와 접속 상태는 채팅방별로 한 번씩만 조회
+    """
+    recipients_by_room = {}
+    for message in messages:
+        room_id = message.chat_room_id
+        if room_id not in recipients_by_room:
+            participant_ids = list(
+                ChatRoom.participants.through.objects.filter(
+                    chatroom_id=room_id
+                ).values_list("user_id", flat=True)
+            )
+            # 채팅방에 접속 중인 참여자는 알림을 생성하지 않음
+            online_user_ids = presence.online_user_ids(room_id, participant_ids)
+            recipients_by_room[room_id] = [
+                user_id for user_id in participant_ids if user_id not in online_user_ids
+            ]
+
+        for recipient_id in recipients_by_room[room_id]:
+            if recipient_id == message.sender_id:
+                continue
+            dispatch.enqueue(
+                recipient_id=recipient_id,
+                sender_id=message.sender_id,
+                alarm_type="message",
+                message=f"{message.sender.username}님이 새로운 메시지를 보냈습니다.",
+                related_object_id=message.id,
+            )
 
 
 @receiver(post_save, sender=Message)
 def create_alarm_for_new_message(sender, instance, created, **kwargs):
     if created:
-        # 메시지가 생성될 때 메시지를 보낸 사람을 제외한 모든 참여자에게 알림을 생성
-        chat_room = instance.chat_room
-        recipients = chat_room.participants.exclude(id=instance.sender.id)
-
-        for recipient in recipients:
-            # 사용자의 마지막 WebSocket 연결 종료 시간을 가져옴
-            last_connection = (
-                WebSocketConnection.objects.filter(user=recipient, chat_room=chat_room)
-                .order_by("-disconnected_at")
-                .first()
-            )
-
-            # WebSocket 연결 기록이 없으면 (None) 알림 생성
-            if not last_connection:
-                # 연결 기록이 없으므로 알림 생성
-                alarm = Alarm.objects.create(
-                    recipient=recipient,
-                    sender=instance.sender,
-                    alarm_type="message",
-                    message=f"{instance.sender.username}님이 새로운 메시지를 보냈습니다.",
-                    related_object_id=instance.id,
-                )
-                send_alarm_via_websocket(Alarm, alarm, created=True)
-                continue
+        create_alarms_for_messages([instance])
 
-            # 마지막 연결 종료 시간이 없는 경우(연결이 유지되고 있는 경우), 알림을 생성하지 않음
-            if last_connection.disconnected_at is None:
-                # 사용자가 여전히 연결 중이므로 알림을 생성하지 않음
-                continue
 
-            # 마지막 연결 종료 이후에 메시지가 생성된 경우, 알림을 생성함
-            if last_connection.disconnected_at < instance.sent_at:
-                alarm = Alarm.objects.create(
-                    recipient=recipient,
-                    sender=instance.sender,
-                    alarm_type="message",
-                    message=f"{instance.sender.username}님이 새로운 메시지를 보냈습니다.",
-                    related_object_id=instance.id,
-                )
-                send_alarm_via_websocket(Alarm, alarm, created=True)
+@receiver(messages_bulk_created, sender=Message)
+def create_alarm_for_bulk_messages(sender, messages, **kwargs):
+    """
+    WebSocket 쓰기 버퍼로 일괄 저장된 메시지의 알림 생성
+    """
+    create_alarms_for_messages(messages)
 
 
 @receiver(post_save, sender=Follow)
@@ -71,33 +62,55 @@ def create_alarm_for_new_follower(sender, instance, created, **kwargs):
     새로운 팔로우가 발생할 때 알림을 생성하는 신호
     """
     if created:
-        recipient = instance.following
-        sender = instance.follower
-
-        Alarm.objects.create(
-            recipient=recipient,
-            sender=sender,
+        dispatch.enqueue(
+            recipient_id=instance.following_id,
+            sender_id=instance.follower_id,
             alarm_type="follow",
-            message=f"{sender.username}님이 당신을 팔로우했습니다.",
+            message=f"{instance.follower.username}님이 당신을 팔로우했습니다.",
             related_object_id=None,  # 팔로우는 연결된 객체가 없으므로 None
         )
 
 
+@receiver(follows_created, sender=Follow)
+def create_alarms_for_bulk_follows(sender, follows, notify=True, **kwargs):
+    """
+    일괄 팔로우 시 팔로우된 사용자마다 알림을 하나로 묶어서 생성
+    가장 최근 팔로워를 발신자로 "X님 외 N명이 당신을 팔로우했습니다." 형식
+    """
+    if not notify:
+        return
+    counts = Counter(follow.following_id for follow in follows)
+    latest = {follow.following_id: follow.follower_id for follow in follows}
+    usernames = dict(
+        User.objects.filter(pk__in=set(latest.values())).values_list("pk", "username")
+    )
+    for recipient_id, sender_id in latest.items():
+        others = counts[recipient_id] - 1
+        if others:
+            message = f"{usernames[sender_id]}님 외 {others}명이 당신을 팔로우했습니다."
+        else:
+            message = f"{usernames[sender_id]}님이 당신을 팔로우했습니다."
+        dispatch.enqueue(
+            recipient_id=recipient_id,
+            sender_id=sender_id,
+            alarm_type="follow",
+            message=message,
+            related_object_id=None,
+        )
+
+
 @receiver(post_save, sender=Comment)
 def create_alarm_for_new_comment(sender, instance, created, **kwargs):
     """
     새로운 댓글이 달렸을 때 알림을 생성하는 신호
     """
     if created:
-        recipient = instance.post.user
-        sender = instance.user
-
-        Alarm.objects.create(
-            recipient=recipient,
-            sender=sender,
+        dispatch.enqueue(
+            recipient_id=instance.post.user_id,
+            sender_id=instance.user_id,
             alarm_type="comment",
-            message=f"{sender.username}님이 게시물에 댓글을 남겼습니다.",
-            related_object_id=instance.post.id,
+            message=f"{instance.user.username}님이 게시물에 댓글을 남겼습니다.",
+            related_object_id=instance.post_id,
         )
 
 
@@ -107,13 +120,10 @@ def create_alarm_for_new_like(sender, instance, created, **kwargs):
     좋아요가 눌렸을 때 알림을 생성하는 신호
     """
     if created:
-        recipient = instance.post.user
-        sender = instance.user
-
-        Alarm.objects.create(
-            recipient=recipient,
-            sender=sender,
+        dispatch.enqueue(
+            recipient_id=instance.post.user_id,
+            sender_id=instance.user_id,
             alarm_type="like",
-            message=f"{sender.username}님이 게시물을 좋아합니다.",
-            related_object_id=instance.post.id,
+            message=f"{instance.user.username}님이 게시물을 좋아합니다.",
+            related_object_id=instance.post_id,
         )
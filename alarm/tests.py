@@ -3,15 +3,18 @@ from django.urls import reverse, re_path
 from rest_framework.test import APITestCase, APIClient
 from rest_framework import status
 from django.contrib.auth import get_user_model
+from django.db import transaction
 from django.test import TransactionTestCase
 from asgiref.sync import sync_to_async
 from channels.auth import AuthMiddlewareStack
 from channels.routing import URLRouter
 from channels.testing import WebsocketCommunicator
+from alarm import dispatch
 from alarm.consumers import AlarmConsumer
 from accounts.models import Follow
 from alarm.models import Alarm
-from chat.models import ChatRoom, Message, WebSocketConnection
+from chat import presence
+from chat.models import ChatRoom, Message
 from insta.models import Post, Comment, Like
 
 User = get_user_model()
@@ -88,7 +91,8 @@ class AlarmTestCase(TransactionTestCase):
         # 좋아요 생성
         await sync_to_async(Like.objects.create)(post=self.post, user=self.user2)
 
-        # 알림 생성 확인
+        # 알림 발송 큐 처리 대기 후 알림 생성 확인
+        await sync_to_async(dispatch.join)()
         alarm = await sync_to_async(
             Alarm.objects.filter(recipient=self.user1, alarm_type="like").first
         )()
@@ -124,7 +128,8 @@ class AlarmTestCase(TransactionTestCase):
             post=self.post, user=self.user2, content="테스트용 댓글"
         )
 
-        # 알림 생성 확인
+        # 알림 발송 큐 처리 대기 후 알림 생성 확인
+        await sync_to_async(dispatch.join)()
         alarm = await sync_to_async(
             Alarm.objects.filter(recipient=self.user1, alarm_type="comment").first
         )()
@@ -160,7 +165,8 @@ class AlarmTestCase(TransactionTestCase):
             follower=self.user2, following=self.user1
         )
 
-        # 알림 생성 확인
+        # 알림 발송 큐 처리 대기 후 알림 생성 확인
+        await sync_to_async(dispatch.join)()
         alarm = await sync_to_async(
             Alarm.objects.filter(recipient=self.user1, alarm_type="follow").first
         )()
@@ -196,7 +202,8 @@ class AlarmTestCase(TransactionTestCase):
             chat_room=self.chat_room, sender=self.user2, content="Hello!"
         )
 
-        # 알림 생성 확인
+        # 알림 발송 큐 처리 대기 후 알림 생성 확인
+        await sync_to_async(dispatch.join)()
         alarm = await sync_to_async(
             Alarm.objects.filter(recipient=self.user1, alarm_type="message").first
         )()
@@ -223,15 +230,13 @@ class AlarmTestCase(TransactionTestCase):
 
     async def test_message_alarm_based_on_websocket_disconnect(self):
         """
-        WebSocket 연결 종료 시간을 기준으로 메시지 알림이 생성되는지 테스트
+        WebSocket 연결 종료 후 전송된 메시지에 대해 알림이 생성되는지 테스트
         """
         print(">>> WebSocket 연결 종료 시간에 따른 알림 생성 테스트 시작")
 
         # user1이 WebSocket 연결한 후 즉시 연결 종료
-        ws_connection = await sync_to_async(WebSocketConnection.objects.create)(
-            user=self.user1, chat_room=self.chat_room
-        )
-        await sync_to_async(ws_connection.mark_disconnected)()
+        await sync_to_async(presence.connect)(self.user1.id, self.chat_room.id)
+        await sync_to_async(presence.disconnect)(self.user1.id, self.chat_room.id)
 
         # user2가 메시지 전송
         await sync_to_async(Message.objects.create)(
@@ -239,6 +244,7 @@ class AlarmTestCase(TransactionTestCase):
         )
 
         # 연결 종료 시간 이후에 메시지가 전송되었기 때문에 알림이 생성되어야 함
+        await sync_to_async(dispatch.join)()
         alarm = await sync_to_async(
             Alarm.objects.filter(recipient=self.user1, alarm_type="message").first
         )()
@@ -270,18 +276,14 @@ class AlarmTestCase(TransactionTestCase):
         print(">>> WebSocket 연결 유지 시 알림 미생성 테스트 시작")
 
         # user1이 WebSocket 연결을 유지 중
-        await sync_to_async(WebSocketConnection.objects.create)(
-            user=self.user1, chat_room=self.chat_room, disconnected_at=None
-        )
+        await sync_to_async(presence.connect)(self.user1.id, self.chat_room.id)
 
-        # WebSocketConnection이 제대로 생성되었는지 확인
-        websocket_connection = await sync_to_async(
-            WebSocketConnection.objects.filter(
-                user=self.user1, chat_room=self.chat_room, disconnected_at=None
-            ).exists
-        )()
+        # 접속 상태가 제대로 등록되었는지 확인
+        is_online = await sync_to_async(presence.is_online)(
+            self.user1.id, self.chat_room.id
+        )
         self.assertTrue(
-            websocket_connection, "WebSocket 연결이 정상적으로 생성되지 않았습니다."
+            is_online, "WebSocket 접속 상태가 정상적으로 등록되지 않았습니다."
         )
 
         # user2가 메시지 전송
@@ -290,11 +292,35 @@ class AlarmTestCase(TransactionTestCase):
         )
 
         # user1이 여전히 WebSocket에 연결되어 있으므로 알림이 생성되지 않아야 함
+        await sync_to_async(dispatch.join)()
         alarm_exists = await sync_to_async(
             Alarm.objects.filter(recipient=self.user1, alarm_type="message").exists
         )()
         self.assertFalse(alarm_exists, "WebSocket 연결 중에도 알림이 생성되었습니다.")
 
+    def test_alarms_are_created_after_commit(self):
+        """
+        트랜잭션 안에서 발생한 알림은 commit 이후 한 번에 생성되고, 롤백 시 생성되지 않는지 테스트
+        """
+        other_post = Post.objects.create(content="두 번째 게시글", user=self.user1)
+
+        with transaction.atomic():
+            Like.objects.create(post=self.post, user=self.user2)
+            Comment.objects.create(post=other_post, user=self.user2, content="댓글")
+            self.assertEqual(Alarm.objects.count(), 0)
+        dispatch.join()
+        self.assertEqual(Alarm.objects.filter(recipient=self.user1).count(), 2)
+
+        with transaction.atomic():
+            Like.objects.create(post=other_post, user=self.user2)
+            transaction.set_rollback(True)
+        dispatch.join()
+        self.assertFalse(
+            Alarm.objects.filter(
+                alarm_type="like", related_object_id=other_post.id
+            ).exists()
+        )
+
     def test_delete_alarm(self):
         """
         알림 삭제 테스트: 알림이 성공적으로 삭제되는지 확인합니다.
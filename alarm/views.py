@@ -3,6 +3,7 @@ from rest_framework import generics, status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema, OpenApiResponse
+from config.pagination import CursorPagination
 from alarm.models import Alarm
 from alarm.serializers import AlarmSerializer
 
@@ -10,6 +11,7 @@ from alarm.serializers import AlarmSerializer
 class AlarmListView(generics.ListAPIView):
     serializer_class = AlarmSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = CursorPagination
 
     @extend_schema(
         summary="사용자의 알림 목록 조회",
@@ -26,7 +28,9 @@ class AlarmListView(generics.ListAPIView):
     def get_queryset(self):
         if getattr(self, "swagger_fake_view", False):
             return Alarm.objects.none()
-        return Alarm.objects.filter(recipient=self.request.user)
+        return Alarm.objects.filter(recipient=self.request.user).order_by(
+            "-created_at", "-id"
+        )
 
 
 class AlarmDeleteView(generics.DestroyAPIView):
@@ -1,6 +1,7 @@
 from django.contrib import admin
-from .models import ChatRoom, Message
+from .models import ChatRoom, ChatReadState, Message
 
 
 admin.site.register(ChatRoom)
 admin.site.register(Message)
+admin.site.register(ChatReadState)
@@ -0,0 +1,77 @@
+"""
+WebSocket 메시지 쓰기 버퍼
+Consumer가 받은 메시지를 프로세스(이벤트 루프) 단위로 모아서 bulk_create로 저장
+버퍼가 CHAT_WRITE_BUFFER_SIZE개 차거나 첫 메시지 후 CHAT_WRITE_BUFFER_DELAY_MS가 지나면 저장
+저장된 id와 sent_at은 각 메시지를 추가한 Consumer에게 그대로 돌려줌
+"""
+
+import asyncio
+from channels.db import database_sync_to_async
+from django.conf import settings
+from .models import Message
+from .signals import messages_bulk_created
+
+
+class MessageWriteBuffer:
+    def __init__(self, max_size=None, max_delay_ms=None):
+        self.max_size = max_size or settings.CHAT_WRITE_BUFFER_SIZE
+        self.max_delay = (max_delay_ms or settings.CHAT_WRITE_BUFFER_DELAY_MS) / 1000
+        self.pending = []
+        self.timer = None
+        self.tasks = set()
+
+    async def add(self, message):
+        """메시지를 버퍼에 추가하고, 저장이 끝나면 id와 sent_at이 채워진 메시지를 반환"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.pending.append((message, future))
+
+        if len(self.pending) >= self.max_size:
+            self.flush_soon()
+        elif self.timer is None:
+            self.timer = loop.call_later(self.max_delay, self.flush_soon)
+
+        return await future
+
+    def flush_soon(self):
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        batch, self.pending = self.pending, []
+        if batch:
+            task = asyncio.ensure_future(self.flush(batch))
+            self.tasks.add(task)
+            task.add_done_callback(self.tasks.discard)
+
+    async def flush(self, batch):
+        messages = [message for message, _ in batch]
+        try:
+            saved = await database_sync_to_async(self.save)(messages)
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for message, (_, future) in zip(saved, batch):
+            if not future.done():
+                future.set_result(message)
+
+    @staticmethod
+    def save(messages):
+        saved = Message.objects.bulk_create(messages)
+        messages_bulk_created.send(sender=Message, messages=saved)
+        return saved
+
+
+_buffers = {}
+
+
+def get_buffer():
+    """현재 이벤트 루프의 쓰기 버퍼 (Daphne 워커 프로세스당 하나)"""
+    loop = asyncio.get_running_loop()
+    if loop not in _buffers:
+        for closed in [key for key in _buffers if key.is_closed()]:
+            del _buffers[closed]
+        _buffers[loop] = MessageWriteBuffer()
+    return _buffers[loop]
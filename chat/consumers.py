@@ -1,7 +1,12 @@
+import asyncio
 import json
 from channels.generic.websocket import AsyncWebsocketConsumer
 from django.contrib.auth import get_user_model
 from channels.db import database_sync_to_async
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from . import presence, receipts
+from .buffer import get_buffer
 from .models import ChatRoom, Message, WebSocketConnection
 
 User = get_user_model()
@@ -25,71 +30,152 @@ class ChatConsumer(AsyncWebsocketConsumer):
             await self.channel_layer.group_add(self.room_group_name, self.channel_name)
             await self.accept()
 
-            # WebSocket 연결 정보를 저장
+            # 접속 상태 및 WebSocket 연결 정보를 저장
             await self.record_connection(self.scope["user"], self.room_id)
 
-            # 채팅방 내 읽지 않은 메시지를 읽음 처리
-            await self.mark_messages_as_read(self.room_id, self.scope["user"])
+            # 입장 시 최신 메시지까지 읽음 처리
+            latest_message_id = await self.mark_room_as_read(
+                self.scope["user"], self.room_id
+            )
+            if latest_message_id:
+                await self.send_read_receipt(latest_message_id)
         else:
             await self.close()
 
     async def disconnect(self, close_code):
         """
-        WebSocketConnection 모델을 사용해 연결 종료 시간 기록
+        접속 상태 해제 및 연결 종료 시간 기록
         """
         await self.channel_layer.group_discard(self.room_group_name, self.channel_name)
-        await self.mark_connection_as_disconnected(self.scope["user"], self.room_id)
+        # 대기 중인 읽음 처리는 연결 종료 전에 바로 저장
+        await self.flush_read_receipt()
+        if getattr(self, "connected", False):
+            await self.mark_connection_as_disconnected(self.scope["user"], self.room_id)
 
     async def receive(self, text_data):
         text_data_json = json.loads(text_data)
+
+        # 클라이언트 하트비트로 접속 상태 유지 (CHAT_PRESENCE_TTL보다 짧은 주기로 전송)
+        await sync_to_async(presence.heartbeat, thread_sensitive=False)(
+            self.scope["user"].id, self.room_id
+        )
+        if text_data_json.get("type") == "heartbeat":
+            return
+
         message = text_data_json.get("message")
         message_id = text_data_json.get("message_id")
 
-        if message:
+        if message and not message_id:
+            # WebSocket으로 받은 메시지는 쓰기 버퍼를 통해 저장 후 부여된 id, 시간과 함께 전송
+            saved = await self.save_message(message)
             await self.channel_layer.group_send(
                 self.room_group_name,
                 {
                     "type": "chat_message",
                     "message": message,
-                    "message_id": message_id,
+                    "message_id": saved.id,
+                    "sender_id": saved.sender_id,
+                    "sent_at": saved.sent_at.isoformat(),
+                    "client_message_id": text_data_json.get("client_message_id"),
                     "status": "received",
                 },
             )
+            return
 
-            await self.mark_messages_as_read(self.room_id, self.scope["user"])
-
-        if message_id:
-            await self.mark_message_as_read(message_id)
+        if message:
+            # HTTP(MessageCreateView)로 저장된 메시지 중계
             await self.channel_layer.group_send(
                 self.room_group_name,
-                {"type": "message_read", "message_id": message_id, "is_read": True},
+                {
+                    "type": "chat_message",
+                    "message": message,
+                    "message_id": message_id,
+                    "status": "received",
+                },
             )
+            return
+
+        if message_id:
+            # 읽음 처리는 모아서 CHAT_READ_RECEIPT_DELAY_MS마다 가장 최근 메시지만 저장
+            self.queue_read_receipt(message_id)
 
     async def chat_message(self, event):
         message = event.get("message", None)
         message_id = event.get("message_id", None)
+        data = {
+            "message": message,
+            "message_id": message_id,
+            "status": "received",
+        }
 
-        await self.send(
-            text_data=json.dumps(
-                {
-                    "message": message,
-                    "message_id": message_id,
-                    "status": "received",
-                }
-            )
-        )
+        # WebSocket으로 저장된 메시지는 발신자, 전송 시간, 클라이언트 임시 id를 함께 전달
+        for key in ("sender_id", "sent_at", "client_message_id"):
+            if key in event:
+                data[key] = event[key]
+
+        await self.send(text_data=json.dumps(data))
 
     async def message_read(self, event):
         """
         읽음 상태를 클라이언트에 전송
+        reader_id 사용자가 message_id 메시지까지(이전 메시지 포함) 읽었음을 의미
         """
         message_id = event["message_id"]
         is_read = event["is_read"]
 
         await self.send(
             text_data=json.dumps(
-                {"message_id": message_id, "is_read": is_read, "status": "read"}
+                {
+                    "message_id": message_id,
+                    "reader_id": event.get("reader_id"),
+                    "is_read": is_read,
+                    "status": "read",
+                }
+            )
+        )
+
+    def queue_read_receipt(self, message_id):
+        """
+        읽음 처리할 메시지 id를 보관하고, 첫 요청 후 일정 시간이 지나면 한 번만 저장
+        그 사이에 들어온 요청은 가장 최근 메시지로 합쳐짐
+        """
+        try:
+            message_id = int(message_id)
+        except (TypeError, ValueError):
+            return
+        self.pending_read_id = max(
+            getattr(self, "pending_read_id", None) or 0, message_id
+        )
+        if getattr(self, "read_receipt_task", None) is None:
+            self.read_receipt_task = asyncio.ensure_future(
+                self.flush_read_receipt_later()
             )
+
+    async def flush_read_receipt_later(self):
+        await asyncio.sleep(settings.CHAT_READ_RECEIPT_DELAY_MS / 1000)
+        self.read_receipt_task = None
+        await self.flush_read_receipt()
+
+    async def flush_read_receipt(self):
+        task = getattr(self, "read_receipt_task", None)
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+        self.read_receipt_task = None
+
+        message_id = getattr(self, "pending_read_id", None)
+        self.pending_read_id = None
+        if message_id and await self.mark_message_as_read(message_id):
+            await self.send_read_receipt(message_id)
+
+    async def send_read_receipt(self, message_id):
+        await self.channel_layer.group_send(
+            self.room_group_name,
+            {
+                "type": "message_read",
+                "message_id": message_id,
+                "reader_id": self.scope["user"].id,
+                "is_read": True,
+            },
         )
 
     @database_sync_to_async
@@ -103,48 +189,50 @@ class ChatConsumer(AsyncWebsocketConsumer):
         except ChatRoom.DoesNotExist:
             return False
 
+    async def save_message(self, content):
+        """
+        쓰기 버퍼에 메시지를 추가하고 저장될 때까지 대기
+        """
+        message = Message(
+            chat_room_id=self.room_id, sender=self.scope["user"], content=content
+        )
+        return await get_buffer().add(message)
+
     @database_sync_to_async
     def record_connection(self, user, room_id):
         """
-        WebSocket 연결 정보를 기록
+        접속 상태를 등록하고, 설정된 경우 WebSocket 연결 정보를 기록
         """
-        chat_room = ChatRoom.objects.get(id=room_id)
-        WebSocketConnection.objects.create(user=user, chat_room=chat_room)
+        presence.connect(user.id, room_id)
+        self.connected = True
+        if settings.CHAT_RECORD_CONNECTION_HISTORY:
+            WebSocketConnection.objects.create(user=user, chat_room_id=room_id)
 
     @database_sync_to_async
     def mark_connection_as_disconnected(self, user, room_id):
         """
-        WebSocket 연결 종료 시간을 기록
+        접속 상태를 해제하고, 설정된 경우 WebSocket 연결 종료 시간을 기록
         """
-        chat_room = ChatRoom.objects.get(id=room_id)
-        connection = (
-            WebSocketConnection.objects.filter(user=user, chat_room=chat_room)
-            .order_by("-connected_at")
-            .first()
-        )
-        if connection:
-            connection.mark_disconnected()
+        presence.disconnect(user.id, room_id)
+        if settings.CHAT_RECORD_CONNECTION_HISTORY:
+            connection = (
+                WebSocketConnection.objects.filter(user=user, chat_room_id=room_id)
+                .order_by("-connected_at")
+                .first()
+            )
+            if connection:
+                connection.mark_disconnected()
 
     @database_sync_to_async
-    def mark_messages_as_read(self, room_id, user):
+    def mark_room_as_read(self, user, room_id):
         """
-        사용자가 채팅방에 입장할 때, 읽지 않은 메시지를 모두 읽음 처리
+        사용자가 채팅방에 입장할 때, 읽음 워터마크를 최신 메시지로 이동
         """
-        chat_room = ChatRoom.objects.get(id=room_id)
-        Message.objects.filter(chat_room=chat_room, is_read=False).exclude(
-            sender=user
-        ).update(is_read=True)
+        return receipts.mark_room_read(user.id, room_id)
 
     @database_sync_to_async
     def mark_message_as_read(self, message_id):
         """
-        실시간 전송된 개별 메시지를 읽음 상태로 업데이트
+        읽음 워터마크를 실시간 전송된 메시지로 이동 (이미 더 최근 메시지까지 읽었으면 무시)
         """
-        try:
-            message = Message.objects.get(id=message_id)
-            if not message.is_read:
-                message.is_read = True
-                message.save()
-            return message
-        except Message.DoesNotExist:
-            return None
+        return receipts.mark_read(self.scope["user"].id, self.room_id, message_id)
@@ -0,0 +1,92 @@
+import asyncio
+import time
+from channels.routing import URLRouter
+from channels.testing import WebsocketCommunicator
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+from alarm import dispatch
+from chat.models import ChatRoom
+from chat.routing import websocket_urlpatterns
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    """
+    WebSocket 메시지 저장 처리량 측정 명령어
+    하나의 이벤트 루프(Daphne 워커 1개와 동일)에서 여러 클라이언트가 동시에 메시지를 보내고
+    저장 후 echo를 받을 때까지의 초당 메시지 수를 쓰기 버퍼 크기별로 비교
+    측정에 사용한 사용자, 채팅방, 메시지는 종료 시 삭제
+    """
+
+    help = "ChatConsumer의 초당 메시지 저장 처리량을 쓰기 버퍼 크기별로 측정합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--clients", type=int, default=20, help="동시 접속 수")
+        parser.add_argument(
+            "--messages", type=int, default=50, help="클라이언트당 전송 메시지 수"
+        )
+        parser.add_argument(
+            "--buffer-sizes",
+            type=int,
+            nargs="+",
+            default=[1, 100],
+            help="비교할 쓰기 버퍼 크기 (1은 메시지마다 INSERT)",
+        )
+
+    def handle(self, *args, **options):
+        peer = User.objects.create_user(
+            username="chat_benchmark_peer", email="chat_benchmark_peer@example.com"
+        )
+        users, rooms = [], []
+        try:
+            for i in range(options["clients"]):
+                user = User.objects.create_user(
+                    username=f"chat_benchmark_{i}",
+                    email=f"chat_benchmark_{i}@example.com",
+                )
+                room = ChatRoom.objects.create(room_key=f"chat_benchmark_{i}")
+                room.participants.set([user, peer])
+                users.append(user)
+                rooms.append(room)
+
+            self.stdout.write(
+                f"클라이언트 {len(users)}개 x 메시지 {options['messages']}개"
+            )
+            for size in options["buffer_sizes"]:
+                with override_settings(CHAT_WRITE_BUFFER_SIZE=size):
+                    elapsed = asyncio.run(
+                        self.run_load(users, rooms, options["messages"])
+                    )
+                total = len(users) * options["messages"]
+                self.stdout.write(
+                    f"버퍼 {size:>4}: {total / elapsed:>8.0f} msg/s ({elapsed:.2f}s)"
+                )
+        finally:
+            dispatch.join()
+            ChatRoom.objects.filter(id__in=[room.id for room in rooms]).delete()
+            User.objects.filter(id__in=[user.id for user in users] + [peer.id]).delete()
+
+    async def run_load(self, users, rooms, count):
+        application = URLRouter(websocket_urlpatterns)
+        communicators = []
+        for user, room in zip(users, rooms):
+            communicator = WebsocketCommunicator(application, f"/ws/chat/{room.id}/")
+            communicator.scope["user"] = user
+            await communicator.connect()
+            communicators.append(communicator)
+
+        async def send_and_wait(communicator):
+            for i in range(count):
+                await communicator.send_json_to({"message": f"benchmark {i}"})
+            for _ in range(count):
+                await communicator.receive_json_from(timeout=30)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(send_and_wait(c) for c in communicators))
+        elapsed = time.perf_counter() - start
+
+        for communicator in communicators:
+            await communicator.disconnect()
+        return elapsed
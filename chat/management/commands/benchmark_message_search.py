@@ -0,0 +1,145 @@
+import random
+import statistics
+import time
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, force_authenticate
+from chat.models import ChatRoom, Message
+from chat.views import MessageSearchView
+from config.pagination import CursorPagination
+
+User = get_user_model()
+
+# 검색 대상 문장 (나머지 메시지는 임의의 한글 단어로 채움)
+PHRASES = [
+    "한라봉 택배 도착했어요",
+    "감귤농장에서 직접 보내드려요",
+    "택배 언제 도착하나요",
+]
+
+
+class Command(BaseCommand):
+    """
+    채팅방 메시지 검색의 기존 방식(icontains 전체 조회)과 전문 검색 + trigram 인덱스 방식 비교
+    임시 메시지를 트랜잭션 안에서 생성하고 측정 후 롤백하므로 데이터가 남지 않음
+    기존 방식은 trigram 인덱스를 트랜잭션 안에서 삭제한 상태로 측정
+
+    한국어 trigram은 데이터베이스 LC_CTYPE이 UTF-8 로케일일 때만 생성되므로
+    C 로케일 데이터베이스에서는 단어 일부 검색에 trigram 인덱스가 사용되지 않음
+    """
+
+    help = (
+        "메시지 검색 조회 시간을 기존 icontains 방식과 전문 검색 방식으로 측정합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows", type=int, default=1_000_000, help="생성할 임시 메시지 수"
+        )
+        parser.add_argument(
+            "--queries",
+            nargs="+",
+            default=["한라봉", "귤농장", "택배 도착"],
+            help="측정할 검색어 (단어, 단어 일부, 여러 단어)",
+        )
+        parser.add_argument(
+            "--match-ratio",
+            type=float,
+            default=0.001,
+            help="검색 대상 문장을 포함하는 메시지 비율",
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=5, help="검색어별 반복 측정 횟수"
+        )
+
+    def handle(self, *args, **options):
+        rows = options["rows"]
+        rng = random.Random(0)
+        with transaction.atomic():
+            user = User.objects.create_user(
+                username="search_benchmark", email="search_benchmark@example.com"
+            )
+            peer = User.objects.create_user(
+                username="search_benchmark_peer",
+                email="search_benchmark_peer@example.com",
+            )
+            room = ChatRoom.objects.create(room_key="search_benchmark")
+            room.participants.set([user, peer])
+
+            Message.objects.bulk_create(
+                (
+                    Message(
+                        chat_room=room,
+                        sender=user if i % 2 else peer,
+                        content=self.make_content(rng, options["match_ratio"]),
+                    )
+                    for i in range(rows)
+                ),
+                batch_size=5000,
+            )
+            with connection.cursor() as cursor:
+                cursor.execute(f"ANALYZE {Message._meta.db_table}")
+
+            self.stdout.write(f"메시지 {rows}개")
+            self.stdout.write(
+                f"{'검색어':<12}{'방식':<10}{'결과 수':>10}{'중앙값(ms)':>14}"
+            )
+            results = {}
+            for query in options["queries"]:
+                results[query] = self.measure_search(user, room, query, options)
+
+            # 기존 방식은 trigram 인덱스 없이 측정 (롤백 시 복구됨)
+            with connection.cursor() as cursor:
+                cursor.execute("DROP INDEX chat_message_content_trgm_idx")
+            for query in options["queries"]:
+                self.measure_icontains(room, query, options)
+                self.report(query, "search", *results[query])
+
+            transaction.set_rollback(True)
+
+    def make_content(self, rng, match_ratio):
+        words = [
+            "".join(
+                chr(0xAC00 + rng.randrange(11172)) for _ in range(rng.randint(2, 4))
+            )
+            for _ in range(rng.randint(2, 6))
+        ]
+        if rng.random() < match_ratio:
+            words.append(rng.choice(PHRASES))
+        return " ".join(words)
+
+    def measure_icontains(self, room, query, options):
+        """기존 MessageSearchView: exists() 후 일치하는 메시지 전체 조회"""
+        timings = []
+        for _ in range(options["repeat"]):
+            start = time.perf_counter()
+            queryset = Message.objects.filter(chat_room=room, content__icontains=query)
+            messages = list(queryset) if queryset.exists() else []
+            timings.append((time.perf_counter() - start) * 1000)
+        self.report(query, "icontains", len(messages), statistics.median(timings))
+
+    def measure_search(self, user, room, query, options):
+        """현재 MessageSearchView: 관련도순 첫 페이지 조회"""
+        request = APIRequestFactory().get(
+            "/", {"q": query}, HTTP_HOST=settings.ALLOWED_HOSTS[0]
+        )
+        force_authenticate(request, user=user)
+        view = MessageSearchView()
+        view.request = Request(request)
+        view.request.user = user
+        view.kwargs = {"room_id": room.id}
+
+        timings = []
+        for _ in range(options["repeat"]):
+            start = time.perf_counter()
+            page = CursorPagination().paginate_queryset(
+                view.get_queryset(), view.request
+            )
+            timings.append((time.perf_counter() - start) * 1000)
+        return len(page), statistics.median(timings)
+
+    def report(self, query, label, count, elapsed):
+        self.stdout.write(f"{query:<12}{label:<10}{count:>10}{elapsed:>14.2f}")
@@ -0,0 +1,32 @@
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from chat.models import WebSocketConnection
+
+
+class Command(BaseCommand):
+    """
+    WebSocket 연결 기록 정리 명령어
+    접속 여부는 chat.presence에서 관리하므로 연결 기록은 이력 용도로만 보관
+    """
+
+    help = "종료된 지 오래된 WebSocket 연결 기록을 배치 단위로 삭제합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=30, help="보관할 기간(일)")
+        parser.add_argument(
+            "--batch-size", type=int, default=5000, help="한 번에 삭제할 행 수"
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options["days"])
+        expired = WebSocketConnection.objects.filter(disconnected_at__lt=cutoff)
+
+        deleted = 0
+        while True:
+            ids = list(expired.values_list("id", flat=True)[: options["batch_size"]])
+            if not ids:
+                break
+            deleted += WebSocketConnection.objects.filter(id__in=ids).delete()[0]
+
+        self.stdout.write(self.style.SUCCESS(f"연결 기록 {deleted}건을 삭제했습니다."))
@@ -0,0 +1,22 @@
+# Generated by Django 5.1.2 on 2026-10-17 22:02
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chat", "0004_alter_message_image"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="message",
+            index=models.Index(
+                fields=["chat_room", "-sent_at", "-id"],
+                name="chat_message_room_sent_idx",
+            ),
+        ),
+    ]
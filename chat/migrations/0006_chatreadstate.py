@@ -0,0 +1,103 @@
+# Generated by Django 5.1.2 on 2026-10-17 22:26
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def fill_read_states(apps, schema_editor):
+    """
+    기존 메시지 읽음 상태로 워터마크 초기화
+    참여자별로 다른 참여자가 보낸 메시지 중 읽음 처리된 가장 최근 메시지를 워터마크로 사용
+    """
+    ChatRoom = apps.get_model("chat", "ChatRoom")
+    Message = apps.get_model("chat", "Message")
+    ChatReadState = apps.get_model("chat", "ChatReadState")
+
+    states = []
+    for room in ChatRoom.objects.prefetch_related("participants"):
+        for user in room.participants.all():
+            latest = (
+                Message.objects.filter(chat_room=room, is_read=True)
+                .exclude(sender=user)
+                .order_by("-sent_at", "-id")
+                .first()
+            )
+            if latest:
+                states.append(
+                    ChatReadState(
+                        user=user,
+                        chat_room=room,
+                        last_read_message=latest,
+                        last_read_at=latest.sent_at,
+                    )
+                )
+    ChatReadState.objects.bulk_create(states, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chat", "0005_message_chat_message_room_sent_idx"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ChatReadState",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("last_read_at", models.DateTimeField(blank=True, null=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "chat_room",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="read_states",
+                        to="chat.chatroom",
+                    ),
+                ),
+                (
+                    "last_read_message",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="chat.message",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="chat_read_states",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Chat Read State",
+                "verbose_name_plural": "Chat Read States",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("chat_room", "user"),
+                        name="chat_readstate_room_user_uniq",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(fill_read_states, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name="message",
+            name="is_read",
+        ),
+    ]
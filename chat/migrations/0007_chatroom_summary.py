@@ -0,0 +1,57 @@
+# Generated by Django 5.1.2 on 2026-10-17 22:29
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+def fill_room_summaries(apps, schema_editor):
+    """채팅방의 최신 메시지로 요약 초기화, 메시지가 없으면 생성 시간 사용"""
+    ChatRoom = apps.get_model("chat", "ChatRoom")
+    Message = apps.get_model("chat", "Message")
+    rooms = []
+    for room in ChatRoom.objects.all():
+        latest = (
+            Message.objects.filter(chat_room=room).order_by("-sent_at", "-id").first()
+        )
+        room.last_message = latest
+        room.last_activity_at = latest.sent_at if latest else room.created_at
+        rooms.append(room)
+    ChatRoom.objects.bulk_update(
+        rooms, ["last_message", "last_activity_at"], batch_size=1000
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chat", "0006_chatreadstate"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="chatroom",
+            name="last_activity_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AddField(
+            model_name="chatroom",
+            name="last_message",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="chat.message",
+            ),
+        ),
+        migrations.RunPython(fill_room_summaries, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="chatroom",
+            index=models.Index(
+                fields=["-last_activity_at", "-id"], name="chat_room_activity_idx"
+            ),
+        ),
+    ]
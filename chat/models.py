@@ -1,5 +1,8 @@
 import uuid
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
+from django.db.models.functions import Upper
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 
@@ -12,10 +15,21 @@ class ChatRoom(models.Model):
     participants = models.ManyToManyField(User, related_name="chat_rooms")
     room_key = models.CharField(max_length=255, unique=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    # 채팅방 목록 미리보기용 요약 (메시지 저장 시 signal로 갱신)
+    last_message = models.ForeignKey(
+        "Message", on_delete=models.SET_NULL, null=True, blank=True, related_name="+"
+    )
+    last_activity_at = models.DateTimeField(default=timezone.now)
 
     class Meta:
         verbose_name = "Chat Room"
         verbose_name_plural = "Chat Rooms"
+        indexes = [
+            # 채팅방 목록 최근 활동순 커서 페이지네이션 (last_activity_at, id) 정렬용
+            models.Index(
+                fields=["-last_activity_at", "-id"], name="chat_room_activity_idx"
+            ),
+        ]
 
     def save(self, *args, **kwargs):
         """
@@ -45,16 +59,75 @@ class Message(models.Model):
     content = models.TextField(blank=True, null=True)
     image = models.ImageField(upload_to="chat_images/", blank=True, null=True)
     sent_at = models.DateTimeField(auto_now_add=True)
-    is_read = models.BooleanField(default=False)
+    # 메시지 검색용 tsvector (저장 시 DB에서 자동 계산)
+    # 한국어 형태소 분석기가 없으므로 공백 단위로 나누는 simple 설정 사용
+    search_vector = models.GeneratedField(
+        expression=SearchVector("content", config="simple"),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
 
     class Meta:
         verbose_name = "Message"
         verbose_name_plural = "Messages"
+        indexes = [
+            # 채팅방별 메시지 커서 페이지네이션 (sent_at, id) 정렬용
+            models.Index(
+                fields=["chat_room", "-sent_at", "-id"],
+                name="chat_message_room_sent_idx",
+            ),
+            # 단어 단위 전문 검색용
+            GinIndex(fields=["search_vector"], name="chat_message_search_idx"),
+            # 단어 일부(한국어 조사가 붙은 단어 등) 검색용 trigram 인덱스
+            # content__icontains가 생성하는 UPPER(content) LIKE 조건에 사용됨
+            GinIndex(
+                OpClass(Upper("content"), name="gin_trgm_ops"),
+                name="chat_message_content_trgm_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.sender.username}님의 메시지"
 
 
+class ChatReadState(models.Model):
+    """
+    채팅방별 사용자의 마지막으로 읽은 메시지 (읽음 워터마크)
+    (sent_at, id) 순서로 이 메시지까지 읽은 것으로 간주하고, 안 읽은 메시지 수는 워터마크 이후 메시지로 계산
+    """
+
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="chat_read_states"
+    )
+    chat_room = models.ForeignKey(
+        ChatRoom, on_delete=models.CASCADE, related_name="read_states"
+    )
+    last_read_message = models.ForeignKey(
+        Message, on_delete=models.SET_NULL, null=True, blank=True, related_name="+"
+    )
+    last_read_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Chat Read State"
+        verbose_name_plural = "Chat Read States"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["chat_room", "user"], name="chat_readstate_room_user_uniq"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user.username} in {self.chat_room} - read at {self.last_read_at}"
+
+    @property
+    def watermark(self):
+        """메시지 정렬 순서와 같은 (sent_at, id) 튜플"""
+        if self.last_read_at is None:
+            return None
+        return (self.last_read_at, self.last_read_message_id or 0)
+
+
 class WebSocketConnection(models.Model):
     """
     WebSocket 연결 정보를 저장
@@ -0,0 +1,56 @@
+"""
+채팅방 접속 상태(presence) 관리
+(사용자, 채팅방)별 접속 중인 WebSocket 수를 캐시에 TTL과 함께 저장
+클라이언트 하트비트마다 TTL을 갱신하고, 비정상 종료로 disconnect가 호출되지 않아도 TTL 후 만료됨
+DB 조회 없이 키 조회 한 번으로 접속 여부 확인
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+def _key(user_id, room_id):
+    return f"chat:presence:{room_id}:{user_id}"
+
+
+def connect(user_id, room_id):
+    """WebSocket 연결 시 접속 수 증가 (여러 기기/탭 접속 고려)"""
+    key = _key(user_id, room_id)
+    cache.add(key, 0, settings.CHAT_PRESENCE_TTL)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # add와 incr 사이에 만료된 경우
+        cache.set(key, 1, settings.CHAT_PRESENCE_TTL)
+    cache.touch(key, settings.CHAT_PRESENCE_TTL)
+
+
+def disconnect(user_id, room_id):
+    """WebSocket 연결 종료 시 접속 수 감소, 남은 연결이 없으면 삭제"""
+    key = _key(user_id, room_id)
+    try:
+        remaining = cache.decr(key)
+    except ValueError:
+        return
+    if remaining <= 0:
+        cache.delete(key)
+
+
+def heartbeat(user_id, room_id):
+    """
+    접속 상태 TTL 갱신
+    하트비트가 늦어서 키가 이미 만료되었으면 접속 수 1로 다시 저장 (연결이 열려 있으므로 접속 중)
+    """
+    key = _key(user_id, room_id)
+    if not cache.touch(key, settings.CHAT_PRESENCE_TTL):
+        cache.add(key, 1, settings.CHAT_PRESENCE_TTL)
+
+
+def is_online(user_id, room_id):
+    return bool(cache.get(_key(user_id, room_id)))
+
+
+def online_user_ids(room_id, user_ids):
+    """주어진 사용자 중 채팅방에 접속 중인 사용자 id 집합 (캐시 조회 1회)"""
+    keys = {_key(user_id, room_id): user_id for user_id in user_ids}
+    return {keys[key] for key, count in cache.get_many(keys).items() if count}
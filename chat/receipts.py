@@ -0,0 +1,148 @@
+"""
+채팅방 읽음 상태 관리
+메시지마다 is_read를 바꾸는 대신 (사용자, 채팅방)별 마지막으로 읽은 메시지(워터마크)만 저장
+워터마크는 앞으로만 이동하며, 안 읽은 메시지 수와 메시지별 읽음 여부는 워터마크와 비교해서 계산
+"""
+
+from datetime import datetime, timezone as dt_timezone
+from django.db.models import (
+    BigIntegerField,
+    Count,
+    DateTimeField,
+    OuterRef,
+    Q,
+    Subquery,
+    Value,
+)
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from .models import ChatReadState, Message
+
+# 워터마크가 없는 사용자는 모든 메시지를 안 읽은 것으로 계산
+_NEVER = datetime.min.replace(tzinfo=dt_timezone.utc)
+
+
+def _after(watermark):
+    """(sent_at, id) 순서로 워터마크 이후의 메시지 조건"""
+    sent_at, message_id = watermark
+    return Q(sent_at__gt=sent_at) | Q(sent_at=sent_at, id__gt=message_id)
+
+
+def advance(user_id, room_id, message_id, sent_at):
+    """
+    워터마크를 주어진 메시지로 이동
+    이미 같거나 더 최근 메시지까지 읽은 경우 변경하지 않으며, 이동했으면 True 반환
+    """
+    newer = (
+        Q(last_read_at__isnull=True)
+        | Q(last_read_at__lt=sent_at)
+        | Q(last_read_at=sent_at, last_read_message_id__lt=message_id)
+    )
+    updated = (
+        ChatReadState.objects.filter(user_id=user_id, chat_room_id=room_id)
+        .filter(newer)
+        .update(
+            last_read_message_id=message_id,
+            last_read_at=sent_at,
+            updated_at=timezone.now(),
+        )
+    )
+    if updated:
+        return True
+
+    _, created = ChatReadState.objects.get_or_create(
+        user_id=user_id,
+        chat_room_id=room_id,
+        defaults={"last_read_message_id": message_id, "last_read_at": sent_at},
+    )
+    return created
+
+
+def mark_read(user_id, room_id, message_id):
+    """
+    채팅방의 메시지까지 읽음 처리
+    다른 채팅방의 메시지이거나 존재하지 않으면 False 반환
+    """
+    message = (
+        Message.objects.filter(id=message_id, chat_room_id=room_id)
+        .values("id", "sent_at")
+        .first()
+    )
+    if message is None:
+        return False
+    return advance(user_id, room_id, message["id"], message["sent_at"])
+
+
+def mark_room_read(user_id, room_id):
+    """채팅방의 최신 메시지까지 읽음 처리하고, 최신 메시지 id 반환 (메시지가 없으면 None)"""
+    latest = (
+        Message.objects.filter(chat_room_id=room_id)
+        .order_by("-sent_at", "-id")
+        .values("id", "sent_at")
+        .first()
+    )
+    if latest is None:
+        return None
+    advance(user_id, room_id, latest["id"], latest["sent_at"])
+    return latest["id"]
+
+
+def watermarks(room_id):
+    """채팅방 참여자별 워터마크 {user_id: (sent_at, id)} (쿼리 1회)"""
+    return {
+        state.user_id: state.watermark
+        for state in ChatReadState.objects.filter(
+            chat_room_id=room_id, last_read_at__isnull=False
+        )
+    }
+
+
+def is_read(message, room_watermarks):
+    """보낸 사람을 제외한 참여자 중 한 명이라도 메시지까지 읽었으면 읽음"""
+    key = (message.sent_at, message.id)
+    return any(
+        watermark >= key
+        for user_id, watermark in room_watermarks.items()
+        if user_id != message.sender_id
+    )
+
+
+def unread_count(user_id, room_id):
+    """워터마크 이후 다른 참여자가 보낸 메시지 수"""
+    state = ChatReadState.objects.filter(user_id=user_id, chat_room_id=room_id).first()
+    queryset = Message.objects.filter(chat_room_id=room_id).exclude(sender_id=user_id)
+    if state is not None and state.watermark is not None:
+        queryset = queryset.filter(_after(state.watermark))
+    return queryset.count()
+
+
+def annotate_unread_counts(queryset, user_id):
+    """
+    채팅방 queryset에 사용자의 안 읽은 메시지 수(unread_count) 추가
+    채팅방별 워터마크와 워터마크 이후 메시지 수를 상관 서브쿼리로 계산하므로
+    채팅방 수와 관계없이 쿼리 1회로 조회
+    """
+    state = ChatReadState.objects.filter(chat_room=OuterRef("pk"), user_id=user_id)
+    queryset = queryset.annotate(
+        read_at=Coalesce(
+            Subquery(state.values("last_read_at")[:1]),
+            Value(_NEVER, output_field=DateTimeField()),
+        ),
+        read_message_id=Coalesce(
+            Subquery(state.values("last_read_message_id")[:1]),
+            0,
+            output_field=BigIntegerField(),
+        ),
+    )
+    unread = (
+        Message.objects.filter(chat_room=OuterRef("pk"))
+        .exclude(sender_id=user_id)
+        .filter(
+            Q(sent_at__gt=OuterRef("read_at"))
+            | Q(sent_at=OuterRef("read_at"), id__gt=OuterRef("read_message_id"))
+        )
+        .values("chat_room")
+        .annotate(count=Count("*"))
+        .values("count")
+    )
+    return queryset.annotate(unread_count=Coalesce(Subquery(unread), 0))
@@ -1,5 +1,8 @@
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
+from drf_spectacular.utils import extend_schema_field
+from drf_spectacular.types import OpenApiTypes
+from . import receipts
 from .models import ChatRoom, Message
 
 User = get_user_model()
@@ -54,6 +57,42 @@ class ChatRoomSerializer(serializers.ModelSerializer):
         return chat_room
 
 
+class LastMessageSerializer(serializers.ModelSerializer):
+    """
+    채팅방 목록 미리보기용 마지막 메시지
+    """
+
+    sender = UserSerializer(read_only=True)
+    sent_at = serializers.DateTimeField(format="%Y-%m-%dT%H:%M:%S.%fZ", read_only=True)
+
+    class Meta:
+        model = Message
+        fields = ["id", "sender", "content", "image", "sent_at"]
+        read_only_fields = fields
+
+
+class ChatRoomListSerializer(ChatRoomSerializer):
+    """
+    채팅방 목록용 serializer
+    마지막 메시지, 마지막 활동 시간, 안 읽은 메시지 수를 함께 반환하므로 채팅방마다 메시지 목록을 조회할 필요가 없음
+    unread_count는 view에서 receipts.annotate_unread_counts로 계산한 값을 사용
+    """
+
+    participants = serializers.SlugRelatedField(
+        many=True, slug_field="username", read_only=True
+    )
+    last_message = LastMessageSerializer(read_only=True)
+    unread_count = serializers.IntegerField(read_only=True)
+
+    class Meta(ChatRoomSerializer.Meta):
+        fields = ChatRoomSerializer.Meta.fields + [
+            "last_message",
+            "last_activity_at",
+            "unread_count",
+        ]
+        read_only_fields = fields
+
+
 class MessageSerializer(serializers.ModelSerializer):
     """
     텍스트 또는 이미지로 메시지 전송 가능
@@ -64,6 +103,7 @@ class MessageSerializer(serializers.ModelSerializer):
         max_length=None, allow_empty_file=True, use_url=True, required=False
     )
     sent_at = serializers.DateTimeField(format="%Y-%m-%dT%H:%M:%S.%fZ", read_only=True)
+    is_read = serializers.SerializerMethodField()
 
     class Meta:
         model = Message
@@ -92,3 +132,11 @@ class MessageSerializer(serializers.ModelSerializer):
                 "이미지의 크기는 5MB를 넘지 않아야 합니다."
             )
         return value
+
+    @extend_schema_field(OpenApiTypes.BOOL)
+    def get_is_read(self, obj):
+        """
+        상대방의 읽음 워터마크와 비교해서 계산
+        view에서 채팅방의 워터마크를 read_watermarks context로 한 번만 조회해서 전달
+        """
+        return receipts.is_read(obj, self.context.get("read_watermarks", {}))
@@ -0,0 +1,41 @@
+from django.db.models import Q
+from django.db.models.signals import post_save
+from django.dispatch import Signal, receiver
+from .models import ChatRoom, Message
+
+# 메시지 쓰기 버퍼가 bulk_create로 저장한 메시지 목록 (bulk_create는 post_save를 보내지 않음)
+# receiver 인자: messages
+messages_bulk_created = Signal()
+
+
+def update_room_summaries(messages):
+    """
+    채팅방별 가장 최근 메시지로 마지막 메시지와 마지막 활동 시간 갱신
+    저장 순서가 뒤바뀌어도 더 최근 메시지로만 갱신되도록 조건부 UPDATE
+    """
+    latest = {}
+    for message in messages:
+        current = latest.get(message.chat_room_id)
+        if current is None or (message.sent_at, message.id) > (
+            current.sent_at,
+            current.id,
+        ):
+            latest[message.chat_room_id] = message
+
+    for room_id, message in latest.items():
+        ChatRoom.objects.filter(id=room_id).filter(
+            Q(last_message__isnull=True)
+            | Q(last_activity_at__lt=message.sent_at)
+            | Q(last_activity_at=message.sent_at, last_message_id__lt=message.id)
+        ).update(last_message=message, last_activity_at=message.sent_at)
+
+
+@receiver(post_save, sender=Message)
+def update_room_summary_for_new_message(sender, instance, created, **kwargs):
+    if created:
+        update_room_summaries([instance])
+
+
+@receiver(messages_bulk_created, sender=Message)
+def update_room_summary_for_bulk_messages(sender, messages, **kwargs):
+    update_room_summaries(messages)
@@ -1,3 +1,4 @@
+import asyncio
 import json, uuid
 from channels.testing import WebsocketCommunicator
 from django.urls import reverse, re_path
@@ -8,7 +9,14 @@ from django.test import Client, TransactionTestCase
 from channels.routing import URLRouter
 from asgiref.sync import async_to_sync, sync_to_async
 from channels.auth import AuthMiddlewareStack
-from .models import ChatRoom, Message
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from . import presence, receipts
+from .buffer import MessageWriteBuffer
+from .routing import websocket_urlpatterns
+from .models import ChatRoom, ChatReadState, Message
 from .consumers import ChatConsumer
 from channels.generic.websocket import AsyncWebsocketConsumer
 
@@ -29,10 +37,12 @@ class MockChatConsumer(AsyncWebsocketConsumer):
         message = data.get("message")
         message_id = data.get("message_id")
 
-        # 메시지의 is_read 상태를 업데이트
+        # 읽음 워터마크를 메시지로 이동
         if message_id:
-            await sync_to_async(Message.objects.filter(id=message_id).update)(
-                is_read=True
+            await sync_to_async(receipts.mark_read)(
+                self.scope["user"].id,
+                self.scope["url_route"]["kwargs"]["room_id"],
+                message_id,
             )
 
         # 메시지 전송
@@ -146,9 +156,8 @@ class ChatRoomTestCase(APITestCase):
         """
         chatroom = ChatRoom.objects.create()
         chatroom.participants.set([self.user1, self.user2])
-        message = Message.objects.create(
-            chat_room=chatroom, sender=self.user1, content="Hello!"
-        )
+        Message.objects.create(chat_room=chatroom, sender=self.user1, content="Hello!")
+        self.assertEqual(receipts.unread_count(self.user2.id, chatroom.id), 1)
 
         # user2로 로그인하고 채팅방 입장
         self.client.login(email="newuser2@example.com", password="newpassword123")
@@ -158,8 +167,153 @@ class ChatRoomTestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
         # 메시지가 읽음 처리되었는지 확인
-        message.refresh_from_db()
-        self.assertTrue(message.is_read)
+        self.assertEqual(receipts.unread_count(self.user2.id, chatroom.id), 0)
+        self.client.login(email="newuser1@example.com", password="newpassword123")
+        url = reverse("chat:message_list", kwargs={"room_id": chatroom.id})
+        response = self.client.get(url)
+        self.assertTrue(response.data["results"][0]["is_read"])
+
+    def test_presence_counts_connections(self):
+        """
+        접속 상태 테스트: 모든 연결이 종료되어야 오프라인으로 처리되는지 검증
+        """
+        chatroom = ChatRoom.objects.create()
+
+        presence.connect(self.user2.id, chatroom.id)
+        presence.connect(self.user2.id, chatroom.id)
+        presence.disconnect(self.user2.id, chatroom.id)
+        self.assertTrue(presence.is_online(self.user2.id, chatroom.id))
+        self.assertEqual(
+            presence.online_user_ids(chatroom.id, [self.user2.id, self.user3.id]),
+            {self.user2.id},
+        )
+
+        presence.disconnect(self.user2.id, chatroom.id)
+        self.assertFalse(presence.is_online(self.user2.id, chatroom.id))
+
+    def test_presence_heartbeat_after_expiry(self):
+        """
+        접속 상태 테스트: TTL이 지나 만료된 후에도 하트비트를 받으면 다시 접속 중으로 처리되는지 검증
+        """
+        chatroom = ChatRoom.objects.create()
+
+        presence.connect(self.user2.id, chatroom.id)
+        # TTL 만료
+        cache.delete(presence._key(self.user2.id, chatroom.id))
+        self.assertFalse(presence.is_online(self.user2.id, chatroom.id))
+
+        presence.heartbeat(self.user2.id, chatroom.id)
+        self.assertTrue(presence.is_online(self.user2.id, chatroom.id))
+        presence.disconnect(self.user2.id, chatroom.id)
+        self.assertFalse(presence.is_online(self.user2.id, chatroom.id))
+
+    def test_unread_count_follows_watermark(self):
+        """
+        읽음 워터마크 테스트: 워터마크는 앞으로만 이동하고, 안 읽은 메시지 수와 읽음 여부가 워터마크 기준으로 계산되는지 검증
+        """
+        chatroom = ChatRoom.objects.create()
+        chatroom.participants.set([self.user1, self.user2])
+        messages = [
+            Message.objects.create(
+                chat_room=chatroom, sender=self.user2, content=f"메시지 {i}"
+            )
+            for i in range(3)
+        ]
+        Message.objects.create(chat_room=chatroom, sender=self.user1, content="답장")
+        self.assertEqual(receipts.unread_count(self.user1.id, chatroom.id), 3)
+
+        self.assertTrue(receipts.mark_read(self.user1.id, chatroom.id, messages[1].id))
+        self.assertEqual(receipts.unread_count(self.user1.id, chatroom.id), 1)
+
+        # 이전 메시지로는 되돌아가지 않음
+        self.assertFalse(receipts.mark_read(self.user1.id, chatroom.id, messages[0].id))
+        self.assertEqual(receipts.unread_count(self.user1.id, chatroom.id), 1)
+        self.assertEqual(ChatReadState.objects.filter(chat_room=chatroom).count(), 1)
+
+        # user2가 보낸 메시지는 user1의 워터마크까지만 읽음으로 표시
+        url = reverse("chat:message_list", kwargs={"room_id": chatroom.id})
+        response = self.client.get(url)
+        self.assertEqual(
+            [item["is_read"] for item in response.data["results"]],
+            [False, False, True, True],
+        )
+
+    def test_chatroom_list_summaries(self):
+        """
+        채팅방 목록 테스트: 마지막 메시지와 안 읽은 메시지 수가 포함되고, 최근 활동순으로 정렬되며,
+        채팅방 수와 관계없이 같은 수의 쿼리로 조회되는지 검증
+        """
+        rooms = []
+        for other in (self.user2, self.user3):
+            room = ChatRoom.objects.create(room_key=f"summary_{other.id}")
+            room.participants.set([self.user1, other])
+            rooms.append(room)
+        older, newer = rooms
+
+        Message.objects.create(chat_room=newer, sender=self.user3, content="첫 메시지")
+        Message.objects.create(chat_room=older, sender=self.user2, content="안녕")
+        latest = Message.objects.create(
+            chat_room=older, sender=self.user2, content="안 읽은 메시지"
+        )
+
+        url = reverse("chat:room_list")
+        with CaptureQueriesContext(connection) as two_rooms:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        results = response.data["results"]
+        self.assertEqual(
+            [item["id"] for item in results], [str(older.id), str(newer.id)]
+        )
+        self.assertEqual(results[0]["last_message"]["id"], latest.id)
+        self.assertEqual(results[0]["last_message"]["content"], "안 읽은 메시지")
+        self.assertEqual([item["unread_count"] for item in results], [2, 1])
+
+        receipts.mark_read(self.user1.id, older.id, latest.id)
+        response = self.client.get(url)
+        self.assertEqual(
+            [item["unread_count"] for item in response.data["results"]], [0, 1]
+        )
+
+        for i in range(3):
+            other = User.objects.create_user(
+                email=f"summary{i}@example.com", username=f"summary{i}"
+            )
+            room = ChatRoom.objects.create(room_key=f"summary_extra_{i}")
+            room.participants.set([self.user1, other])
+            Message.objects.create(chat_room=room, sender=other, content="메시지")
+        with CaptureQueriesContext(connection) as five_rooms:
+            response = self.client.get(url)
+        self.assertEqual(len(response.data["results"]), 5)
+        self.assertEqual(len(five_rooms), len(two_rooms))
+
+    def test_message_list_cursor_pagination(self):
+        """
+        메시지 목록 커서 페이지네이션 테스트: 최신 메시지부터 페이지 단위로 반환되는지 검증
+        """
+        chatroom = ChatRoom.objects.create()
+        chatroom.participants.set([self.user1, self.user2])
+        messages = [
+            Message.objects.create(
+                chat_room=chatroom, sender=self.user2, content=f"메시지 {i}"
+            )
+            for i in range(15)
+        ]
+
+        url = reverse("chat:message_list", kwargs={"room_id": chatroom.id})
+        response = self.client.get(url, {"page_size": 10})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [item["id"] for item in response.data["results"]],
+            [message.id for message in reversed(messages[5:])],
+        )
+
+        response = self.client.get(response.data["next"])
+        self.assertEqual(
+            [item["id"] for item in response.data["results"]],
+            [message.id for message in reversed(messages[:5])],
+        )
+        self.assertIsNone(response.data["next"])
 
     def test_message_search(self):
         """
@@ -179,8 +333,8 @@ class ChatRoomTestCase(APITestCase):
         # 키워드 '안녕'으로 검색하여 '안녕하세요' 메시지를 찾는 테스트
         response = self.client.get(url, {"q": "안녕"}, format="json")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]["content"], "안녕하세요")
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertEqual(response.data["results"][0]["content"], "안녕하세요")
 
         # 존재하지 않는 메시지를 검색
         response = self.client.get(url, {"q": "없는 메시지"}, format="json")
@@ -188,3 +342,139 @@ class ChatRoomTestCase(APITestCase):
         self.assertIn("message", response.data)
         self.assertEqual(response.data["message"], "검색된 메시지가 없습니다.")
 
+    def test_message_search_ranked_and_paginated(self):
+        """
+        메시지 검색 정렬 테스트: 검색어와 일치하는 단어가 많은 메시지가 먼저 반환되고, 커서로 다음 페이지를 조회하는지 검증
+        """
+        chatroom = ChatRoom.objects.create()
+        chatroom.participants.set([self.user1, self.user2])
+        best = Message.objects.create(
+            chat_room=chatroom, sender=self.user1, content="귤 귤 귤 사러 가요"
+        )
+        others = [
+            Message.objects.create(
+                chat_room=chatroom, sender=self.user2, content=f"귤 {i}개 남았어요"
+            )
+            for i in range(3)
+        ]
+        Message.objects.create(chat_room=chatroom, sender=self.user2, content="사과")
+
+        url = reverse("chat:message_search", kwargs={"room_id": chatroom.id})
+        response = self.client.get(url, {"q": "귤", "page_size": 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        first_page = [item["id"] for item in response.data["results"]]
+        self.assertEqual(first_page[0], best.id)
+
+        response = self.client.get(response.data["next"])
+        second_page = [item["id"] for item in response.data["results"]]
+        self.assertCountEqual(
+            first_page + second_page, [best.id] + [m.id for m in others]
+        )
+        self.assertIsNone(response.data["next"])
+
+
+class ChatConsumerTestCase(TransactionTestCase):
+    """
+    ChatConsumer 메시지 저장 테스트
+    """
+
+    def setUp(self):
+        self.user1 = User.objects.create_user(
+            email="newuser1@example.com",
+            password="newpassword123",
+            username="user1",
+        )
+        self.user2 = User.objects.create_user(
+            email="newuser2@example.com",
+            password="newpassword123",
+            username="user2",
+        )
+        self.chatroom = ChatRoom.objects.create()
+        self.chatroom.participants.set([self.user1, self.user2])
+
+    async def connect(self, user):
+        communicator = WebsocketCommunicator(
+            URLRouter(websocket_urlpatterns), f"/ws/chat/{self.chatroom.id}/"
+        )
+        communicator.scope["user"] = user
+        connected, _ = await communicator.connect()
+        self.assertTrue(connected)
+        return communicator
+
+    async def test_websocket_message_is_saved_and_echoed(self):
+        """
+        WebSocket으로 보낸 메시지가 저장되고, 부여된 id와 전송 시간이 참여자 모두에게 전달되는지 검증
+        """
+        sender = await self.connect(self.user1)
+        receiver = await self.connect(self.user2)
+
+        await sender.send_json_to(
+            {"message": "안녕하세요", "client_message_id": "tmp-1"}
+        )
+        echoed = await sender.receive_json_from(timeout=5)
+        received = await receiver.receive_json_from(timeout=5)
+
+        message = await sync_to_async(Message.objects.get)(chat_room=self.chatroom)
+        self.assertEqual(echoed["message_id"], message.id)
+        self.assertEqual(echoed["client_message_id"], "tmp-1")
+        self.assertEqual(received["message_id"], message.id)
+        self.assertEqual(received["sent_at"], message.sent_at.isoformat())
+        self.assertEqual(message.sender_id, self.user1.id)
+
+        await sender.disconnect()
+        await receiver.disconnect()
+
+    async def test_write_buffer_flushes_by_size(self):
+        """
+        쓰기 버퍼가 지정한 개수만큼 모이면 한 번에 저장하는지 검증
+        """
+        buffer = MessageWriteBuffer(max_size=3, max_delay_ms=60_000)
+        messages = [
+            Message(chat_room=self.chatroom, sender=self.user1, content=f"메시지 {i}")
+            for i in range(3)
+        ]
+
+        saved = await asyncio.wait_for(
+            asyncio.gather(*(buffer.add(message) for message in messages)), timeout=5
+        )
+
+        self.assertTrue(all(message.id for message in saved))
+        await sync_to_async(self.chatroom.refresh_from_db)()
+        self.assertEqual(self.chatroom.last_message_id, saved[-1].id)
+        count = await sync_to_async(
+            Message.objects.filter(chat_room=self.chatroom).count
+        )()
+        self.assertEqual(count, 3)
+
+    @override_settings(CHAT_READ_RECEIPT_DELAY_MS=100)
+    async def test_read_receipts_are_coalesced(self):
+        """
+        연속으로 보낸 읽음 처리 요청이 가장 최근 메시지 하나로 합쳐져 저장되고 전송되는지 검증
+        """
+        sender = await self.connect(self.user1)
+        reader = await self.connect(self.user2)
+        # 입장 시 읽음 처리가 끝날 때까지 대기
+        self.assertTrue(await reader.receive_nothing(timeout=0.2))
+        messages = [
+            await sync_to_async(Message.objects.create)(
+                chat_room=self.chatroom, sender=self.user1, content=f"메시지 {i}"
+            )
+            for i in range(3)
+        ]
+
+        for message in messages:
+            await reader.send_json_to({"message_id": message.id})
+
+        receipt = await sender.receive_json_from(timeout=5)
+        self.assertEqual(receipt["status"], "read")
+        self.assertEqual(receipt["message_id"], messages[-1].id)
+        self.assertEqual(receipt["reader_id"], self.user2.id)
+        self.assertTrue(await sender.receive_nothing(timeout=0.2))
+
+        state = await sync_to_async(ChatReadState.objects.get)(
+            chat_room=self.chatroom, user=self.user2
+        )
+        self.assertEqual(state.last_read_message_id, messages[-1].id)
+
+        await sender.disconnect()
+        await reader.disconnect()
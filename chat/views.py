@@ -1,3 +1,10 @@
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    TrigramWordSimilarity,
+)
+from django.db.models import F, FloatField, Q
+from django.db.models.functions import Cast
 from django.shortcuts import get_object_or_404
 from django.contrib.auth import get_user_model
 from rest_framework import generics, status, filters
@@ -5,8 +12,10 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema, OpenApiExample, OpenApiParameter
 from drf_spectacular.types import OpenApiTypes
-from .models import ChatRoom, Message, WebSocketConnection
-from .serializers import ChatRoomSerializer, MessageSerializer
+from config.pagination import CursorPagination
+from . import receipts
+from .models import ChatRoom, Message
+from .serializers import ChatRoomListSerializer, ChatRoomSerializer, MessageSerializer
 
 User = get_user_model()
 
@@ -19,13 +28,14 @@ def get_chat_room_or_404(request, room_id):
 
 
 class ChatRoomListView(generics.ListAPIView):
-    serializer_class = ChatRoomSerializer
+    serializer_class = ChatRoomListSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = CursorPagination
 
     @extend_schema(
         summary="채팅방 목록 조회",
-        description="현재 로그인한 사용자가 속한 채팅방의 목록을 반환합니다.",
-        responses={200: ChatRoomSerializer(many=True)},
+        description="현재 로그인한 사용자가 속한 채팅방의 목록을 마지막 메시지, 안 읽은 메시지 수와 함께 최근 활동순으로 반환합니다.",
+        responses={200: ChatRoomListSerializer(many=True)},
         tags=["chatroom"],
     )
     def get(self, request, *args, **kwargs):
@@ -35,7 +45,12 @@ class ChatRoomListView(generics.ListAPIView):
         # Swagger 스키마 생성 시 오류 방지
         if getattr(self, "swagger_fake_view", False):
             return ChatRoom.objects.none()
-        return self.request.user.chat_rooms.all()
+        queryset = (
+            self.request.user.chat_rooms.select_related("last_message__sender")
+            .prefetch_related("participants")
+            .order_by("-last_activity_at", "-id")
+        )
+        return receipts.annotate_unread_counts(queryset, self.request.user.id)
 
 
 class ChatRoomCreateView(generics.CreateAPIView):
@@ -99,7 +114,7 @@ class ChatRoomDetailView(generics.RetrieveAPIView):
 
     @extend_schema(
         summary="채팅방 상세 조회",
-        description="채팅방 ID를 기준으로 채팅방 정보를 반환합니다. 입장 시 읽지 않은 메시지를 모두 읽음으로 처리합니다.",
+        description="채팅방 ID를 기준으로 채팅방 정보를 반환합니다. 입장 시 최신 메시지까지 읽음으로 처리합니다.",
         responses={
             200: ChatRoomSerializer,
             404: {
@@ -114,22 +129,10 @@ class ChatRoomDetailView(generics.RetrieveAPIView):
 
     def get_object(self):
         chat_room = get_chat_room_or_404(self.request, self.kwargs["room_id"])
-        self.mark_all_messages_as_read(chat_room)
+        # 메시지별 읽음 상태 대신 읽음 워터마크를 최신 메시지로 이동
+        receipts.mark_room_read(self.request.user.id, chat_room.id)
         return chat_room
 
-    def mark_all_messages_as_read(self, chat_room):
-        """
-        메시지의 읽음 상태를 한번에 업데이트
-        WebSocket이 연결된 경우는 제외하고 처리
-        """
-        other_user = chat_room.participants.exclude(id=self.request.user.id).first()
-        if not WebSocketConnection.objects.filter(
-            user=other_user, chat_room=chat_room, disconnected_at__isnull=True
-        ).exists():
-            Message.objects.filter(chat_room=chat_room, is_read=False).exclude(
-                sender=self.request.user
-            ).update(is_read=True)
-
 
 class ChatRoomLeaveView(generics.DestroyAPIView):
     permission_classes = [IsAuthenticated]
@@ -157,9 +160,22 @@ class ChatRoomLeaveView(generics.DestroyAPIView):
         return Response({"message": "채팅방에서 나갔습니다."}, status=204)
 
 
-class MessageListView(generics.ListAPIView):
+class MessageReadStateMixin:
+    """
+    메시지 읽음 여부 계산에 필요한 채팅방 참여자의 읽음 워터마크를 serializer context로 전달
+    """
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if not getattr(self, "swagger_fake_view", False):
+            context["read_watermarks"] = receipts.watermarks(self.kwargs["room_id"])
+        return context
+
+
+class MessageListView(MessageReadStateMixin, generics.ListAPIView):
     serializer_class = MessageSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = CursorPagination
 
     @extend_schema(
         summary="채팅방 메시지 목록 조회",
@@ -183,7 +199,7 @@ class MessageListView(generics.ListAPIView):
         return Message.objects.filter(
             chat_room_id=self.kwargs["room_id"],
             chat_room__participants=self.request.user,
-        )
+        ).order_by("-sent_at", "-id")
 
 
 class MessageCreateView(generics.CreateAPIView):
@@ -208,24 +224,17 @@ class MessageCreateView(generics.CreateAPIView):
 
     def perform_create(self, serializer):
         chat_room = get_chat_room_or_404(self.request, self.kwargs["room_id"])
-        message = serializer.save(sender=self.request.user, chat_room=chat_room)
-
-        # 상대방이 WebSocket에 연결된 상태라면 즉시 읽음 처리
-        other_user = chat_room.participants.exclude(id=self.request.user.id).first()
-        if WebSocketConnection.objects.filter(
-            user=other_user, chat_room=chat_room, disconnected_at__isnull=True
-        ).exists():
-            message.is_read = True
-            message.save()
+        serializer.save(sender=self.request.user, chat_room=chat_room)
 
 
-class MessageSearchView(generics.ListAPIView):
+class MessageSearchView(MessageReadStateMixin, generics.ListAPIView):
     serializer_class = MessageSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = CursorPagination
 
     @extend_schema(
         summary="채팅방 메시지 검색",
-        description="주어진 키워드를 포함하는 메시지를 검색합니다.",
+        description="주어진 키워드를 포함하는 메시지를 관련도순으로 검색합니다. 검색어가 없으면 최신순으로 반환합니다.",
         parameters=[
             OpenApiParameter(
                 name="q", description="검색어", required=False, type=OpenApiTypes.STR
@@ -235,16 +244,10 @@ class MessageSearchView(generics.ListAPIView):
         tags=["message"],
     )
     def get(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
-
-        if not queryset.exists():
-            return Response(
-                {"message": "검색된 메시지가 없습니다.", "results": []},
-                status=status.HTTP_200_OK,
-            )
-
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        response = super().get(request, *args, **kwargs)
+        if not response.data["results"]:
+            response.data["message"] = "검색된 메시지가 없습니다."
+        return response
 
     def get_queryset(self):
         # Swagger 스키마 생성 시 오류 방지
@@ -252,7 +255,22 @@ class MessageSearchView(generics.ListAPIView):
             return Message.objects.none()
 
         chat_room = get_chat_room_or_404(self.request, self.kwargs["room_id"])
-        query = self.request.query_params.get("q")
-        if query:
-            return Message.objects.filter(chat_room=chat_room, content__icontains=query)
-        return Message.objects.filter(chat_room=chat_room)
+        queryset = Message.objects.filter(chat_room=chat_room).select_related("sender")
+        query = self.request.query_params.get("q", "").strip()
+        if not query:
+            return queryset.order_by("-sent_at", "-id")
+
+        # 단어 단위는 전문 검색(GIN), 단어 일부는 trigram 인덱스를 사용하는 icontains로 검색
+        search_query = SearchQuery(query, config="simple", search_type="websearch")
+        return (
+            queryset.filter(Q(search_vector=search_query) | Q(content__icontains=query))
+            .annotate(
+                # 커서 값이 정확히 비교되도록 double precision으로 변환
+                rank=Cast(
+                    SearchRank(F("search_vector"), search_query)
+                    + TrigramWordSimilarity(query, "content"),
+                    FloatField(),
+                )
+            )
+            .order_by("-rank", "-id")
+        )
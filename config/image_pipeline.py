@@ -0,0 +1,332 @@
+"""
+업로드 이미지 비동기 처리 파이프라인
+요청 처리 중에는 업로드 파일을 로컬 준비 영역(IMAGE_STAGING_ROOT)에 기록하고 이미지 상태를 pending으로 저장
+트랜잭션 commit 이후 워커 스레드가 프로세스 풀에서 리사이즈/인코딩(원본 필드와 렌디션)을 실행하고,
+결과 파일을 스토리지에 저장한 뒤 행의 이미지 경로와 상태(ready)를 한 번에 교체
+
+이미지 필드와 렌디션은 모델에서 register()로 등록
+여러 이미지를 함께 업로드하면 create_pending_batch()로 행은 한 번에 생성하고 준비 영역 기록은 동시에 실행
+준비 영역 파일명에 대상(앱.모델.pk.필드)이 들어 있으므로 처리 전에 프로세스가 종료되어도
+process_staged_images 명령어로 다시 처리할 수 있음
+"""
+
+import logging
+import os
+import queue
+import threading
+import uuid
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from dataclasses import dataclass
+from functools import partial
+from io import BytesIO
+from multiprocessing import get_context
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.files.base import ContentFile
+from django.db import close_old_connections, models, transaction
+from django.dispatch import Signal
+from imagekit.utils import suggest_extension
+from PIL import Image
+from pilkit.utils import open_image, process_image
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+READY = "ready"
+FAILED = "failed"
+STATUS_CHOICES = [(PENDING, "처리 중"), (READY, "완료"), (FAILED, "실패")]
+
+# create_pending_batch가 bulk_create로 생성한 이미지 행 목록 (bulk_create는 post_save를 보내지 않음)
+# receiver 인자: instances
+images_bulk_created = Signal()
+# 처리 결과로 이미지가 교체된 행 (QuerySet.update로 교체하므로 post_save가 발생하지 않음)
+# receiver 인자: pk, field
+image_processed = Signal()
+
+_targets = {}
+_queue = queue.Queue()
+_worker = None
+_executor = None
+_worker_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class ImageTarget:
+    """비동기로 처리할 이미지 필드 (status_field에 처리 상태 기록)"""
+
+    model: type
+    field: str
+    status_field: str
+    renditions: tuple
+    dimensions: bool
+
+
+@dataclass(frozen=True)
+class Job:
+    label: str
+    pk: object
+    field: str
+    path: str
+
+
+def status_field():
+    """이미지 처리 상태 필드 (기존 이미지는 완료 상태)"""
+    return models.CharField(
+        max_length=10, choices=STATUS_CHOICES, default=READY, editable=False
+    )
+
+
+def register(model, field="image", status_field="image_status", renditions=()):
+    """
+    model.field를 비동기 처리 대상으로 등록
+    renditions: 원본 처리 결과로 함께 생성할 ImageSpecField 이름
+    모델에 width, height 필드가 있으면 원본 처리 결과 크기를 기록
+    """
+    _targets[(model._meta.label_lower, field)] = ImageTarget(
+        model=model,
+        field=field,
+        status_field=status_field,
+        renditions=tuple(renditions),
+        dimensions=hasattr(model, "width") and hasattr(model, "height"),
+    )
+
+
+def get_target(model, field):
+    return _targets[(model._meta.label_lower, field)]
+
+
+def create_pending_batch(model, uploads, field="image", **fields):
+    """
+    업로드 파일마다 pending 상태의 행을 bulk_create로 한 번에 생성하고,
+    준비 영역 기록은 스레드 풀(IMAGE_UPLOAD_THREADS)에서 동시에 실행
+    하나라도 실패하면 기록한 파일을 삭제하고 행 생성도 롤백
+    bulk_create는 post_save를 보내지 않으므로 images_bulk_created signal 전송
+    """
+    if not uploads:
+        return []
+    target = get_target(model, field)
+    with transaction.atomic():
+        instances = model.objects.bulk_create(
+            [model(**{target.status_field: PENDING}, **fields) for _ in uploads]
+        )
+        max_workers = min(len(uploads), settings.IMAGE_UPLOAD_THREADS)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_write_staged, instance, upload, field)
+                for instance, upload in zip(instances, uploads)
+            ]
+        errors = [future.exception() for future in futures if future.exception()]
+        jobs = [future.result() for future in futures if not future.exception()]
+        if errors:
+            for job in jobs:
+                _discard(job.path)
+            # atomic 블록을 벗어나면서 행 생성도 롤백
+            raise errors[0]
+
+        for job in jobs:
+            transaction.on_commit(partial(_put, job))
+        images_bulk_created.send(sender=model, instances=instances)
+    return instances
+
+
+def stage(instance, upload, field="image"):
+    """
+    저장된 행의 이미지를 업로드 파일로 교체하도록 예약
+    처리가 끝날 때까지 기존 이미지는 그대로 유지
+    """
+    target = get_target(type(instance), field)
+    job = _write_staged(instance, upload, field)
+    if getattr(instance, target.status_field) != PENDING:
+        setattr(instance, target.status_field, PENDING)
+        type(instance).objects.filter(pk=instance.pk).update(
+            **{target.status_field: PENDING}
+        )
+    transaction.on_commit(partial(_put, job))
+    return job
+
+
+def _write_staged(instance, upload, field):
+    """업로드 파일을 준비 영역에 기록 (파일명: 앱.모델.pk.필드.uuid.확장자)"""
+    ext = os.path.splitext(upload.name)[1].lower() or ".img"
+    filename = (
+        f"{instance._meta.label_lower}.{instance.pk}.{field}.{uuid.uuid4().hex}{ext}"
+    )
+    os.makedirs(settings.IMAGE_STAGING_ROOT, exist_ok=True)
+    path = os.path.join(settings.IMAGE_STAGING_ROOT, filename)
+    try:
+        with open(path, "wb") as staged:
+            for chunk in upload.chunks():
+                staged.write(chunk)
+    except BaseException:
+        _discard(path)
+        raise
+    return Job(instance._meta.label_lower, instance.pk, field, path)
+
+
+def parse_staged(filename):
+    """준비 영역 파일명에서 Job 복원 (등록된 대상이 아니면 None)"""
+    parts = filename.split(".")
+    if len(parts) < 6:
+        return None
+    app_label, model_name, pk, field = parts[:4]
+    label = f"{app_label}.{model_name}"
+    if (label, field) not in _targets:
+        return None
+    try:
+        pk = _targets[(label, field)].model._meta.pk.to_python(pk)
+    except ValidationError:
+        return None
+    return Job(label, pk, field, os.path.join(settings.IMAGE_STAGING_ROOT, filename))
+
+
+def join():
+    """큐에 추가된 이미지가 모두 처리될 때까지 대기"""
+    _queue.join()
+
+
+def _put(job):
+    _ensure_worker()
+    _queue.put(job)
+
+
+def create_executor(max_workers=None):
+    """이미지 처리용 프로세스 풀 (요청 처리 스레드가 있는 프로세스를 fork하지 않도록 spawn 사용)"""
+    return ProcessPoolExecutor(
+        max_workers=max_workers or settings.IMAGE_PROCESSING_WORKERS,
+        mp_context=get_context("spawn"),
+    )
+
+
+def _ensure_worker():
+    global _worker, _executor
+    with _worker_lock:
+        if _executor is None:
+            _executor = create_executor()
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(
+                target=_run_worker, name="image-pipeline", daemon=True
+            )
+            _worker.start()
+
+
+def _collect_batch():
+    """첫 이미지가 들어올 때까지 대기한 뒤, 이미 쌓여 있는 이미지를 함께 꺼냄"""
+    batch = [_queue.get()]
+    while len(batch) < settings.IMAGE_PROCESSING_WORKERS * 2:
+        try:
+            batch.append(_queue.get_nowait())
+        except queue.Empty:
+            break
+    return batch
+
+
+def _run_worker():
+    while True:
+        batch = _collect_batch()
+        try:
+            process_jobs(batch, _executor)
+        finally:
+            close_old_connections()
+            for _ in batch:
+                _queue.task_done()
+
+
+def process_jobs(jobs, executor):
+    """
+    이미지를 프로세스 풀에서 동시에 처리하고 끝나는 순서대로 결과 반영
+    반환값: 완료된 이미지 수
+    """
+    futures = {}
+    for job in jobs:
+        target = _targets[(job.label, job.field)]
+        futures[executor.submit(render, job.path, operations(target))] = job
+
+    done = 0
+    for future in as_completed(futures):
+        job = futures[future]
+        try:
+            finish(job, future.result())
+            done += 1
+        except Exception:
+            logger.exception("이미지 처리에 실패했습니다: %s", job.path)
+            fail(job)
+    return done
+
+
+def operations(target):
+    """원본 필드와 렌디션의 (processors, format, autoconvert, options) 목록"""
+    specs = [target.model._meta.get_field(target.field).get_spec(source=None)]
+    for rendition in target.renditions:
+        specs.append(getattr(target.model, rendition).get_spec(source=None))
+    return [
+        (spec.processors, spec.format, spec.autoconvert, spec.options) for spec in specs
+    ]
+
+
+def render(path, operations):
+    """
+    프로세스 풀에서 실행: 준비 영역 파일을 처리해서 (내용, (width, height)) 목록 반환
+    첫 번째 결과는 원본 필드, 나머지는 원본 처리 결과로 생성한 렌디션 (imagekit과 같은 순서)
+    """
+    results = []
+    with open(path, "rb") as staged:
+        source = open_image(staged)
+        for index, (processors, format, autoconvert, options) in enumerate(operations):
+            if index:
+                source = Image.open(BytesIO(results[0][0]))
+            output = process_image(source, processors, format, autoconvert, options)
+            content = output.getvalue()
+            with Image.open(BytesIO(content)) as rendered:
+                results.append((content, rendered.size))
+    return results
+
+
+def finish(job, results):
+    """처리 결과를 스토리지에 저장하고 행의 이미지 경로와 상태를 교체"""
+    target = _targets[(job.label, job.field)]
+    model = target.model
+    instance = model.objects.filter(pk=job.pk).first()
+    if instance is None:
+        _discard(job.path)
+        return
+
+    field = model._meta.get_field(target.field)
+    (content, (width, height)), renditions = results[0], results[1:]
+    spec = field.get_spec(source=None)
+    filename = suggest_extension(f"{uuid.uuid4().hex}.jpg", spec.format)
+    name = field.storage.save(
+        field.generate_filename(instance, filename), ContentFile(content)
+    )
+
+    previous = getattr(instance, target.field)
+    previous_name = previous.name if previous else None
+    setattr(instance, target.field, name)
+    for attname, (rendition, _) in zip(target.renditions, renditions):
+        cachefile = getattr(instance, attname)
+        cachefile.storage.save(cachefile.name, ContentFile(rendition))
+
+    values = {target.field: name, target.status_field: READY}
+    if target.dimensions:
+        values.update(width=width, height=height)
+    model.objects.filter(pk=job.pk).update(**values)
+
+    if previous_name:
+        field.storage.delete(previous_name)
+    _discard(job.path)
+    image_processed.send(sender=model, pk=job.pk, field=target.field)
+
+
+def fail(job):
+    target = _targets[(job.label, job.field)]
+    target.model.objects.filter(pk=job.pk).update(**{target.status_field: FAILED})
+
+
+def _discard(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,107 @@
+"""
+목록 조회용 이미지 렌디션(rendition)
+업로드 원본(ProcessedImageField)과 별도로 크기별 이미지를 ImageSpecField로 생성
+IMAGEKIT_DEFAULT_CACHEFILE_STRATEGY(Optimistic)에 따라 원본 저장 시 미리 생성하고,
+조회 시에는 파일 존재 확인 없이 URL만 계산
+
+렌디션 (이미지 모델의 image_<이름> 속성)
+- thumbnail: 긴 변 최대 400px (상품 목록)
+- medium: 긴 변 최대 1080px (게시물 목록)
+- full: 업로드 원본 (image 필드)
+
+렌디션 형식은 IMAGE_RENDITION_FORMAT(WEBP, AVIF 등)이고 Pillow가 인코딩할 수 없으면 JPEG
+이미지 크기는 원본 저장 시 width, height 컬럼에 기록하고 렌디션 크기는 계산으로 구함
+업로드 이미지가 비동기 처리 중(config/image_pipeline.py)이면 URL과 크기 대신 처리 상태만 반환
+"""
+
+from django.conf import settings
+from django.core.files.images import get_image_dimensions
+from imagekit.models import ImageSpecField
+from imagekit.processors import ResizeToFit
+from PIL import Image
+from rest_framework import serializers
+from config import image_pipeline
+
+RENDITION_SIZES = {"thumbnail": 400, "medium": 1080}
+
+
+def rendition_format():
+    Image.init()
+    if settings.IMAGE_RENDITION_FORMAT in Image.SAVE:
+        return settings.IMAGE_RENDITION_FORMAT
+    return "JPEG"
+
+
+def rendition_field(source, rendition):
+    """source 이미지 필드로 생성하는 렌디션 ImageSpecField"""
+    size = RENDITION_SIZES[rendition]
+    return ImageSpecField(
+        source=source,
+        processors=[ResizeToFit(size, size, upscale=False)],
+        format=rendition_format(),
+        options={"quality": settings.IMAGE_RENDITION_QUALITY},
+    )
+
+
+def fit_size(width, height, max_width, max_height, upscale=True):
+    """ResizeToFit 처리 결과 크기 (pilkit과 같은 계산)"""
+    ratio = min(max_width / width, max_height / height)
+    new_width, new_height = round(width * ratio), round(height * ratio)
+    if upscale or (new_width < width and new_height < height):
+        return new_width, new_height
+    return width, height
+
+
+def set_dimensions(instance, max_width, max_height, field="image"):
+    """
+    새로 업로드된 이미지를 ResizeToFit(max_width, max_height)로 처리한 크기를 width, height에 기록
+    파일 헤더만 읽으므로 저장 전에 원본 처리 결과를 다시 열지 않음
+    """
+    file = getattr(instance, field)
+    if not file or file._committed:
+        return
+    width, height = get_image_dimensions(file)
+    if width and height:
+        instance.width, instance.height = fit_size(width, height, max_width, max_height)
+
+
+def rendition_size(instance, rendition):
+    if instance.width is None or instance.height is None:
+        return None, None
+    if rendition == "full":
+        return instance.width, instance.height
+    size = RENDITION_SIZES[rendition]
+    return fit_size(instance.width, instance.height, size, size, upscale=False)
+
+
+def rendition_data(instance, rendition, request=None):
+    """이미지 모델의 렌디션 URL, 크기와 처리 상태"""
+    image_status = instance.image_status
+    if image_status != image_pipeline.READY:
+        return {"url": None, "width": None, "height": None, "status": image_status}
+    if rendition == "full":
+        url = instance.image.url
+    else:
+        url = getattr(instance, f"image_{rendition}").url
+    width, height = rendition_size(instance, rendition)
+    return {
+        "url": request.build_absolute_uri(url) if request else url,
+        "width": width,
+        "height": height,
+        "status": image_status,
+    }
+
+
+class ImageRenditionField(serializers.Field):
+    """
+    이미지 모델(ProductImage, PostImage)의 렌디션 URL, 크기와 처리 상태
+    {"url": ..., "width": ..., "height": ..., "status": "ready" | "pending" | "failed"}
+    """
+
+    def __init__(self, rendition, **kwargs):
+        kwargs["read_only"] = True
+        self.rendition = rendition
+        super().__init__(**kwargs)
+
+    def to_representation(self, instance):
+        return rendition_data(instance, self.rendition, self.context.get("request"))
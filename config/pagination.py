@@ -1,4 +1,14 @@
-from rest_framework.pagination import LimitOffsetPagination, PageNumberPagination
+import json
+from base64 import b64decode, b64encode
+from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import (
+    CursorPagination,
+    LimitOffsetPagination,
+    PageNumberPagination,
+)
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 
 class LimitOffsetPagination(LimitOffsetPagination):
@@ -10,3 +20,170 @@ class PageNumberPagination(PageNumberPagination):
     page_size = 10
     page_size_query_param = "page_size"
     max_page_size = 50
+
+
+class CursorPagination(CursorPagination):
+    """
+    (정렬 필드, id) 복합 키 기반 커서(keyset) 페이지네이션
+    offset 대신 마지막 항목의 키 이후부터 조회하므로 페이지 깊이와 무관하게 일정한 속도
+    조회 중 새 데이터가 추가되어도 항목이 중복되거나 누락되지 않음
+
+    정렬은 queryset에 order_by로 지정된 값을 사용하고, 없으면 ordering을 사용
+    마지막 정렬 필드가 id가 아니면 id를 동률 처리용으로 추가
+    정렬 필드는 NULL을 허용하지 않아야 함 (NULL은 비교 조건으로 다음 페이지를 찾을 수 없음)
+    """
+
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 50
+    ordering = ("-created_at", "-id")
+    invalid_cursor_message = "유효하지 않은 커서입니다."
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        position, self.reverse = self.decode_cursor(request)
+        if position is not None:
+            position = self.parse_position(queryset, position)
+
+        if self.reverse:
+            queryset = queryset.order_by(*self._flip(self.ordering))
+        else:
+            queryset = queryset.order_by(*self.ordering)
+
+        if position is not None:
+            queryset = queryset.filter(self._build_filter(position, self.reverse))
+
+        results = list(queryset[: self.page_size + 1])
+        has_more = len(results) > self.page_size
+        self.page = results[: self.page_size]
+
+        if self.reverse:
+            self.page.reverse()
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = position is not None
+
+        return self.page
+
+    def get_ordering(self, request, queryset, view):
+        """queryset의 정렬을 우선 사용하고, 마지막에 id 정렬을 보장"""
+        ordering = tuple(queryset.query.order_by) or tuple(self.ordering)
+        if not all(isinstance(field, str) and "__" not in field for field in ordering):
+            raise ImproperlyConfigured(
+                "커서 페이지네이션은 모델 필드 또는 annotate된 이름으로만 정렬할 수 있습니다."
+            )
+        for field in ordering:
+            if self._get_field(queryset, field.lstrip("-")).null:
+                raise ImproperlyConfigured(
+                    f"커서 페이지네이션은 NULL을 허용하는 필드({field})로 정렬할 수 없습니다."
+                )
+
+        if ordering[-1].lstrip("-") not in ("id", "pk"):
+            direction = "-" if ordering[0].startswith("-") else ""
+            ordering += (f"{direction}id",)
+        return ordering
+
+    def _get_field(self, queryset, name):
+        """정렬 이름에 해당하는 모델 필드 또는 annotate된 식의 output_field"""
+        if name in queryset.query.annotations:
+            return queryset.query.annotations[name].output_field
+        if name == "pk":
+            return queryset.model._meta.pk
+        return queryset.model._meta.get_field(name)
+
+    def parse_position(self, queryset, position):
+        """커서의 정렬 키 값을 정렬 필드 타입으로 변환 (변환할 수 없으면 유효하지 않은 커서)"""
+        values = []
+        for field, value in zip(self.ordering, position):
+            try:
+                value = self._get_field(queryset, field.lstrip("-")).to_python(value)
+            except (ValidationError, ValueError, TypeError):
+                raise NotFound(self.invalid_cursor_message)
+            if value is None:
+                raise NotFound(self.invalid_cursor_message)
+            values.append(value)
+        return values
+
+    def _flip(self, ordering):
+        return tuple(
+            field[1:] if field.startswith("-") else f"-{field}" for field in ordering
+        )
+
+    def _build_filter(self, position, reverse):
+        """
+        (a, b) 이후 항목 조건: a < x OR (a = x AND b < y)
+        첫 번째 필드에 범위 조건을 함께 걸어 인덱스 범위 탐색이 가능하도록 함
+        """
+        condition = Q()
+        equal = Q()
+        for field, value in zip(self.ordering, position):
+            name = field.lstrip("-")
+            descending = field.startswith("-")
+            lookup = "lt" if descending != reverse else "gt"
+            condition |= equal & Q(**{f"{name}__{lookup}": value})
+            equal &= Q(**{name: value})
+
+        first = self.ordering[0]
+        bound = "lte" if first.startswith("-") != reverse else "gte"
+        return Q(**{f"{first.lstrip('-')}__{bound}": position[0]}) & condition
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None, False
+
+        try:
+            data = json.loads(b64decode(encoded.encode("ascii")).decode("utf-8"))
+            position = data["p"]
+            reverse = bool(data.get("r", False))
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return position, reverse
+
+    def encode_position(self, position, reverse=False):
+        """정렬 키 값 목록을 커서 문자열로 변환"""
+        data = json.dumps({"p": position, "r": int(reverse)})
+        return b64encode(data.encode("utf-8")).decode("ascii")
+
+    def encode_cursor(self, position, reverse):
+        encoded = self.encode_position(position, reverse)
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_position(self, instance):
+        """항목의 정렬 키 값 목록 (커서에 담기 위해 문자열로 변환)"""
+        position = []
+        for field in self.ordering:
+            value = getattr(instance, field.lstrip("-"))
+            if value is None:
+                raise ImproperlyConfigured(
+                    f"커서 페이지네이션의 정렬 필드({field}) 값이 NULL입니다."
+                )
+            position.append(
+                value.isoformat() if hasattr(value, "isoformat") else str(value)
+            )
+        return position
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        position = self.get_position(self.page[-1])
+        return self.encode_cursor(position, reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        position = self.get_position(self.page[0])
+        return self.encode_cursor(position, reverse=True)
@@ -1,19 +1,150 @@
-import boto3
-from botocore.exceptions import NoCredentialsError
+"""
+S3 업로드 유틸리티
+boto3 클라이언트는 첫 업로드 시점에 한 번만 생성하고 프로세스 안의 모든 스레드가 공유
+(boto3 import와 클라이언트 생성 비용이 서버 시작 시간에 포함되지 않음)
+
+- 연결 풀 크기(S3_MAX_POOL_CONNECTIONS)와 재시도 횟수를 지정한 클라이언트 사용
+- S3_MULTIPART_THRESHOLD보다 큰 파일은 파일 객체를 읽으면서 multipart로 업로드
+- upload_many()는 여러 파일을 스레드 풀에서 동시에 업로드하고 파일별 결과를 반환
+
+백엔드 (settings.S3_BACKEND)
+- s3: AWS S3 업로드
+- local: S3_LOCAL_ROOT 디렉터리에 같은 키로 저장 (네트워크 없이 테스트, 개발용)
+"""
+
+import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class UploadResult:
+    """upload_many의 파일별 결과 (실패하면 url은 None, error에 예외)"""
+
+    object_name: str
+    url: str = None
+    error: Exception = None
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+class S3Backend:
+    def __init__(self):
+        # boto3는 import 비용이 크므로 클라이언트를 만들 때 import
+        import boto3
+        from boto3.s3.transfer import TransferConfig
+        from botocore.config import Config
+
+        self.client = boto3.client(
+            "s3",
+            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+            region_name=settings.AWS_REGION,
+            config=Config(
+                max_pool_connections=settings.S3_MAX_POOL_CONNECTIONS,
+                retries={"max_attempts": settings.S3_MAX_ATTEMPTS, "mode": "standard"},
+                tcp_keepalive=True,
+            ),
+        )
+        self.transfer_config = TransferConfig(
+            multipart_threshold=settings.S3_MULTIPART_THRESHOLD,
+            multipart_chunksize=settings.S3_MULTIPART_CHUNKSIZE,
+            max_concurrency=settings.S3_MULTIPART_CONCURRENCY,
+        )
+
+    def upload(self, file, object_name, content_type=None):
+        extra_args = {"ContentType": content_type} if content_type else None
+        self.client.upload_fileobj(
+            file,
+            settings.AWS_STORAGE_BUCKET_NAME,
+            object_name,
+            ExtraArgs=extra_args,
+            Config=self.transfer_config,
+        )
+        return object_url(object_name)
+
+
+class LocalBackend:
+    """S3 대신 S3_LOCAL_ROOT/<버킷>/<키> 경로에 저장"""
 
-# S3 클라이언트 설정
-s3_client = boto3.client(
-    "s3",
-    aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-    aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-    region_name=settings.AWS_REGION,
-)
+    def path(self, object_name):
+        root = os.path.join(settings.S3_LOCAL_ROOT, settings.AWS_STORAGE_BUCKET_NAME)
+        path = os.path.normpath(os.path.join(root, object_name))
+        if not path.startswith(os.path.normpath(root) + os.sep):
+            raise ValueError(f"잘못된 object_name: {object_name}")
+        return path
 
+    def upload(self, file, object_name, content_type=None):
+        path = self.path(object_name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as destination:
+            shutil.copyfileobj(file, destination, settings.S3_MULTIPART_CHUNKSIZE)
+        return object_url(object_name)
+
+
+BACKENDS = {"s3": S3Backend, "local": LocalBackend}
+
+
+def get_backend():
+    """설정된 백엔드 (처음 호출할 때 생성)"""
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = BACKENDS[settings.S3_BACKEND]()
+    return _backend
+
+
+@receiver(setting_changed)
+def reset_backend(setting, **kwargs):
+    """override_settings로 S3, AWS 설정이 바뀌면 백엔드를 다시 생성"""
+    global _backend
+    if setting.startswith(("S3_", "AWS_")):
+        _backend = None
+
+
+def object_url(object_name):
+    return f"https://{settings.AWS_STORAGE_BUCKET_NAME}.s3.{settings.AWS_REGION}.amazonaws.com/{object_name}"
+
+
+def upload_to_s3(file, object_name, content_type=None):
+    """파일 객체 업로드 후 URL 반환 (인증 정보가 없으면 None)"""
+    from botocore.exceptions import NoCredentialsError
 
-def upload_to_s3(file, object_name):
     try:
-        s3_client.upload_fileobj(file, settings.AWS_STORAGE_BUCKET_NAME, object_name)
-        return f"https://{settings.AWS_STORAGE_BUCKET_NAME}.s3.{settings.AWS_REGION}.amazonaws.com/{object_name}"
+        return get_backend().upload(file, object_name, content_type)
     except NoCredentialsError:
         return None
+
+
+def upload_many(files, max_workers=None):
+    """
+    여러 파일을 스레드 풀에서 동시에 업로드 (클라이언트와 연결 풀은 공유)
+    files: (파일 객체, object_name) 또는 (파일 객체, object_name, content_type) 목록
+    반환값: 입력 순서대로 UploadResult 목록 (일부가 실패해도 나머지는 업로드)
+    """
+    files = list(files)
+    if not files:
+        return []
+    backend = get_backend()
+    max_workers = min(len(files), max_workers or settings.S3_MAX_POOL_CONNECTIONS)
+
+    def upload(item):
+        object_name = item[1]
+        try:
+            return UploadResult(object_name, url=backend.upload(*item))
+        except Exception as e:
+            return UploadResult(object_name, error=e)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(upload, files))
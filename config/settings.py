@@ -61,6 +61,7 @@ INSTALLED_APPS = [
     "django.contrib.messages",
     "django.contrib.staticfiles",
     "django.contrib.sites",
+    "django.contrib.postgres",
 ]
 
 MIDDLEWARE = [
@@ -133,6 +134,24 @@ CHANNEL_LAYERS = {
     },
 }
 
+# 캐시 설정
+# REDIS_URL이 설정되면 Redis를 사용하고, 없으면 프로세스 메모리(로컬 개발, 테스트)를 사용
+# 여러 프로세스로 배포할 때는 접속 상태(presence)를 공유하기 위해 반드시 REDIS_URL을 설정
+REDIS_URL = os.getenv("REDIS_URL")
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        },
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        },
+    }
+
 AUTH_USER_MODEL = "accounts.User"
 
 LANGUAGE_CODE = "ko-kr"
@@ -162,6 +181,17 @@ AWS_S3_CUSTOM_DOMAIN = f"{AWS_STORAGE_BUCKET_NAME}.s3.{AWS_REGION}.amazonaws.com
 MEDIA_URL = f"https://{AWS_S3_CUSTOM_DOMAIN}/meida/"
 DEFAULT_FILE_STORAGE = "storages.backends.s3boto3.S3Boto3Storage"
 
+# S3 업로드 설정 (config/s3_utils.py)
+# s3: AWS S3, local: S3_LOCAL_ROOT 디렉터리에 저장 (네트워크 없이 테스트, 개발용)
+S3_BACKEND = os.getenv("S3_BACKEND", "s3")
+S3_LOCAL_ROOT = os.getenv("S3_LOCAL_ROOT", BASE_DIR / "s3")
+# 클라이언트 연결 풀 크기 (upload_many 최대 동시 업로드 수)
+S3_MAX_POOL_CONNECTIONS = 32
+S3_MAX_ATTEMPTS = 5  # 요청별 최대 시도 횟수 (재시도 포함)
+S3_MULTIPART_THRESHOLD = 8 * 1024 * 1024  # 이 크기보다 큰 파일은 multipart 업로드
+S3_MULTIPART_CHUNKSIZE = 8 * 1024 * 1024
+S3_MULTIPART_CONCURRENCY = 4  # 파일 하나의 파트를 동시에 업로드할 스레드 수
+
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 # Django Rest Framework 설정
@@ -261,10 +291,71 @@ EMAIL_HOST_PASSWORD = os.getenv("EMAIL_HOST_PASSWORD")
 
 DEFAULT_FROM_EMAIL = os.getenv("DEFAULT_FROM_EMAIL")
 
+# 홈 피드 설정
+FEED_FANOUT_MAX_FOLLOWERS = 5000  # 팔로워가 이 이상인 계정은 조회 시점에 피드로 가져옴
+FEED_PULL_LIMIT = 50  # 조회 시점에 가져올 대형 계정 게시물 수
+FEED_BACKFILL_LIMIT = 100  # 팔로우 시 피드에 추가할 상대방 게시물 수
+FEED_REBUILD_LIMIT = 500  # 피드 재생성 시 사용자당 최대 게시물 수
+
+# 인기 사용자 순위 설정
+# db: 팔로워 수 카운터 인덱스 조회, redis: Redis ZSET 조회 (rebuild_leaderboard 명령어로 초기화)
+LEADERBOARD_BACKEND = os.getenv("LEADERBOARD_BACKEND", "db")
+LEADERBOARD_REDIS_URL = os.getenv("LEADERBOARD_REDIS_URL", "redis://127.0.0.1:6379/1")
+LEADERBOARD_KEY = "accounts:leaderboard:followers"
+POPULAR_USERS_SIZE = 10  # 게시물 목록에 게시물을 포함할 인기 사용자 수
+
+# 프로필 검색 설정
+PROFILE_AUTOCOMPLETE_SIZE = 10  # 자동완성으로 반환할 최대 사용자 수
+PROFILE_CARD_CACHE_TIMEOUT = 60 * 60  # 프로필 카드 캐시 유지 시간 (초)
+PRIVACY_SETTINGS_CACHE_SIZE = 4096  # 프로세스별로 캐시할 공개 설정 수
+
+# 일괄 팔로우 설정
+FOLLOW_BULK_MAX_USERS = (
+    500  # 일괄 팔로우 API 요청 한 번에 팔로우할 수 있는 최대 사용자 수
+)
+FOLLOW_BULK_CHUNK_SIZE = 1000  # 한 트랜잭션에서 저장할 최대 팔로우 관계 수
+
+# 친구 추천 설정
+RECOMMENDATION_SIZE = 15  # API에서 반환할 추천 사용자 수
+RECOMMENDATION_TOP_K = 50  # 사용자별로 캐시에 저장할 추천 후보 수
+RECOMMENDATION_CACHE_TIMEOUT = 60 * 60 * 24 * 2  # 배치 작업 주기(1일)보다 길게 설정
+
+# 알림 발송 설정
+# local: 프로세스 내 큐와 워커 스레드에서 처리
+# redis: Redis 리스트에 적재하고 run_alarm_worker 명령어 프로세스에서 처리
+ALARM_DISPATCH_BACKEND = os.getenv("ALARM_DISPATCH_BACKEND", "local")
+ALARM_DISPATCH_REDIS_URL = os.getenv(
+    "ALARM_DISPATCH_REDIS_URL", "redis://127.0.0.1:6379/1"
+)
+ALARM_DISPATCH_QUEUE_KEY = "alarm:dispatch"
+ALARM_DISPATCH_BATCH_SIZE = 200  # 한 번에 저장/전송할 최대 알림 수
+
+# 채팅 접속 상태 설정
+CHAT_PRESENCE_TTL = 90  # 하트비트가 없으면 이 시간(초) 후 오프라인으로 간주
+CHAT_RECORD_CONNECTION_HISTORY = (
+    os.getenv("CHAT_RECORD_CONNECTION_HISTORY", "False") == "True"
+)  # WebSocketConnection 연결 기록 저장 여부
+CHAT_WRITE_BUFFER_SIZE = 100  # WebSocket 메시지를 이 개수만큼 모아서 저장
+CHAT_WRITE_BUFFER_DELAY_MS = 20  # 버퍼가 차지 않아도 이 시간(ms)이 지나면 저장
+# 읽음 처리 요청을 이 시간(ms) 동안 모아서 한 번만 저장
+CHAT_READ_RECEIPT_DELAY_MS = 500
+
 # imagekit 설정
 IMAGEKIT_DEFAULT_CACHEFILE_STRATEGY = "imagekit.cachefiles.strategies.Optimistic"
 IMAGEKIT_CACHEFILE_DIR = "CACHE/images"
 
+# 목록용 이미지 렌디션 설정 (config/images.py)
+IMAGE_RENDITION_FORMAT = os.getenv("IMAGE_RENDITION_FORMAT", "WEBP")
+IMAGE_RENDITION_QUALITY = 80
+
+# 업로드 이미지 비동기 처리 설정 (config/image_pipeline.py)
+# 처리 전 업로드 파일을 기록하는 로컬 디렉터리 (스토리지와 별개로 각 서버의 로컬 디스크 사용)
+IMAGE_STAGING_ROOT = os.getenv("IMAGE_STAGING_ROOT", BASE_DIR / "staging")
+# 리사이즈/인코딩을 실행할 프로세스 풀 크기
+IMAGE_PROCESSING_WORKERS = int(os.getenv("IMAGE_PROCESSING_WORKERS", 2))
+# 여러 이미지 업로드 시 준비 영역 기록을 동시에 실행할 스레드 수
+IMAGE_UPLOAD_THREADS = 4
+
 # 세션 설정
 SESSION_ENGINE = "django.contrib.sessions.backends.db"
 SESSION_COOKIE_AGE = 1209600  # 2주
@@ -0,0 +1,175 @@
+"""
+홈 피드 관리
+게시물 작성 시 작성자와 팔로워들의 피드에 FeedEntry를 미리 기록 (fan-out-on-write)
+팔로워가 많은 계정의 게시물은 조회 시점에 팔로워 피드로 가져옴 (fan-out-on-read)
+"""
+
+from django.conf import settings
+from django.db.models import F, Q, Window
+from django.db.models.functions import RowNumber
+from accounts.models import Follow, User
+from .models import FeedEntry, Post
+
+FANOUT_BATCH_SIZE = 1000
+
+
+def is_large_account(user_id):
+    """팔로워 수가 기준 이상이면 fan-out 대상에서 제외"""
+    followers_count = (
+        User.objects.filter(pk=user_id)
+        .values_list("followers_count", flat=True)
+        .first()
+    )
+    return (followers_count or 0) >= settings.FEED_FANOUT_MAX_FOLLOWERS
+
+
+def _bulk_insert(entries):
+    FeedEntry.objects.bulk_create(
+        entries, batch_size=FANOUT_BATCH_SIZE, ignore_conflicts=True
+    )
+
+
+def fan_out_post(post):
+    """
+    작성자 본인의 피드에 기록 후
+    대형 계정이 아니면 모든 팔로워의 피드에 일괄 기록
+    """
+    _bulk_insert(
+        [FeedEntry(user_id=post.user_id, post=post, created_at=post.created_at)]
+    )
+    if is_large_account(post.user_id):
+        return
+
+    follower_ids = (
+        Follow.objects.filter(following_id=post.user_id)
+        .values_list("follower_id", flat=True)
+        .iterator(chunk_size=FANOUT_BATCH_SIZE)
+    )
+    batch = []
+    for follower_id in follower_ids:
+        batch.append(
+            FeedEntry(user_id=follower_id, post=post, created_at=post.created_at)
+        )
+        if len(batch) >= FANOUT_BATCH_SIZE:
+            _bulk_insert(batch)
+            batch = []
+    if batch:
+        _bulk_insert(batch)
+
+    Post.objects.filter(pk=post.pk).update(is_fanned_out=True)
+
+
+def pull_pending_posts(user):
+    """
+    팔로우 중인 계정 중 fan-out 되지 않은 최신 게시물을 피드에 채움
+    부분 인덱스(insta_post_pending_fanout_idx)만 조회하므로 피드 크기와 무관
+    """
+    pending = list(
+        Post.objects.filter(
+            user_id__in=Follow.objects.filter(follower=user).values("following_id"),
+            is_fanned_out=False,
+        )
+        .order_by("-created_at")
+        .values_list("id", "created_at")[: settings.FEED_PULL_LIMIT]
+    )
+    if not pending:
+        return
+
+    existing = set(
+        FeedEntry.objects.filter(
+            user=user, post_id__in=[post_id for post_id, _ in pending]
+        ).values_list("post_id", flat=True)
+    )
+    _bulk_insert(
+        [
+            FeedEntry(user=user, post_id=post_id, created_at=created_at)
+            for post_id, created_at in pending
+            if post_id not in existing
+        ]
+    )
+
+
+def backfill_feed(follower_id, following_id):
+    """새로 팔로우한 사용자의 최근 게시물을 팔로워 피드에 추가"""
+    posts = Post.objects.filter(user_id=following_id).values_list("id", "created_at")[
+        : settings.FEED_BACKFILL_LIMIT
+    ]
+    _bulk_insert(
+        [
+            FeedEntry(user_id=follower_id, post_id=post_id, created_at=created_at)
+            for post_id, created_at in posts
+        ]
+    )
+
+
+def backfill_feed_many(edges):
+    """
+    일괄 팔로우한 (follower_id, following_id) 목록의 피드 채우기
+    상대방별 최근 게시물(FEED_BACKFILL_LIMIT)을 한 번의 쿼리로 조회해서 한 번에 기록
+    대형 계정의 게시물은 조회 시점에 가져오므로(pull_pending_posts) 제외
+    """
+    following_ids = set(
+        User.objects.filter(
+            pk__in={following_id for _, following_id in edges},
+            followers_count__lt=settings.FEED_FANOUT_MAX_FOLLOWERS,
+        ).values_list("pk", flat=True)
+    )
+    if not following_ids:
+        return
+
+    posts = {}
+    recent = (
+        Post.objects.filter(user_id__in=following_ids)
+        .annotate(
+            row_number=Window(
+                RowNumber(), partition_by=F("user_id"), order_by=F("created_at").desc()
+            )
+        )
+        .filter(row_number__lte=settings.FEED_BACKFILL_LIMIT)
+        .values_list("user_id", "id", "created_at")
+    )
+    for user_id, post_id, created_at in recent:
+        posts.setdefault(user_id, []).append((post_id, created_at))
+
+    _bulk_insert(
+        [
+            FeedEntry(user_id=follower_id, post_id=post_id, created_at=created_at)
+            for follower_id, following_id in edges
+            for post_id, created_at in posts.get(following_id, ())
+        ]
+    )
+
+
+def remove_from_feed(follower_id, following_id):
+    """언팔로우한 사용자의 게시물을 팔로워 피드에서 제거"""
+    FeedEntry.objects.filter(user_id=follower_id, post__user_id=following_id).delete()
+
+
+def rebuild_feed(user, limit=None):
+    """본인과 팔로우한 사용자들의 최근 게시물로 피드를 다시 생성"""
+    limit = limit or settings.FEED_REBUILD_LIMIT
+    following_ids = Follow.objects.filter(follower=user).values("following_id")
+    posts = Post.objects.filter(
+        Q(user_id__in=following_ids) | Q(user_id=user.id)
+    ).values_list("id", "created_at")[:limit]
+
+    FeedEntry.objects.filter(user=user).delete()
+    _bulk_insert(
+        [
+            FeedEntry(user=user, post_id=post_id, created_at=created_at)
+            for post_id, created_at in posts
+        ]
+    )
+
+
+def get_feed_queryset(user):
+    """
+    사용자의 홈 피드 게시물
+    FeedEntry의 (user, created_at) 인덱스 순서대로 읽으므로 페이지 크기만큼만 조회
+    """
+    pull_pending_posts(user)
+    return (
+        Post.objects.filter(feed_entries__user=user)
+        .annotate(feed_created_at=F("feed_entries__created_at"))
+        .order_by("-feed_created_at", "-id")
+    )
@@ -0,0 +1,142 @@
+import os
+import random
+import statistics
+import tempfile
+import time
+from io import BytesIO
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import override_settings
+from PIL import Image
+from config import image_pipeline
+from insta.models import Post, PostImage
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    """
+    게시물 이미지 업로드 처리 시간을 이미지 수별로 측정
+    - sync: 이미지마다 PostImage.objects.create (요청 처리 중 리사이즈/인코딩, 렌디션 생성, 스토리지 저장)
+    - staged: 이미지마다 행 생성과 준비 영역 기록을 순서대로 실행
+    - batch: create_pending_batch (bulk_create 1회, 준비 영역 기록은 스레드 풀에서 동시에)
+    - pool: batch로 기록한 이미지를 프로세스 풀에서 처리하는 시간 (응답 이후 백그라운드)
+    임시 디렉터리(MEDIA_ROOT, IMAGE_STAGING_ROOT)와 트랜잭션 안에서 측정 후 롤백하므로 데이터가 남지 않음
+    """
+
+    help = "게시물 이미지 업로드 처리 시간을 이미지 수별로 측정합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--counts",
+            nargs="+",
+            type=int,
+            default=[1, 5, 10],
+            help="측정할 이미지 수",
+        )
+        parser.add_argument(
+            "--size",
+            nargs=2,
+            type=int,
+            default=[4032, 3024],
+            metavar=("WIDTH", "HEIGHT"),
+            help="업로드 이미지 크기",
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=3, help="이미지 수별 반복 측정 횟수"
+        )
+
+    def handle(self, *args, **options):
+        content = self.make_image(options["size"])
+        self.stdout.write(
+            f"이미지 {options['size'][0]}x{options['size'][1]}, "
+            f"{len(content) // 1024}KB"
+        )
+        self.stdout.write(
+            f"{'이미지 수':<10}{'sync(ms)':>12}{'staged(ms)':>12}"
+            f"{'batch(ms)':>12}{'pool(ms)':>12}"
+        )
+        with tempfile.TemporaryDirectory() as root, override_settings(
+            MEDIA_ROOT=os.path.join(root, "media"),
+            IMAGE_STAGING_ROOT=os.path.join(root, "staging"),
+        ), image_pipeline.create_executor() as executor:
+            # 프로세스 풀 시작 시간이 측정에 포함되지 않도록 한 번 실행 후 버림
+            self.measure(content, settings.IMAGE_PROCESSING_WORKERS, {}, executor)
+            for count in options["counts"]:
+                timings = {}
+                for _ in range(options["repeat"]):
+                    self.measure(content, count, timings, executor)
+                self.stdout.write(
+                    f"{count:<10}"
+                    + "".join(
+                        f"{statistics.median(timings[mode]):>12.1f}"
+                        for mode in ("sync", "staged", "batch", "pool")
+                    )
+                )
+
+    def make_image(self, size):
+        """압축률이 실제 사진과 비슷하도록 노이즈를 섞은 JPEG"""
+        rng = random.Random(0)
+        image = Image.effect_noise(tuple(size), 64).convert("RGB")
+        image.paste(
+            (rng.randrange(256), rng.randrange(256), rng.randrange(256)),
+            (0, 0, size[0] // 2, size[1] // 2),
+        )
+        buffer = BytesIO()
+        image.save(buffer, format="JPEG", quality=90)
+        return buffer.getvalue()
+
+    def uploads(self, content, count):
+        return [
+            SimpleUploadedFile(f"photo{i}.jpg", content, content_type="image/jpeg")
+            for i in range(count)
+        ]
+
+    def measure(self, content, count, timings, executor):
+        with transaction.atomic():
+            self.measure_modes(content, count, timings, executor)
+            transaction.set_rollback(True)
+        self.clear_staging()
+
+    def measure_modes(self, content, count, timings, executor):
+        user = User.objects.create_user(
+            username="upload_benchmark", email="upload_benchmark@example.com"
+        )
+
+        post = Post.objects.create(user=user, content="sync")
+        uploads = self.uploads(content, count)
+        start = time.perf_counter()
+        for upload in uploads:
+            PostImage.objects.create(post=post, image=upload)
+        timings.setdefault("sync", []).append((time.perf_counter() - start) * 1000)
+
+        post = Post.objects.create(user=user, content="staged")
+        uploads = self.uploads(content, count)
+        start = time.perf_counter()
+        for upload in uploads:
+            image_pipeline.create_pending_batch(PostImage, [upload], post=post)
+        timings.setdefault("staged", []).append((time.perf_counter() - start) * 1000)
+
+        self.clear_staging()
+        post = Post.objects.create(user=user, content="batch")
+        uploads = self.uploads(content, count)
+        start = time.perf_counter()
+        image_pipeline.create_pending_batch(PostImage, uploads, post=post)
+        timings.setdefault("batch", []).append((time.perf_counter() - start) * 1000)
+
+        # 트랜잭션 안에서 측정하므로 commit 이후 처리 대신 같은 스레드에서 직접 처리
+        jobs = [
+            image_pipeline.parse_staged(filename)
+            for filename in os.listdir(settings.IMAGE_STAGING_ROOT)
+        ]
+        start = time.perf_counter()
+        image_pipeline.process_jobs(jobs, executor)
+        timings.setdefault("pool", []).append((time.perf_counter() - start) * 1000)
+
+    def clear_staging(self):
+        root = settings.IMAGE_STAGING_ROOT
+        for filename in os.listdir(root) if os.path.isdir(root) else []:
+            os.remove(os.path.join(root, filename))
@@ -0,0 +1,97 @@
+import statistics
+import time
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from config.pagination import CursorPagination, LimitOffsetPagination
+from insta.models import Post
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    """
+    offset 페이지네이션과 커서 페이지네이션의 페이지 깊이별 조회 시간 비교
+    임시 게시물을 트랜잭션 안에서 생성하고 측정 후 롤백하므로 데이터가 남지 않음
+    """
+
+    help = "게시물 목록의 첫 페이지와 깊은 페이지 조회 시간을 offset/커서 방식별로 측정합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows", type=int, default=100_000, help="생성할 임시 게시물 수"
+        )
+        parser.add_argument(
+            "--page", type=int, default=10_000, help="측정할 깊은 페이지 번호"
+        )
+        parser.add_argument(
+            "--page-size", type=int, default=10, help="페이지당 게시물 수"
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=5, help="페이지별 반복 측정 횟수"
+        )
+
+    def handle(self, *args, **options):
+        rows, page, page_size = options["rows"], options["page"], options["page_size"]
+        if rows < page * page_size:
+            raise CommandError("--rows는 --page x --page-size 이상이어야 합니다.")
+
+        with transaction.atomic():
+            user = User.objects.create_user(
+                username="pagination_benchmark",
+                email="pagination_benchmark@example.com",
+            )
+            Post.objects.bulk_create(
+                (Post(user=user, content=f"benchmark {i}") for i in range(rows)),
+                batch_size=5000,
+            )
+            with connection.cursor() as cursor:
+                cursor.execute(f"ANALYZE {Post._meta.db_table}")
+
+            queryset = Post.objects.order_by("-created_at", "-id")
+            self.stdout.write(f"게시물 {rows}개, 페이지 크기 {page_size}")
+            self.stdout.write(f"{'방식':<8}{'페이지':>10}{'중앙값(ms)':>14}")
+            for target in (1, page):
+                offset = (target - 1) * page_size
+                self.report(
+                    "offset",
+                    target,
+                    LimitOffsetPagination,
+                    queryset,
+                    {"limit": page_size, "offset": offset},
+                    options["repeat"],
+                )
+
+                params = {"page_size": page_size}
+                if offset:
+                    paginator = CursorPagination()
+                    anchor = queryset[offset - 1]
+                    params["cursor"] = paginator.encode_position(
+                        paginator.get_position(anchor)
+                    )
+                self.report(
+                    "cursor",
+                    target,
+                    CursorPagination,
+                    queryset,
+                    params,
+                    options["repeat"],
+                )
+
+            transaction.set_rollback(True)
+
+    def report(self, label, page, pagination_class, queryset, params, repeat):
+        request = Request(
+            APIRequestFactory().get("/", params, HTTP_HOST=settings.ALLOWED_HOSTS[0])
+        )
+        timings = []
+        for _ in range(repeat):
+            paginator = pagination_class()
+            start = time.perf_counter()
+            results = paginator.paginate_queryset(queryset, request)
+            timings.append((time.perf_counter() - start) * 1000)
+        assert len(results) == params.get("limit", params.get("page_size"))
+        self.stdout.write(f"{label:<8}{page:>10}{statistics.median(timings):>14.2f}")
@@ -0,0 +1,46 @@
+from django.core.files.images import get_image_dimensions
+from django.core.management.base import BaseCommand
+from config.images import RENDITION_SIZES
+from insta.models import PostImage
+from market.models import ProductImage
+
+MODELS = [PostImage, ProductImage]
+
+
+class Command(BaseCommand):
+    """
+    이미지 렌디션 생성 명령어
+    렌디션 도입 이전에 업로드된 이미지의 크기를 기록하고 렌디션 파일을 미리 생성
+    새로 업로드되는 이미지는 저장 시 자동으로 처리됨
+    """
+
+    help = "게시물/상품 이미지의 크기를 기록하고 목록용 렌디션을 생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="크기가 기록된 이미지도 렌디션을 다시 생성",
+        )
+
+    def handle(self, *args, **options):
+        for model in MODELS:
+            queryset = model.objects.order_by("id")
+            if not options["all"]:
+                queryset = queryset.filter(width__isnull=True)
+
+            built = failed = 0
+            for instance in queryset.iterator(chunk_size=500):
+                try:
+                    width, height = get_image_dimensions(instance.image)
+                    for rendition in RENDITION_SIZES:
+                        getattr(instance, f"image_{rendition}").generate(force=True)
+                except (OSError, ValueError) as e:
+                    failed += 1
+                    self.stderr.write(f"{model.__name__} {instance.id}: {e}")
+                    continue
+                model.objects.filter(pk=instance.pk).update(width=width, height=height)
+                built += 1
+
+            self.stdout.write(f"{model.__name__}: {built}개 생성, {failed}개 실패")
+        self.stdout.write(self.style.SUCCESS("이미지 렌디션 생성을 완료했습니다."))
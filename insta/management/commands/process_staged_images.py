@@ -0,0 +1,43 @@
+import os
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from config import image_pipeline
+
+
+class Command(BaseCommand):
+    """
+    준비 영역 이미지 처리 명령어
+    처리 전에 서버 프로세스가 종료되어 준비 영역(IMAGE_STAGING_ROOT)에 남은 업로드 파일과
+    처리에 실패한 업로드 파일을 다시 처리
+    """
+
+    help = "준비 영역에 남아 있는 업로드 이미지를 처리합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=settings.IMAGE_PROCESSING_WORKERS,
+            help="프로세스 풀 크기",
+        )
+
+    def handle(self, *args, **options):
+        root = settings.IMAGE_STAGING_ROOT
+        filenames = sorted(os.listdir(root)) if os.path.isdir(root) else []
+        jobs = []
+        for filename in filenames:
+            job = image_pipeline.parse_staged(filename)
+            if job is None:
+                self.stderr.write(f"알 수 없는 파일: {filename}")
+                continue
+            jobs.append(job)
+
+        done = 0
+        if jobs:
+            with image_pipeline.create_executor(options["workers"]) as executor:
+                done = image_pipeline.process_jobs(jobs, executor)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"이미지 {done}개를 처리했습니다. ({len(jobs) - done}개 실패)"
+            )
+        )
@@ -0,0 +1,58 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from insta import feed
+from insta.models import Post
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    """
+    홈 피드(FeedEntry) 재생성 명령어
+    기존 게시물 backfill 또는 피드 데이터가 어긋났을 때 사용
+    """
+
+    help = "사용자의 홈 피드를 팔로우 관계와 게시물 기준으로 다시 생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "usernames",
+            nargs="*",
+            help="피드를 재생성할 사용자명 (생략 시 전체 사용자)",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=None,
+            help="사용자당 피드에 담을 최대 게시물 수",
+        )
+
+    def handle(self, *args, **options):
+        usernames = options["usernames"]
+        users = User.objects.order_by("id")
+        if usernames:
+            users = users.filter(username__in=usernames)
+            if users.count() != len(set(usernames)):
+                raise CommandError("존재하지 않는 사용자명이 포함되어 있습니다.")
+
+        rebuilt = 0
+        for user in users.iterator():
+            with transaction.atomic():
+                feed.rebuild_feed(user, limit=options["limit"])
+            rebuilt += 1
+
+        if not usernames:
+            """대형 계정이 아닌 사용자의 게시물은 fan-out 완료로 표시"""
+            pending_authors = Post.objects.filter(is_fanned_out=False).values_list(
+                "user_id", flat=True
+            )
+            for user_id in set(pending_authors):
+                if not feed.is_large_account(user_id):
+                    Post.objects.filter(user_id=user_id, is_fanned_out=False).update(
+                        is_fanned_out=True
+                    )
+
+        self.stdout.write(
+            self.style.SUCCESS(f"{rebuilt}명의 피드를 다시 생성했습니다.")
+        )
@@ -0,0 +1,77 @@
+# Generated by Django 5.1.2 on 2026-10-17 21:57
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("insta", "0005_remove_postimage_image_url_postimage_image"),
+        (
+            "taggit",
+            "0006_rename_taggeditem_content_type_object_id_taggit_tagg_content_8fc721_idx",
+        ),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FeedEntry",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField()),
+            ],
+        ),
+        migrations.AddField(
+            model_name="post",
+            name="is_fanned_out",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(
+                condition=models.Q(("is_fanned_out", False)),
+                fields=["user", "-created_at"],
+                name="insta_post_pending_fanout_idx",
+            ),
+        ),
+        migrations.AddField(
+            model_name="feedentry",
+            name="post",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="feed_entries",
+                to="insta.post",
+            ),
+        ),
+        migrations.AddField(
+            model_name="feedentry",
+            name="user",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="feed_entries",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="feedentry",
+            index=models.Index(
+                fields=["user", "-created_at", "-post"],
+                name="insta_feed_user_created_idx",
+            ),
+        ),
+        migrations.AlterUniqueTogether(
+            name="feedentry",
+            unique_together={("user", "post")},
+        ),
+    ]
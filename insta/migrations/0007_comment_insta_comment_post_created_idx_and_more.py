@@ -0,0 +1,32 @@
+# Generated by Django 5.1.2 on 2026-10-17 22:02
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("insta", "0006_feedentry"),
+        (
+            "taggit",
+            "0006_rename_taggeditem_content_type_object_id_taggit_tagg_content_8fc721_idx",
+        ),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="comment",
+            index=models.Index(
+                fields=["post", "-created_at", "-id"],
+                name="insta_comment_post_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="post",
+            index=models.Index(
+                fields=["-created_at", "-id"], name="insta_post_created_id_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.1.2 on 2026-10-17 22:07
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def fill_post_counts(apps, schema_editor):
+    """기존 좋아요, 댓글로 카운터 초기화"""
+    Post = apps.get_model("insta", "Post")
+    for field, model_name in (("likes_count", "Like"), ("comments_count", "Comment")):
+        counts = (
+            apps.get_model("insta", model_name)
+            .objects.filter(post=OuterRef("pk"))
+            .values("post")
+            .annotate(count=Count("*"))
+            .values("count")
+        )
+        Post.objects.update(**{field: Coalesce(Subquery(counts), 0)})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("insta", "0007_comment_insta_comment_post_created_idx_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="post",
+            name="comments_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="post",
+            name="likes_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(fill_post_counts, migrations.RunPython.noop),
+    ]
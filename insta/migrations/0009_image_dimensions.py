@@ -0,0 +1,23 @@
+# Generated by Django 5.1.2 on 2026-10-17 23:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("insta", "0008_post_comments_count_post_likes_count"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="postimage",
+            name="height",
+            field=models.PositiveIntegerField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="postimage",
+            name="width",
+            field=models.PositiveIntegerField(editable=False, null=True),
+        ),
+    ]
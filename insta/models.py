@@ -3,6 +3,7 @@ from django.contrib.auth import get_user_model
 from taggit.managers import TaggableManager
 from imagekit.models import ProcessedImageField
 from imagekit.processors import ResizeToFit
+from config import image_pipeline, images
 
 User = get_user_model()
 
@@ -16,9 +17,25 @@ class Post(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     tags = TaggableManager(blank=True)
+    is_fanned_out = models.BooleanField(default=False)
+    # 좋아요/댓글 생성, 삭제 시 signal로 갱신되는 비정규화 카운터
+    likes_count = models.PositiveIntegerField(default=0)
+    comments_count = models.PositiveIntegerField(default=0)
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # 커서 페이지네이션 (created_at, id) 정렬용
+            models.Index(
+                fields=["-created_at", "-id"], name="insta_post_created_id_idx"
+            ),
+            # 팔로워 피드로 fan-out 되지 않은 게시물(대형 계정)은 조회 시점에 가져옴
+            models.Index(
+                fields=["user", "-created_at"],
+                condition=models.Q(is_fanned_out=False),
+                name="insta_post_pending_fanout_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.user.username} - {self.created_at}"
@@ -34,6 +51,14 @@ class PostImage(models.Model):
         format="JPEG",
         options={"quality": 90},
     )
+    # 목록 조회용 렌디션 (원본 저장 시 생성)
+    image_thumbnail = images.rendition_field("image", "thumbnail")
+    image_medium = images.rendition_field("image", "medium")
+    # 원본(ResizeToFit 처리 후) 크기
+    width = models.PositiveIntegerField(null=True, editable=False)
+    height = models.PositiveIntegerField(null=True, editable=False)
+    # 업로드 이미지 비동기 처리 상태 (pending 동안 image는 비어 있음)
+    image_status = image_pipeline.status_field()
 
     class Meta:
         ordering = ["post"]
@@ -41,6 +66,13 @@ class PostImage(models.Model):
     def __str__(self):
         return f"Image for {self.post.user.username}"
 
+    def save(self, *args, **kwargs):
+        images.set_dimensions(self, 1920, 1080)
+        super().save(*args, **kwargs)
+
+
+image_pipeline.register(PostImage, renditions=["image_thumbnail", "image_medium"])
+
 
 class Comment(models.Model):
     """댓글 모델"""
@@ -55,6 +87,13 @@ class Comment(models.Model):
 
     class Meta:
         ordering = ["created_at"]
+        indexes = [
+            # 게시물별 댓글 커서 페이지네이션 (created_at, id) 정렬용
+            models.Index(
+                fields=["post", "-created_at", "-id"],
+                name="insta_comment_post_created_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.user.username}'s comment on {self.post}"
@@ -73,3 +112,27 @@ class Like(models.Model):
 
     def __str__(self):
         return f"{self.user.username} likes {self.post}"
+
+
+class FeedEntry(models.Model):
+    """홈 피드 항목 모델 (게시물 작성 시 팔로워들의 피드에 미리 기록)"""
+
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="feed_entries"
+    )
+    post = models.ForeignKey(
+        Post, on_delete=models.CASCADE, related_name="feed_entries"
+    )
+    created_at = models.DateTimeField()  # 게시물 작성 시각 (피드 정렬용)
+
+    class Meta:
+        unique_together = ("user", "post")
+        indexes = [
+            models.Index(
+                fields=["user", "-created_at", "-post"],
+                name="insta_feed_user_created_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.post} in {self.user.username}'s feed"
@@ -1,5 +1,9 @@
+from django.db import transaction
+from django.db.models import Prefetch
 from rest_framework import serializers
 from taggit.serializers import TagListSerializerField, TaggitSerializer
+from config import image_pipeline
+from config.images import rendition_data
 from .models import Post, PostImage, Comment, Like
 from django.contrib.auth import get_user_model
 
@@ -17,7 +21,7 @@ class PostImageSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = PostImage
-        fields = ["id", "image"]
+        fields = ["id", "image", "image_status"]
 
 
 class CommentSerializer(serializers.ModelSerializer):
@@ -39,10 +43,26 @@ class CommentSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["user", "post"]
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """작성자와 대댓글(작성자 포함)을 미리 조회하여 댓글별 추가 쿼리 방지"""
+        replies = Prefetch(
+            "replies",
+            queryset=Comment.objects.select_related("user").order_by("-created_at"),
+        )
+        return queryset.select_related("user").prefetch_related(replies)
+
     def get_replies(self, obj):
         """대댓글 리스트 반환"""
-        if obj.parent_comment is None:  # 최상위 댓글인 경우에만 대댓글을 가져옴
-            replies = Comment.objects.filter(parent_comment=obj).order_by("-created_at")
+        if obj.parent_comment_id is None:  # 최상위 댓글인 경우에만 대댓글을 가져옴
+            if "replies" in getattr(obj, "_prefetched_objects_cache", {}):
+                replies = obj.replies.all()
+            else:
+                replies = (
+                    Comment.objects.filter(parent_comment=obj)
+                    .select_related("user")
+                    .order_by("-created_at")
+                )
             return CommentSerializer(replies, many=True).data
         return []
 
@@ -71,7 +91,8 @@ class PostSerializer(TaggitSerializer, serializers.ModelSerializer):
 
     user = SimpleUserSerializer(read_only=True)
     comments = CommentSerializer(many=True, read_only=True)
-    likes_count = serializers.SerializerMethodField()
+    likes_count = serializers.IntegerField(read_only=True)
+    comments_count = serializers.IntegerField(read_only=True)
     tags = TagListSerializerField(required=False)
     uploaded_images = PostImageSerializer(many=True, read_only=True)
     images = serializers.ListField(
@@ -96,6 +117,7 @@ class PostSerializer(TaggitSerializer, serializers.ModelSerializer):
             "uploaded_images",
             "images",
             "likes_count",
+            "comments_count",
             "comments",
         ]
         read_only_fields = [
@@ -103,12 +125,24 @@ class PostSerializer(TaggitSerializer, serializers.ModelSerializer):
             "created_at",
             "updated_at",
             "likes_count",
+            "comments_count",
             "comments",
         ]
 
-    def get_likes_count(self, obj):
-        """좋아요 수를 반환"""
-        return obj.likes.count()
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """
+        목록 조회용 queryset 구성
+        작성자, 태그, 이미지, 댓글 트리를 prefetch 하여 페이지 크기와 관계없이 일정한 쿼리 수로 직렬화
+        좋아요 수는 Post.likes_count 카운터를 그대로 사용
+        """
+        comments = Prefetch(
+            "comments",
+            queryset=CommentSerializer.setup_eager_loading(Comment.objects.all()),
+        )
+        return queryset.select_related("user").prefetch_related(
+            "tags", "images", comments
+        )
 
     def create(self, validated_data):
         """게시물 생성 로직"""
@@ -123,15 +157,15 @@ class PostSerializer(TaggitSerializer, serializers.ModelSerializer):
         if len(images_data) > 10:
             raise serializers.ValidationError("이미지는 10개까지 첨부할 수 있습니다.")
 
-        post = Post.objects.create(**validated_data)
+        with transaction.atomic():
+            post = Post.objects.create(**validated_data)
 
-        """이미지 저장"""
-        for image_data in images_data:
-            PostImage.objects.create(post=post, image=image_data)
+            """이미지 저장 (준비 영역 기록은 동시에, 리사이즈/인코딩은 비동기로 처리)"""
+            image_pipeline.create_pending_batch(PostImage, images_data, post=post)
 
-        """태그 추가"""
-        if tags_data:
-            post.tags.add(*tags_data)
+            """태그 추가"""
+            if tags_data:
+                post.tags.add(*tags_data)
 
         return post
 
@@ -157,8 +191,9 @@ class PostSerializer(TaggitSerializer, serializers.ModelSerializer):
                     "이미지는 10개까지 첨부할 수 있습니다."
                 )
 
-            for image_data in validated_data["images"]:
-                PostImage.objects.create(post=instance, image=image_data)
+            image_pipeline.create_pending_batch(
+                PostImage, validated_data["images"], post=instance
+            )
 
         return instance
 
@@ -166,5 +201,9 @@ class PostSerializer(TaggitSerializer, serializers.ModelSerializer):
         """객체를 JSON으로 변환할 때의 표현 정의"""
         representation = super().to_representation(instance)
         representation["tags"] = [str(tag) for tag in instance.tags.all()]
-        representation["images"] = [image.image.url for image in instance.images.all()]
+        # 목록 표시용 렌디션 (원본은 uploaded_images)
+        request = self.context.get("request")
+        representation["images"] = [
+            rendition_data(image, "medium", request) for image in instance.images.all()
+        ]
         return representation
@@ -0,0 +1,85 @@
+from django.db.models import F
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from accounts.models import Follow
+from accounts.signals import follows_created
+from insta.models import Comment, Like, Post
+from insta import feed
+
+
+@receiver(post_save, sender=Post)
+def fan_out_new_post(sender, instance, created, **kwargs):
+    """
+    새 게시물을 작성자와 팔로워들의 피드에 기록
+    """
+    if created:
+        feed.fan_out_post(instance)
+
+
+@receiver(post_save, sender=Follow)
+def backfill_feed_on_follow(sender, instance, created, **kwargs):
+    """
+    팔로우 시 상대방의 최근 게시물을 피드에 추가
+    """
+    if created:
+        feed.backfill_feed(instance.follower_id, instance.following_id)
+
+
+@receiver(follows_created, sender=Follow)
+def backfill_feed_on_bulk_follow(sender, follows, **kwargs):
+    """
+    일괄 팔로우 시 상대방들의 최근 게시물을 한 번에 피드에 추가
+    """
+    feed.backfill_feed_many(
+        [(follow.follower_id, follow.following_id) for follow in follows]
+    )
+
+
+@receiver(post_delete, sender=Follow)
+def remove_feed_on_unfollow(sender, instance, **kwargs):
+    """
+    언팔로우 시 상대방의 게시물을 피드에서 제거
+    """
+    feed.remove_from_feed(instance.follower_id, instance.following_id)
+
+
+@receiver(post_save, sender=Like)
+def increase_likes_count(sender, instance, created, **kwargs):
+    """
+    좋아요 시 게시물의 좋아요 수 증가
+    """
+    if created:
+        Post.objects.filter(pk=instance.post_id).update(
+            likes_count=F("likes_count") + 1
+        )
+
+
+@receiver(post_delete, sender=Like)
+def decrease_likes_count(sender, instance, **kwargs):
+    """
+    좋아요 취소 시 게시물의 좋아요 수 감소
+    """
+    Post.objects.filter(pk=instance.post_id, likes_count__gt=0).update(
+        likes_count=F("likes_count") - 1
+    )
+
+
+@receiver(post_save, sender=Comment)
+def increase_comments_count(sender, instance, created, **kwargs):
+    """
+    댓글 작성 시 게시물의 댓글 수 증가
+    """
+    if created:
+        Post.objects.filter(pk=instance.post_id).update(
+            comments_count=F("comments_count") + 1
+        )
+
+
+@receiver(post_delete, sender=Comment)
+def decrease_comments_count(sender, instance, **kwargs):
+    """
+    댓글 삭제 시 게시물의 댓글 수 감소
+    """
+    Post.objects.filter(pk=instance.post_id, comments_count__gt=0).update(
+        comments_count=F("comments_count") - 1
+    )
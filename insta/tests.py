@@ -1,14 +1,20 @@
 import os
 import uuid
 import tempfile
+from io import BytesIO, StringIO
 from PIL import Image
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test import SimpleTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.contrib.auth import get_user_model
-from rest_framework.test import APITestCase, APIClient
+from rest_framework.test import APITestCase, APIClient, APITransactionTestCase
 from rest_framework import status
 from accounts.models import Follow
-from .models import Post, Like
-
+from config import image_pipeline, s3_utils
+from config.pagination import CursorPagination
+from .models import Post, PostImage, Comment, Like, FeedEntry
 
 User = get_user_model()
 
@@ -274,6 +280,7 @@ class TestLikeAPI(TestPostAPI):
         assert (
             self.like_post.likes.count() == 1
         ), f"Expected 1 like, but got {self.like_post.likes.count()}"
+        assert self.like_post.likes_count == 1
 
     def test_unlike_post(self):
         """게시글 좋아요 취소 테스트"""
@@ -291,3 +298,326 @@ class TestLikeAPI(TestPostAPI):
         assert (
             self.like_post.likes.count() == 0
         ), f"Expected 0 likes, but got {self.like_post.likes.count()}"
+        assert self.like_post.likes_count == 0
+
+
+class TestFeed(APITestCase):
+    def setUp(self):
+        """피드 테스트용 사용자 및 팔로우 관계 생성"""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username="feed_user", password="testpass", email="feed_user@example.com"
+        )
+        self.author = User.objects.create_user(
+            username="feed_author",
+            password="testpass",
+            email="feed_author@example.com",
+        )
+        Follow.objects.create(follower=self.user, following=self.author)
+
+    def test_post_is_fanned_out_to_followers(self):
+        """게시물 작성 시 팔로워 피드에 기록되는지 테스트"""
+        post = Post.objects.create(content="Fan-out post", user=self.author)
+
+        assert FeedEntry.objects.filter(user=self.user, post=post).exists()
+        assert FeedEntry.objects.filter(user=self.author, post=post).exists()
+        post.refresh_from_db()
+        assert post.is_fanned_out
+
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(reverse("insta:insta_post_list"))
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["results"][0]["id"] == post.id
+
+    @override_settings(FEED_FANOUT_MAX_FOLLOWERS=1)
+    def test_large_account_posts_are_pulled_on_read(self):
+        """대형 계정 게시물은 fan-out 없이 조회 시점에 피드에 채워지는지 테스트"""
+        post = Post.objects.create(content="Large account post", user=self.author)
+
+        assert not FeedEntry.objects.filter(user=self.user, post=post).exists()
+        post.refresh_from_db()
+        assert not post.is_fanned_out
+
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(reverse("insta:insta_post_list"))
+        assert response.status_code == status.HTTP_200_OK
+        assert any(item["id"] == post.id for item in response.data["results"])
+        assert FeedEntry.objects.filter(user=self.user, post=post).exists()
+
+    def test_follow_and_unfollow_update_feed(self):
+        """팔로우 시 기존 게시물이 추가되고 언팔로우 시 제거되는지 테스트"""
+        other = User.objects.create_user(
+            username="feed_other", password="testpass", email="feed_other@example.com"
+        )
+        post = Post.objects.create(content="Earlier post", user=other)
+        assert not FeedEntry.objects.filter(user=self.user, post=post).exists()
+
+        follow = Follow.objects.create(follower=self.user, following=other)
+        assert FeedEntry.objects.filter(user=self.user, post=post).exists()
+
+        follow.delete()
+        assert not FeedEntry.objects.filter(user=self.user, post=post).exists()
+
+    def test_rebuild_feed_command(self):
+        """피드 재생성 명령어 테스트"""
+        post = Post.objects.create(content="Rebuild post", user=self.author)
+        FeedEntry.objects.all().delete()
+
+        call_command("rebuild_feed", self.user.username, stdout=StringIO())
+
+        assert FeedEntry.objects.filter(user=self.user, post=post).exists()
+
+
+class TestCursorPagination(APITestCase):
+    def setUp(self):
+        """커서 페이지네이션 테스트용 게시물 생성"""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username="cursor_user", password="testpass", email="cursor_user@example.com"
+        )
+        self.author = User.objects.create_user(
+            username="cursor_author",
+            password="testpass",
+            email="cursor_author@example.com",
+        )
+        Follow.objects.create(follower=self.user, following=self.author)
+        self.posts = [
+            Post.objects.create(content=f"Cursor post {i}", user=self.author)
+            for i in range(25)
+        ]
+        self.client.force_authenticate(user=self.user)
+
+    def test_pages_are_stable_while_new_posts_are_created(self):
+        """페이지 이동 중 새 게시물이 생겨도 중복/누락 없이 조회되는지 테스트"""
+        url = reverse("insta:insta_post_list")
+        response = self.client.get(url, {"page_size": 10})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["previous"] is None
+
+        post_ids = [item["id"] for item in response.data["results"]]
+        while response.data["next"]:
+            Post.objects.create(content="New post", user=self.author)
+            response = self.client.get(response.data["next"])
+            assert response.status_code == status.HTTP_200_OK
+            post_ids += [item["id"] for item in response.data["results"]]
+
+        assert post_ids == [post.id for post in reversed(self.posts)]
+
+    def test_previous_link_returns_previous_page(self):
+        """previous 링크로 이전 페이지를 같은 순서로 조회하는지 테스트"""
+        url = reverse("insta:insta_post_list")
+        first_page = self.client.get(url, {"page_size": 10})
+        second_page = self.client.get(first_page.data["next"])
+        response = self.client.get(second_page.data["previous"])
+
+        assert response.data["results"] == first_page.data["results"]
+        assert response.data["previous"] is None
+
+    def test_comment_list_is_paginated_by_cursor(self):
+        """댓글 목록이 최신순 커서 페이지네이션으로 조회되는지 테스트"""
+        post = self.posts[0]
+        comments = [
+            Comment.objects.create(post=post, user=self.user, content=f"Comment {i}")
+            for i in range(12)
+        ]
+        url = reverse("insta:insta_comment_list_create", args=[post.id])
+
+        response = self.client.get(url)
+        assert [item["id"] for item in response.data["results"]] == [
+            comment.id for comment in reversed(comments[2:])
+        ]
+        response = self.client.get(response.data["next"])
+        assert [item["id"] for item in response.data["results"]] == [
+            comments[1].id,
+            comments[0].id,
+        ]
+        assert response.data["next"] is None
+
+    def test_invalid_cursor(self):
+        """잘못된 커서 값은 404를 반환하는지 테스트"""
+        response = self.client.get(
+            reverse("insta:insta_post_list"), {"cursor": "invalid"}
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_tampered_cursor_values(self):
+        """형식은 맞지만 정렬 키 값의 타입이 잘못된 커서는 404를 반환하는지 테스트"""
+        created_at = self.posts[0].created_at.isoformat()
+        paginator = CursorPagination()
+        for position in (["garbage", "1"], [created_at, "abc"], [created_at, None]):
+            response = self.client.get(
+                reverse("insta:insta_post_list"),
+                {"cursor": paginator.encode_position(position)},
+            )
+            assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+class TestPostListQueryCount(APITestCase):
+    def setUp(self):
+        """직렬화 쿼리 수 테스트용 게시물, 태그, 댓글, 좋아요 생성"""
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username="query_user", password="testpass", email="query_user@example.com"
+        )
+        self.author = User.objects.create_user(
+            username="query_author",
+            password="testpass",
+            email="query_author@example.com",
+        )
+        Follow.objects.create(follower=self.user, following=self.author)
+        for i in range(10):
+            post = Post.objects.create(content=f"Query post {i}", user=self.author)
+            post.tags.add("jeju", f"tag{i}")
+            comment = Comment.objects.create(
+                post=post, user=self.user, content="Comment"
+            )
+            Comment.objects.create(
+                post=post, user=self.author, content="Reply", parent_comment=comment
+            )
+            Like.objects.create(post=post, user=self.user)
+        self.client.force_authenticate(user=self.user)
+
+    def count_queries(self, page_size):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(
+                reverse("insta:insta_post_list"), {"page_size": page_size}
+            )
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["results"]) == page_size
+        return len(context.captured_queries), response
+
+    def test_query_count_does_not_depend_on_page_size(self):
+        """게시물 목록 조회 쿼리 수가 페이지 크기와 무관한지 테스트"""
+        small_count, _ = self.count_queries(2)
+        large_count, response = self.count_queries(10)
+
+        assert small_count == large_count
+        post = response.data["results"][0]
+        assert post["likes_count"] == 1
+        assert sorted(post["tags"]) == ["jeju", "tag9"]
+        top_level = [c for c in post["comments"] if c["parent_comment"] is None]
+        assert top_level[0]["replies"][0]["content"] == "Reply"
+
+
+class PostImagePipelineTestCase(APITransactionTestCase):
+    """
+    게시물 이미지 비동기 처리 테스트
+    업로드 파일은 준비 영역에 기록되고, commit 이후 프로세스 풀에서 처리되어 교체됨
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass", email="testuser@example.com"
+        )
+        self.client.force_authenticate(user=self.user)
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        staging_root = tempfile.TemporaryDirectory()
+        self.addCleanup(staging_root.cleanup)
+        media_settings = override_settings(
+            MEDIA_ROOT=media_root.name, IMAGE_STAGING_ROOT=staging_root.name
+        )
+        media_settings.enable()
+        self.addCleanup(media_settings.disable)
+        # 처리 중인 이미지가 있으면 임시 디렉터리를 삭제하기 전에 완료 대기
+        self.addCleanup(image_pipeline.join)
+
+    def test_create_post_image_renditions(self):
+        """업로드 응답은 pending, 처리 후 크기 기록과 목록용 WebP 렌디션 생성"""
+        upload = tempfile.NamedTemporaryFile(suffix=".jpg")
+        Image.new("RGB", (2400, 1200)).save(upload)
+        upload.seek(0)
+        self.addCleanup(upload.close)
+
+        with transaction.atomic():
+            response = self.client.post(
+                reverse("insta:insta_post_create"),
+                {"content": "rendition", "images": [upload]},
+                format="multipart",
+            )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            response.data["images"],
+            [
+                {
+                    "url": None,
+                    "width": None,
+                    "height": None,
+                    "status": image_pipeline.PENDING,
+                }
+            ],
+        )
+
+        image_pipeline.join()
+        post_image = PostImage.objects.get(post_id=response.data["id"])
+        self.assertEqual(post_image.image_status, image_pipeline.READY)
+        self.assertEqual((post_image.width, post_image.height), (1920, 960))
+        rendition = post_image.image_medium
+        with Image.open(rendition.path) as generated:
+            self.assertEqual(generated.format, "WEBP")
+            self.assertEqual(generated.size, (1080, 540))
+
+        response = self.client.get(
+            reverse("insta:insta_post_detail", kwargs={"pk": response.data["id"]})
+        )
+        image_data = response.data["images"][0]
+        self.assertTrue(image_data["url"].endswith(".webp"))
+        self.assertEqual((image_data["width"], image_data["height"]), (1080, 540))
+        self.assertEqual(image_data["status"], image_pipeline.READY)
+
+        # 렌디션 도입 이전 이미지는 build_image_renditions 명령어로 생성
+        PostImage.objects.filter(pk=post_image.pk).update(width=None, height=None)
+        os.remove(rendition.path)
+        call_command("build_image_renditions", stdout=StringIO())
+        post_image.refresh_from_db()
+        self.assertEqual((post_image.width, post_image.height), (1920, 960))
+        self.assertTrue(os.path.exists(rendition.path))
+
+
+class S3UtilsTestCase(SimpleTestCase):
+    """
+    S3 업로드 유틸리티 테스트
+    local 백엔드로 동시 업로드를 확인하고, s3 백엔드는 클라이언트 설정만 확인 (네트워크 요청 없음)
+    """
+
+    def test_upload_many_returns_result_per_object(self):
+        """입력 순서대로 파일별 결과를 반환하고 실패한 파일이 있어도 나머지는 업로드"""
+        with tempfile.TemporaryDirectory() as root, override_settings(
+            S3_BACKEND="local", S3_LOCAL_ROOT=root, AWS_STORAGE_BUCKET_NAME="bucket"
+        ):
+            files = [
+                (BytesIO(f"image {i}".encode()), f"insta/{i}.jpg", "image/jpeg")
+                for i in range(5)
+            ]
+            files.insert(2, (BytesIO(b"escape"), "../escape.jpg"))
+            results = s3_utils.upload_many(files, max_workers=3)
+
+            self.assertEqual(
+                [result.object_name for result in results],
+                [item[1] for item in files],
+            )
+            self.assertEqual([result.ok for result in results].count(False), 1)
+            self.assertIsInstance(results[2].error, ValueError)
+            self.assertIsNone(results[2].url)
+            self.assertTrue(results[0].url.endswith("/insta/0.jpg"))
+            with open(os.path.join(root, "bucket", "insta", "4.jpg"), "rb") as file:
+                self.assertEqual(file.read(), b"image 4")
+
+    def test_s3_client_is_created_lazily_with_pool_settings(self):
+        """클라이언트는 처음 사용할 때 한 번만 생성하고 연결 풀, multipart 설정 적용"""
+        with override_settings(
+            S3_BACKEND="s3",
+            AWS_ACCESS_KEY_ID="test",
+            AWS_SECRET_ACCESS_KEY="test",
+            AWS_REGION="ap-northeast-2",
+            S3_MAX_POOL_CONNECTIONS=16,
+            S3_MULTIPART_THRESHOLD=5 * 1024 * 1024,
+        ):
+            self.assertIsNone(s3_utils._backend)
+            backend = s3_utils.get_backend()
+            self.assertIs(s3_utils.get_backend(), backend)
+            self.assertEqual(backend.client.meta.config.max_pool_connections, 16)
+            self.assertEqual(
+                backend.transfer_config.multipart_threshold, 5 * 1024 * 1024
+            )
+        self.assertIsNone(s3_utils._backend)
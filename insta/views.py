@@ -1,6 +1,5 @@
 from django.conf import settings
 from django.shortcuts import get_object_or_404
-from django.db.models import Count, Q
 from rest_framework import generics, status, serializers
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.exceptions import PermissionDenied
@@ -15,9 +14,12 @@ from drf_spectacular.utils import (
 from drf_spectacular.types import OpenApiTypes
 from django_filters.rest_framework import DjangoFilterBackend
 from .models import Post, Comment, Like, PostImage
-from accounts.models import Follow, User
-from config.pagination import LimitOffsetPagination, PageNumberPagination
+from accounts import leaderboard
+from accounts.models import Follow
+from config import image_pipeline
+from config.pagination import CursorPagination, PageNumberPagination
 from .filters import PostFilter
+from . import feed
 from .serializers import (
     PostSerializer,
     CommentSerializer,
@@ -31,7 +33,7 @@ class PostListView(generics.ListAPIView):
 
     serializer_class = PostSerializer
     permission_classes = [AllowAny]
-    pagination_class = LimitOffsetPagination
+    pagination_class = CursorPagination
 
     @extend_schema(
         summary="게시물 목록 조회",
@@ -40,30 +42,22 @@ class PostListView(generics.ListAPIView):
         ),
         parameters=[
             OpenApiParameter(
-                name="limit",
-                description="결과의 최대 수",
+                name="cursor",
+                description="이전 응답의 next/previous 링크에 포함된 커서 값",
                 required=False,
-                type=int,
-                examples=[
-                    OpenApiExample(
-                        "Example 1",
-                        summary="limit 값 예시",
-                        description="최대 10개의 게시물을 반환",
-                        value=10,
-                    )
-                ],
+                type=str,
             ),
             OpenApiParameter(
-                name="offset",
-                description="결과의 시작점",
+                name="page_size",
+                description="한 페이지의 결과 수 (최대 50)",
                 required=False,
                 type=int,
                 examples=[
                     OpenApiExample(
                         "Example 1",
-                        summary="offset 값 예시",
-                        description="처음부터가 아닌 5번째 게시물부터 시작",
-                        value=5,
+                        summary="page_size 값 예시",
+                        description="최대 10개의 게시물을 반환",
+                        value=10,
                     )
                 ],
             ),
@@ -74,7 +68,6 @@ class PostListView(generics.ListAPIView):
                 response={
                     "type": "object",
                     "properties": {
-                        "count": {"type": "integer"},
                         "next": {"type": "string", "nullable": True},
                         "previous": {"type": "string", "nullable": True},
                         "results": {
@@ -89,7 +82,6 @@ class PostListView(generics.ListAPIView):
                         summary="성공적인 응답 예시",
                         description="게시물 목록을 반환합니다.",
                         value={
-                            "count": 2,
                             "next": None,
                             "previous": None,
                             "results": [
@@ -117,37 +109,28 @@ class PostListView(generics.ListAPIView):
         user = self.request.user
 
         if user.is_authenticated:
-            """팔로우한 사용자 목록"""
-            following_users = Follow.objects.filter(follower=user).values_list(
-                "following", flat=True
-            )
+            """팔로우한 사용자가 있으면 미리 기록된 홈 피드 조회"""
+            if Follow.objects.filter(follower=user).exists():
+                posts = feed.get_feed_queryset(user)
+                return PostSerializer.setup_eager_loading(posts)
 
-            """팔로우한 사용자 및 본인이 작성한 게시물"""
-            if following_users.exists():
-                posts = Post.objects.filter(
-                    Q(user__in=following_users) | Q(user=user)
-                ).order_by("-created_at")
-            else:
-                """팔로우한 사용자가 없으면 본인 및 인기 사용자 게시물 조회"""
-                posts = Post.objects.filter(user=user).order_by("-created_at")
+            """팔로우한 사용자가 없으면 본인 및 인기 사용자 게시물 조회"""
+            posts = Post.objects.filter(user=user).order_by("-created_at")
 
-                """인기 사용자 게시물 조회"""
-                popular_users = User.objects.annotate(
-                    followers_count=Count("followers")
-                ).order_by("-followers_count")[:10]
-                popular_posts = Post.objects.filter(user__in=popular_users)
+            """인기 사용자 게시물 조회"""
+            popular_user_ids = leaderboard.top_user_ids(settings.POPULAR_USERS_SIZE)
+            popular_posts = Post.objects.filter(user_id__in=popular_user_ids)
 
-                """본인과 인기 사용자 게시물 통합"""
-                posts = posts | popular_posts
+            """본인과 인기 사용자 게시물 통합"""
+            posts = posts | popular_posts
 
         else:
             """비로그인 상태에서는 인기 사용자 게시물만 조회"""
-            popular_users = User.objects.annotate(
-                followers_count=Count("followers")
-            ).order_by("-followers_count")[:10]
-            posts = Post.objects.filter(user__in=popular_users)
+            popular_user_ids = leaderboard.top_user_ids(settings.POPULAR_USERS_SIZE)
+            posts = Post.objects.filter(user_id__in=popular_user_ids)
 
-        return posts.order_by("-created_at")
+        posts = posts.order_by("-created_at", "-id")
+        return PostSerializer.setup_eager_loading(posts)
 
     def get(self, request, *args, **kwargs):
         posts = self.get_queryset()
@@ -295,9 +278,11 @@ class PostDetailView(generics.RetrieveUpdateAPIView):
         new_images = self.request.data.getlist("images")
 
         """새로운 이미지만 추가"""
-        for image_data in new_images:
-            if image_data:
-                PostImage.objects.create(post=instance, image=image_data)
+        image_pipeline.create_pending_batch(
+            PostImage,
+            [image_data for image_data in new_images if image_data],
+            post=instance,
+        )
 
         return instance
 
@@ -347,6 +332,7 @@ class CommentListCreateView(generics.ListCreateAPIView):
     """댓글 목록 조회, 작성 view"""
 
     serializer_class = CommentSerializer
+    pagination_class = CursorPagination
 
     @extend_schema(
         summary="댓글 목록 조회 및 작성",
@@ -405,7 +391,10 @@ class CommentListCreateView(generics.ListCreateAPIView):
     def get_queryset(self):
         """특정 게시물에 대한 댓글 목록 반환"""
         post_id = self.kwargs["post_id"]
-        return Comment.objects.filter(post_id=post_id).order_by("-created_at")
+        comments = Comment.objects.filter(post_id=post_id).order_by(
+            "-created_at", "-id"
+        )
+        return CommentSerializer.setup_eager_loading(comments)
 
     def perform_create(self, serializer):
         """새 댓글 또는 대댓글 작성 시 현재 사용자 정보 및 부모 댓글 정보 추가"""
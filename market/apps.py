@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class MarketConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "market"
+
+    def ready(self):
+        import market.signals
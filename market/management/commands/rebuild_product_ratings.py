@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce
+from market.models import Product, Review
+
+
+class Command(BaseCommand):
+    """
+    상품 평점 집계 재계산 명령어
+    signal을 거치지 않은 대량 작업 등으로 리뷰와 어긋난 평점 합계와 리뷰 수를 리뷰 테이블에서 다시 계산
+    """
+
+    help = "상품의 평점 합계와 리뷰 수를 리뷰 데이터로 다시 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="수정하지 않고 어긋난 상품 수만 출력",
+        )
+
+    def handle(self, *args, **options):
+        reviews = Review.objects.filter(product=OuterRef("pk")).values("product")
+        rating_sum = Coalesce(
+            Subquery(reviews.annotate(total=Sum("rating")).values("total")), 0
+        )
+        rating_count = Coalesce(
+            Subquery(reviews.annotate(count=Count("*")).values("count")), 0
+        )
+        drifted = Product.objects.exclude(
+            Q(rating_sum=rating_sum) & Q(rating_count=rating_count)
+        )
+
+        if options["dry_run"]:
+            fixed = drifted.count()
+        else:
+            fixed = drifted.update(rating_sum=rating_sum, rating_count=rating_count)
+
+        self.stdout.write(f"Product 평점 집계: {fixed}건 불일치")
+        if not options["dry_run"]:
+            self.stdout.write(self.style.SUCCESS("평점 집계 재계산을 완료했습니다."))
@@ -0,0 +1,57 @@
+# Generated by Django 5.1.2 on 2026-10-17 23:02
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+import django.db.models.functions.text
+from django.conf import settings
+from django.contrib.postgres.operations import TrigramExtension
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+from django.db.models import OuterRef, Subquery
+
+
+def fill_search_vectors(apps, schema_editor):
+    """기존 상품의 search_vector 초기화 (market.search.search_document와 같은 식)"""
+    Product = apps.get_model("market", "Product")
+    User = apps.get_model(*settings.AUTH_USER_MODEL.split("."))
+    username = Subquery(User.objects.filter(id=OuterRef("user_id")).values("username"))
+    Product.objects.update(
+        search_vector=SearchVector("name", weight="A", config="simple")
+        + SearchVector("variety", "growing_region", weight="B", config="simple")
+        + SearchVector(username, weight="C", config="simple")
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("market", "0003_delete_receipt"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name="product",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="product",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="market_product_search_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="product",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("name"), name="gin_trgm_ops"
+                ),
+                name="market_product_name_trgm_idx",
+            ),
+        ),
+        migrations.RunPython(fill_search_vectors, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,74 @@
+# Generated by Django 5.1.2 on 2026-10-17 23:03
+
+import django.db.models.expressions
+import django.db.models.functions.comparison
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+
+def fill_product_ratings(apps, schema_editor):
+    """기존 리뷰로 평점 합계와 리뷰 수 초기화"""
+    Product = apps.get_model("market", "Product")
+    Review = apps.get_model("market", "Review")
+    reviews = Review.objects.filter(product=OuterRef("pk")).values("product")
+    Product.objects.update(
+        rating_sum=Coalesce(
+            Subquery(reviews.annotate(total=Sum("rating")).values("total")), 0
+        ),
+        rating_count=Coalesce(
+            Subquery(reviews.annotate(count=Count("*")).values("count")), 0
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("market", "0004_product_search"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="rating_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="product",
+            name="rating_sum",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="product",
+            name="average_rating",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=models.Case(
+                    models.When(rating_count=0, then=None),
+                    default=django.db.models.expressions.CombinedExpression(
+                        django.db.models.functions.comparison.Cast(
+                            "rating_sum", models.FloatField()
+                        ),
+                        "/",
+                        models.F("rating_count"),
+                    ),
+                ),
+                output_field=models.FloatField(null=True),
+            ),
+        ),
+        migrations.RunPython(fill_product_ratings, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="product",
+            index=models.Index(
+                models.OrderBy(
+                    models.F("average_rating"), descending=True, nulls_last=True
+                ),
+                models.OrderBy(models.F("rating_count"), descending=True),
+                models.OrderBy(models.F("id"), descending=True),
+                name="market_product_rating_idx",
+            ),
+        ),
+    ]
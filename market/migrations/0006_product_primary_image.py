@@ -0,0 +1,38 @@
+# Generated by Django 5.1.2 on 2026-10-17 23:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def fill_primary_images(apps, schema_editor):
+    """기존 상품의 가장 먼저 등록된 이미지를 대표 이미지로 설정"""
+    Product = apps.get_model("market", "Product")
+    ProductImage = apps.get_model("market", "ProductImage")
+    first_image = (
+        ProductImage.objects.filter(product=OuterRef("pk")).order_by("id").values("id")
+    )
+    Product.objects.update(primary_image=Subquery(first_image[:1]))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("market", "0005_product_rating"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="primary_image",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="market.productimage",
+            ),
+        ),
+        migrations.RunPython(fill_primary_images, migrations.RunPython.noop),
+    ]
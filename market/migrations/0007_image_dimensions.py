@@ -0,0 +1,23 @@
+# Generated by Django 5.1.2 on 2026-10-17 23:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("market", "0006_product_primary_image"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="productimage",
+            name="height",
+            field=models.PositiveIntegerField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="productimage",
+            name="width",
+            field=models.PositiveIntegerField(editable=False, null=True),
+        ),
+    ]
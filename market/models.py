@@ -1,9 +1,13 @@
 import uuid
 from imagekit.models import ProcessedImageField
 from imagekit.processors import ResizeToFit
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
-from django.db.models import Avg
+from django.db.models import Case, F, FloatField, When
+from django.db.models.functions import Cast, Upper
 from django.contrib.auth import get_user_model
+from config import image_pipeline, images
 
 User = get_user_model()
 
@@ -23,13 +27,50 @@ class Product(models.Model):
     harvest_date = models.DateField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # 상품명, 품종, 재배 지역, 판매자 사용자명 검색용 (저장 시 signal로 갱신)
+    search_vector = SearchVectorField(null=True, editable=False)
+    # 리뷰 작성/삭제 시 signal로 갱신되는 비정규화 평점 합계와 리뷰 수
+    rating_sum = models.PositiveIntegerField(default=0)
+    rating_count = models.PositiveIntegerField(default=0)
+    # 리뷰가 없으면 NULL
+    average_rating = models.GeneratedField(
+        expression=Case(
+            When(rating_count=0, then=None),
+            default=Cast("rating_sum", FloatField()) / F("rating_count"),
+        ),
+        output_field=FloatField(null=True),
+        db_persist=True,
+    )
+    # 목록에 표시할 대표 이미지 (가장 먼저 등록된 이미지, 이미지 등록/삭제 시 signal로 갱신)
+    primary_image = models.ForeignKey(
+        "ProductImage",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="+",
+    )
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=["search_vector"], name="market_product_search_idx"),
+            # 상품명 일부 검색(icontains)용 trigram 인덱스
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                name="market_product_name_trgm_idx",
+            ),
+            # 평점순 정렬용 (리뷰가 없는 상품은 마지막)
+            models.Index(
+                F("average_rating").desc(nulls_last=True),
+                F("rating_count").desc(),
+                F("id").desc(),
+                name="market_product_rating_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.name
 
-    def average_rating(self):
-        return self.reviews.aggregate(Avg("rating"))["rating__avg"]
-
 
 def upload_to(instance, filename):
     """
@@ -53,11 +94,26 @@ class ProductImage(models.Model):
         format="JPEG",
         options={"quality": 100},
     )
+    # 목록 조회용 렌디션 (원본 저장 시 생성)
+    image_thumbnail = images.rendition_field("image", "thumbnail")
+    image_medium = images.rendition_field("image", "medium")
+    # 원본(ResizeToFit 처리 후) 크기
+    width = models.PositiveIntegerField(null=True, editable=False)
+    height = models.PositiveIntegerField(null=True, editable=False)
+    # 업로드 이미지 비동기 처리 상태 (pending 동안 image는 비어 있음)
+    image_status = image_pipeline.status_field()
     created_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
         return f"Image for {self.product.name}"
 
+    def save(self, *args, **kwargs):
+        images.set_dimensions(self, 1920, 1080)
+        super().save(*args, **kwargs)
+
+
+image_pipeline.register(ProductImage, renditions=["image_thumbnail", "image_medium"])
+
 
 class Review(models.Model):
     """
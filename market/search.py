@@ -0,0 +1,87 @@
+"""
+상품 검색
+상품명(A), 품종/재배 지역(B), 판매자 사용자명(C)을 가중치를 둔 tsvector 컬럼(Product.search_vector)으로 저장하고
+단어 단위는 전문 검색(GIN), 상품명 일부는 trigram 인덱스를 사용하는 icontains로 검색
+
+search_vector는 상품 저장과 판매자 사용자명 변경 시 signal로 갱신
+"""
+
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    TrigramWordSimilarity,
+)
+from django.contrib.auth import get_user_model
+from django.db.models import Count, F, OuterRef, Q, Subquery
+
+User = get_user_model()
+
+SEARCH_CONFIG = "simple"
+
+
+def search_document():
+    """UPDATE에 사용할 search_vector 식 (UPDATE는 join을 사용할 수 없으므로 사용자명은 서브쿼리로 조회)"""
+    username = Subquery(User.objects.filter(id=OuterRef("user_id")).values("username"))
+    return (
+        SearchVector("name", weight="A", config=SEARCH_CONFIG)
+        + SearchVector("variety", "growing_region", weight="B", config=SEARCH_CONFIG)
+        + SearchVector(username, weight="C", config=SEARCH_CONFIG)
+    )
+
+
+def update_search_vectors(queryset):
+    """queryset에 해당하는 상품의 search_vector 갱신"""
+    return queryset.update(search_vector=search_document())
+
+
+def search_products(queryset, query):
+    """검색어와 일치하는 상품을 관련도순(같으면 최신순)으로 정렬"""
+    search_query = SearchQuery(query, config=SEARCH_CONFIG, search_type="websearch")
+    return (
+        queryset.filter(Q(search_vector=search_query) | Q(name__icontains=query))
+        .annotate(
+            rank=SearchRank(F("search_vector"), search_query)
+            + TrigramWordSimilarity(query, "name")
+        )
+        .order_by("-rank", "-created_at", "-id")
+    )
+
+
+def facet_counts(queryset, filters=None):
+    """
+    품종별, 재배 지역별 상품 수
+    (품종, 재배 지역) 조합별 개수를 한 번의 GROUP BY 쿼리로 조회한 뒤 각 항목별로 합산
+    queryset은 품종/재배 지역 필터를 적용하기 전의 검색 결과를 전달하고 선택된 값은 filters로 전달
+    각 항목은 자기 자신을 제외한 나머지 필터만 적용해서 계산 (품종을 선택해도 다른 품종 수를 표시)
+    반환값: {"variety": [{"value": ..., "count": ...}], "growing_region": [...]}
+    """
+    filters = {field: value for field, value in (filters or {}).items() if value}
+    combinations = (
+        queryset.order_by()
+        .values("variety", "growing_region")
+        .annotate(count=Count("id"))
+        .values_list("variety", "growing_region", "count")
+    )
+    totals = {"variety": {}, "growing_region": {}}
+    for variety, growing_region, count in combinations:
+        values = {"variety": variety, "growing_region": growing_region}
+        for field, value in values.items():
+            if not value:
+                continue
+            if any(
+                values[other] != selected
+                for other, selected in filters.items()
+                if other != field
+            ):
+                continue
+            totals[field][value] = totals[field].get(value, 0) + count
+    return {
+        field: [
+            {"value": value, "count": count}
+            for value, count in sorted(
+                counts.items(), key=lambda item: (-item[1], item[0])
+            )
+        ]
+        for field, counts in totals.items()
+    }
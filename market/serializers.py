@@ -1,4 +1,6 @@
 from rest_framework import serializers
+from config import image_pipeline
+from config.images import ImageRenditionField
 from .models import Product, Review
 
 
@@ -48,23 +50,13 @@ class ProductListSerializer(serializers.ModelSerializer):
 
     user = serializers.CharField(source="user.username")
     average_rating = serializers.FloatField(read_only=True)
-    image = serializers.SerializerMethodField()
+    # 대표 이미지의 목록용 렌디션 (목록 조회 시 select_related("primary_image")로 함께 조회)
+    image = ImageRenditionField("thumbnail", source="primary_image")
 
     class Meta:
         model = Product
         fields = ["id", "name", "price", "user", "stock", "average_rating", "image"]
 
-    def get_image(self, obj):
-        request = self.context.get("request")
-        if obj.images.exists():
-            image = obj.images.first()
-            return (
-                request.build_absolute_uri(image.image.url)
-                if request
-                else image.image.url
-            )
-        return None
-
 
 class ProductSerializer(serializers.ModelSerializer):
     """
@@ -117,9 +109,14 @@ class ProductSerializer(serializers.ModelSerializer):
         return None
 
     def get_images(self, obj):
+        """처리가 끝난 이미지만 반환"""
         request = self.context.get("request")
         return (
-            [request.build_absolute_uri(image.image.url) for image in obj.images.all()]
+            [
+                request.build_absolute_uri(image.image.url)
+                for image in obj.images.all()
+                if image.image_status == image_pipeline.READY
+            ]
             if request
             else []
         )
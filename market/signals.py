@@ -0,0 +1,78 @@
+from django.contrib.auth import get_user_model
+from django.db.models import F, OuterRef, Subquery
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from config.image_pipeline import images_bulk_created
+from . import search
+from .models import Product, ProductImage, Review
+
+User = get_user_model()
+
+
+@receiver(post_save, sender=Product)
+def update_product_search_vector(sender, instance, **kwargs):
+    """상품 저장 시 검색용 tsvector 갱신"""
+    search.update_search_vectors(Product.objects.filter(pk=instance.pk))
+
+
+@receiver(post_save, sender=User)
+def update_seller_search_vectors(sender, instance, created, update_fields, **kwargs):
+    """판매자 사용자명이 바뀔 수 있는 저장 시 해당 판매자 상품의 tsvector 갱신"""
+    if created or (update_fields is not None and "username" not in update_fields):
+        return
+    search.update_search_vectors(Product.objects.filter(user=instance))
+
+
+@receiver(post_save, sender=Review)
+def add_review_rating(sender, instance, created, **kwargs):
+    """리뷰 작성 시 상품의 평점 합계와 리뷰 수 증가"""
+    if created:
+        # 폼 데이터로 생성한 리뷰는 rating이 문자열일 수 있음
+        Product.objects.filter(pk=instance.product_id).update(
+            rating_sum=F("rating_sum") + int(instance.rating),
+            rating_count=F("rating_count") + 1,
+        )
+
+
+@receiver(post_delete, sender=Review)
+def remove_review_rating(sender, instance, **kwargs):
+    """리뷰 삭제 시 상품의 평점 합계와 리뷰 수 감소"""
+    Product.objects.filter(pk=instance.product_id, rating_count__gt=0).update(
+        rating_sum=F("rating_sum") - instance.rating,
+        rating_count=F("rating_count") - 1,
+    )
+
+
+@receiver(post_save, sender=ProductImage)
+def set_primary_image(sender, instance, created, **kwargs):
+    """대표 이미지가 없는 상품에 이미지를 등록하면 대표 이미지로 설정"""
+    if created:
+        Product.objects.filter(
+            pk=instance.product_id, primary_image__isnull=True
+        ).update(primary_image=instance)
+
+
+@receiver(images_bulk_created, sender=ProductImage)
+def set_primary_image_bulk(sender, instances, **kwargs):
+    """이미지를 한 번에 등록한 경우 상품별 첫 이미지를 대표 이미지로 설정"""
+    first_images = {}
+    for image in instances:
+        first_images.setdefault(image.product_id, image)
+    for product_id, image in first_images.items():
+        Product.objects.filter(pk=product_id, primary_image__isnull=True).update(
+            primary_image=image
+        )
+
+
+@receiver(post_delete, sender=ProductImage)
+def replace_primary_image(sender, instance, **kwargs):
+    """
+    대표 이미지 삭제 시 남은 이미지 중 가장 먼저 등록된 이미지로 교체
+    (삭제 전에 on_delete=SET_NULL로 대표 이미지가 비워짐)
+    """
+    first_image = (
+        ProductImage.objects.filter(product=OuterRef("pk")).order_by("id").values("id")
+    )
+    Product.objects.filter(pk=instance.product_id, primary_image__isnull=True).update(
+        primary_image=Subquery(first_image[:1])
+    )
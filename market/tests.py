@@ -1,3 +1,486 @@
-from django.test import TestCase
+import os
+import tempfile
+from io import BytesIO, StringIO
+from PIL import Image as PILImage
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import transaction
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase, APITransactionTestCase
+from config import image_pipeline
+from market import search
+from market.models import Product, ProductImage, Review
 
-# Create your tests here.
+User = get_user_model()
+
+
+class ProductSearchTestCase(APITestCase):
+    """
+    상품 검색 및 품종/재배 지역별 상품 수 테스트
+    """
+
+    def setUp(self):
+        self.seller = User.objects.create_user(
+            username="hallabong_farm",
+            email="seller@example.com",
+            password="testpassword123",
+        )
+        self.other = User.objects.create_user(
+            username="orchard",
+            email="orchard@example.com",
+            password="testpassword123",
+        )
+        self.tangerine = self.create_product(
+            self.other, "제주 감귤", variety="온주밀감", growing_region="서귀포"
+        )
+        self.hallabong = self.create_product(
+            self.other, "한라봉 선물세트", variety="한라봉", growing_region="서귀포"
+        )
+        self.seller_product = self.create_product(
+            self.seller, "레드향", variety="레드향", growing_region="제주시"
+        )
+        self.url = reverse("product-list")
+
+    def create_product(self, user, name, **kwargs):
+        return Product.objects.create(
+            user=user,
+            name=name,
+            price="10000.00",
+            description="상품 설명",
+            stock=10,
+            **kwargs,
+        )
+
+    def get_list(self, **params):
+        response = self.client.get(self.url, params, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_search_vector_updated_on_save(self):
+        """상품 저장 시 search_vector 갱신"""
+        self.tangerine.refresh_from_db()
+        self.assertIn("감귤", self.tangerine.search_vector)
+        self.assertIn("orchard", self.tangerine.search_vector)
+
+        self.tangerine.name = "제주 천혜향"
+        self.tangerine.save()
+        self.tangerine.refresh_from_db()
+        self.assertIn("천혜향", self.tangerine.search_vector)
+        self.assertNotIn("감귤", self.tangerine.search_vector)
+
+    def test_search_ranks_name_matches_first(self):
+        """상품명 일치가 판매자 사용자명 일치보다 먼저 정렬"""
+        data = self.get_list(search="한라봉")
+        self.assertEqual(
+            [product["id"] for product in data["results"]], [self.hallabong.id]
+        )
+
+        data = self.get_list(search="hallabong_farm")
+        self.assertEqual(
+            [product["id"] for product in data["results"]], [self.seller_product.id]
+        )
+
+    def test_search_partial_name(self):
+        """상품명 일부로 검색"""
+        data = self.get_list(search="선물")
+        self.assertEqual(
+            [product["id"] for product in data["results"]], [self.hallabong.id]
+        )
+
+    def test_search_follows_seller_username_change(self):
+        """판매자 사용자명 변경 시 해당 판매자의 상품 검색에 반영"""
+        self.other.username = "gyul_house"
+        self.other.save()
+
+        data = self.get_list(search="gyul_house")
+        self.assertEqual(data["count"], 2)
+        self.assertEqual(self.get_list(search="orchard")["count"], 0)
+
+    def test_search_facets(self):
+        """검색 결과의 품종, 재배 지역별 상품 수를 한 번의 쿼리로 계산"""
+        with self.assertNumQueries(1):
+            search.facet_counts(Product.objects.filter(user=self.other))
+
+        data = self.get_list(search="orchard")
+        self.assertEqual(
+            data["facets"]["growing_region"], [{"value": "서귀포", "count": 2}]
+        )
+        self.assertEqual(
+            data["facets"]["variety"],
+            [{"value": "온주밀감", "count": 1}, {"value": "한라봉", "count": 1}],
+        )
+
+        data = self.get_list(search="orchard", variety="한라봉")
+        self.assertEqual(
+            [product["id"] for product in data["results"]], [self.hallabong.id]
+        )
+
+    def test_search_facets_with_filter(self):
+        """품종을 선택해도 품종별 상품 수는 선택 전과 같고, 다른 항목에는 선택한 품종만 반영"""
+        data = self.get_list(search="orchard", variety="한라봉")
+        self.assertEqual(
+            data["facets"]["variety"],
+            [{"value": "온주밀감", "count": 1}, {"value": "한라봉", "count": 1}],
+        )
+        self.assertEqual(
+            data["facets"]["growing_region"], [{"value": "서귀포", "count": 1}]
+        )
+
+        data = self.get_list(search="orchard", growing_region="제주시")
+        self.assertEqual(data["count"], 0)
+        self.assertEqual(
+            data["facets"]["growing_region"], [{"value": "서귀포", "count": 2}]
+        )
+        self.assertEqual(data["facets"]["variety"], [])
+
+    def test_list_without_search(self):
+        """검색어가 없으면 최신순으로 조회하고 facets를 포함하지 않음"""
+        data = self.get_list()
+        self.assertEqual(
+            [product["id"] for product in data["results"]],
+            [self.seller_product.id, self.hallabong.id, self.tangerine.id],
+        )
+        self.assertNotIn("facets", data)
+
+
+class ProductRatingTestCase(APITestCase):
+    """
+    상품 평점 집계 컬럼 테스트
+    """
+
+    def setUp(self):
+        self.seller = User.objects.create_user(
+            username="seller", email="seller@example.com", password="testpassword123"
+        )
+        self.reviewer = User.objects.create_user(
+            username="reviewer",
+            email="reviewer@example.com",
+            password="testpassword123",
+        )
+        self.products = [
+            Product.objects.create(
+                user=self.seller,
+                name=f"상품 {i}",
+                price="10000.00",
+                description="상품 설명",
+                stock=10,
+            )
+            for i in range(3)
+        ]
+        self.client.force_authenticate(user=self.reviewer)
+
+    def write_review(self, product, rating):
+        url = reverse("product-detail", kwargs={"id": product.id})
+        response = self.client.post(
+            url, {"content": "맛있어요", "rating": rating}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response.json()["data"]["id"]
+
+    def test_rating_updated_on_review_create_and_delete(self):
+        """리뷰 작성/삭제 시 평점 합계, 리뷰 수, 평균 갱신"""
+        product = self.products[0]
+        self.write_review(product, 5)
+        review_id = self.write_review(product, 2)
+        product.refresh_from_db()
+        self.assertEqual((product.rating_sum, product.rating_count), (7, 2))
+        self.assertEqual(product.average_rating, 3.5)
+
+        url = reverse(
+            "review-delete", kwargs={"product_id": product.id, "id": review_id}
+        )
+        response = self.client.delete(url)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        product.refresh_from_db()
+        self.assertEqual((product.rating_sum, product.rating_count), (5, 1))
+        self.assertEqual(product.average_rating, 5.0)
+
+        response = self.client.get(
+            reverse("product-detail", kwargs={"id": product.id}), format="json"
+        )
+        self.assertEqual(response.data["average_rating"], 5.0)
+
+    def test_list_sorted_by_rating(self):
+        """평점순 정렬, 리뷰가 없는 상품은 마지막"""
+        self.write_review(self.products[0], 3)
+        self.write_review(self.products[1], 5)
+
+        response = self.client.get(
+            reverse("product-list"), {"sort": "rating"}, format="json"
+        )
+        self.assertEqual(
+            [product["id"] for product in response.data["results"]],
+            [self.products[1].id, self.products[0].id, self.products[2].id],
+        )
+        self.assertEqual(
+            [product["average_rating"] for product in response.data["results"]],
+            [5.0, 3.0, None],
+        )
+
+    def test_rebuild_product_ratings(self):
+        """rebuild_product_ratings 명령어로 어긋난 집계 재계산"""
+        self.write_review(self.products[0], 4)
+        Review.objects.bulk_create(
+            [Review(user=self.reviewer, product=self.products[1], content="", rating=2)]
+        )
+        Product.objects.filter(pk=self.products[2].pk).update(
+            rating_sum=10, rating_count=2
+        )
+
+        out = StringIO()
+        call_command("rebuild_product_ratings", "--dry-run", stdout=out)
+        self.assertIn("2건 불일치", out.getvalue())
+
+        call_command("rebuild_product_ratings", stdout=StringIO())
+        self.assertEqual(
+            list(
+                Product.objects.order_by("id").values_list(
+                    "rating_sum", "rating_count", "average_rating"
+                )
+            ),
+            [(4, 1, 4.0), (2, 1, 2.0), (0, 0, None)],
+        )
+
+
+def image_upload(name="product.jpg", size=(100, 100)):
+    buffer = BytesIO()
+    PILImage.new("RGB", size).save(buffer, format="JPEG")
+    return SimpleUploadedFile(name, buffer.getvalue())
+
+
+class TemporaryMediaMixin:
+    """업로드 이미지와 렌디션(MEDIA_ROOT), 처리 전 업로드 파일(IMAGE_STAGING_ROOT)을 임시 디렉터리에 저장"""
+
+    def setUp(self):
+        super().setUp()
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        self.staging_root = tempfile.TemporaryDirectory()
+        self.addCleanup(self.staging_root.cleanup)
+        media_settings = override_settings(
+            MEDIA_ROOT=media_root.name, IMAGE_STAGING_ROOT=self.staging_root.name
+        )
+        media_settings.enable()
+        self.addCleanup(media_settings.disable)
+        # 처리 중인 이미지가 있으면 임시 디렉터리를 삭제하기 전에 완료 대기
+        self.addCleanup(image_pipeline.join)
+
+
+class TemporaryMediaTestCase(TemporaryMediaMixin, APITestCase):
+    pass
+
+
+class ProductPrimaryImageTestCase(TemporaryMediaTestCase):
+    """
+    상품 대표 이미지와 목록 조회 쿼리 수 테스트
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.seller = User.objects.create_user(
+            username="seller", email="seller@example.com", password="testpassword123"
+        )
+
+    def create_product(self, image_count):
+        product = Product.objects.create(
+            user=self.seller,
+            name="상품",
+            price="10000.00",
+            description="상품 설명",
+            stock=10,
+        )
+        images = [
+            ProductImage.objects.create(product=product, image=image_upload())
+            for _ in range(image_count)
+        ]
+        return product, images
+
+    def test_primary_image_follows_image_changes(self):
+        """첫 이미지가 대표 이미지, 대표 이미지 삭제 시 다음 이미지로 교체"""
+        product, images = self.create_product(2)
+        product.refresh_from_db()
+        self.assertEqual(product.primary_image_id, images[0].id)
+
+        images[0].delete()
+        product.refresh_from_db()
+        self.assertEqual(product.primary_image_id, images[1].id)
+
+        images[1].delete()
+        product.refresh_from_db()
+        self.assertIsNone(product.primary_image_id)
+
+    def test_list_query_count_is_constant(self):
+        """상품 수와 관계없이 목록 조회 쿼리 수가 일정"""
+        url = reverse("product-list")
+        self.create_product(2)
+        with self.assertNumQueries(2):
+            response = self.client.get(url, format="json")
+        image = response.data["results"][0]["image"]
+        self.assertTrue(image["url"].endswith(".webp"))
+
+        for image_count in (0, 1, 3, 2, 1):
+            self.create_product(image_count)
+        with self.assertNumQueries(2):
+            response = self.client.get(url, format="json")
+        self.assertEqual(len(response.data["results"]), 6)
+        self.assertEqual(
+            [product["image"] is None for product in response.data["results"]],
+            [False, False, False, False, True, False],
+        )
+
+
+class ProductImageRenditionTestCase(TemporaryMediaTestCase):
+    """
+    상품 이미지 렌디션 테스트
+    """
+
+    def test_list_returns_thumbnail_with_size(self):
+        """목록은 원본(1920x1080 이내) 대신 썸네일 렌디션 URL과 크기를 반환"""
+        seller = User.objects.create_user(
+            username="seller", email="seller@example.com", password="testpassword123"
+        )
+        product = Product.objects.create(
+            user=seller, name="상품", price="10000.00", description="", stock=1
+        )
+        image = ProductImage.objects.create(
+            product=product, image=image_upload("tall.jpg", (1000, 2000))
+        )
+        self.assertEqual((image.width, image.height), (540, 1080))
+        with PILImage.open(image.image_thumbnail.path) as thumbnail:
+            self.assertEqual(thumbnail.format, "WEBP")
+            self.assertEqual(thumbnail.size, (200, 400))
+
+        response = self.client.get(reverse("product-list"), format="json")
+        self.assertEqual(
+            response.data["results"][0]["image"],
+            {
+                "url": image.image_thumbnail.url,
+                "width": 200,
+                "height": 400,
+                "status": image_pipeline.READY,
+            },
+        )
+
+
+class ProductImagePipelineTestCase(TemporaryMediaMixin, APITransactionTestCase):
+    """
+    상품 이미지 비동기 처리 테스트
+    업로드 파일은 준비 영역에 기록되고, commit 이후 프로세스 풀에서 처리되어 교체됨
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.seller = User.objects.create_user(
+            username="seller", email="seller@example.com", password="testpassword123"
+        )
+        self.client.force_authenticate(user=self.seller)
+
+    def create_product(self, *images):
+        return self.client.post(
+            reverse("product-create"),
+            {
+                "name": "한라봉",
+                "price": "10000.00",
+                "description": "제주 한라봉",
+                "stock": 1,
+                "images": list(images),
+            },
+            format="multipart",
+        )
+
+    def staged_files(self):
+        return os.listdir(self.staging_root.name)
+
+    def test_upload_is_processed_after_commit(self):
+        """응답 시점에는 pending, commit 이후 처리되면 이미지와 렌디션으로 교체"""
+        with transaction.atomic():
+            response = self.create_product(
+                image_upload("wide.jpg", (2400, 1200)), image_upload()
+            )
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            self.assertEqual(response.data["images"], [])
+            images = ProductImage.objects.order_by("id")
+            self.assertEqual(
+                [image.image_status for image in images], [image_pipeline.PENDING] * 2
+            )
+            self.assertFalse(images[0].image)
+            self.assertEqual(len(self.staged_files()), 2)
+
+        image_pipeline.join()
+        wide, small = ProductImage.objects.order_by("id")
+        self.assertEqual(wide.image_status, image_pipeline.READY)
+        self.assertEqual((wide.width, wide.height), (1920, 960))
+        # 원본 필드의 ResizeToFit(1920, 1080)은 작은 이미지를 확대함
+        self.assertEqual((small.width, small.height), (1080, 1080))
+        with PILImage.open(wide.image.path) as processed:
+            self.assertEqual((processed.format, processed.size), ("JPEG", (1920, 960)))
+        with PILImage.open(wide.image_thumbnail.path) as thumbnail:
+            self.assertEqual((thumbnail.format, thumbnail.size), ("WEBP", (400, 200)))
+        self.assertEqual(self.staged_files(), [])
+
+        response = self.client.get(reverse("product-list"), format="json")
+        self.assertEqual(
+            response.data["results"][0]["image"],
+            {
+                "url": wide.image_thumbnail.url,
+                "width": 400,
+                "height": 200,
+                "status": image_pipeline.READY,
+            },
+        )
+        response = self.client.get(
+            reverse("product-detail", kwargs={"id": wide.product_id}), format="json"
+        )
+        self.assertEqual(len(response.data["images"]), 2)
+
+    def test_batch_sets_primary_image_and_rolls_back_on_failure(self):
+        """한 번에 등록한 첫 이미지가 대표 이미지가 되고, 기록에 실패하면 모두 롤백"""
+        response = self.create_product(image_upload("first.jpg"), image_upload())
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        product = Product.objects.get()
+        first = ProductImage.objects.order_by("id").first()
+        self.assertEqual(product.primary_image_id, first.id)
+        image_pipeline.join()
+
+        class BrokenUpload(SimpleUploadedFile):
+            def chunks(self, chunk_size=None):
+                raise OSError("디스크 공간 부족")
+
+        uploads = [image_upload(), BrokenUpload("broken.jpg", b""), image_upload()]
+        with self.assertRaises(OSError):
+            image_pipeline.create_pending_batch(ProductImage, uploads, product=product)
+        self.assertEqual(ProductImage.objects.count(), 2)
+        self.assertEqual(self.staged_files(), [])
+
+    def test_failed_upload_is_kept_for_reprocessing(self):
+        """처리에 실패한 업로드 파일은 준비 영역에 남고 process_staged_images 명령어로 다시 처리"""
+        broken = SimpleUploadedFile("broken.jpg", b"not an image")
+        response = self.create_product(broken)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        image_pipeline.join()
+
+        image = ProductImage.objects.get()
+        self.assertEqual(image.image_status, image_pipeline.FAILED)
+        response = self.client.get(reverse("product-list"), format="json")
+        self.assertEqual(
+            response.data["results"][0]["image"],
+            {
+                "url": None,
+                "width": None,
+                "height": None,
+                "status": image_pipeline.FAILED,
+            },
+        )
+
+        (staged,) = self.staged_files()
+        with open(os.path.join(self.staging_root.name, staged), "wb") as file:
+            file.write(image_upload().read())
+        call_command("process_staged_images", workers=1, stdout=StringIO())
+
+        image.refresh_from_db()
+        self.assertEqual(image.image_status, image_pipeline.READY)
+        self.assertEqual((image.width, image.height), (1080, 1080))
+        self.assertEqual(self.staged_files(), [])
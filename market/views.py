@@ -6,13 +6,15 @@ from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import generics, permissions, status
-from rest_framework.filters import SearchFilter
 from rest_framework.response import Response
 from rest_framework.renderers import JSONRenderer, TemplateHTMLRenderer
+from . import search
 from .models import Product, ProductImage, Review
 from .serializers import ProductListSerializer, ProductSerializer, ReviewSerializer
+from config import image_pipeline
 from config.pagination import LimitOffsetPagination, PageNumberPagination
-from django.db.models import Avg, Q
+from django.db import transaction
+from django.db.models import F
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import (
     extend_schema,
@@ -36,7 +38,7 @@ class IsOwnerOrReadOnly(permissions.BasePermission):
 
 @extend_schema(
     summary="상품 목록 조회",
-    description="모든 상품의 목록을 반환합니다. 검색 기능을 사용하여 특정 상품을 찾을 수 있습니다.",
+    description="모든 상품의 목록을 반환합니다. 검색어가 있으면 관련도순으로 정렬하고 품종, 재배 지역별 상품 수(facets)를 함께 반환합니다.",
     parameters=[
         OpenApiParameter(
             name="search",
@@ -44,6 +46,25 @@ class IsOwnerOrReadOnly(permissions.BasePermission):
             description="상품 이름, 작성자, 품종, 재배 지역으로 검색 (선택사항)",
             required=False,
         ),
+        OpenApiParameter(
+            name="sort",
+            type=OpenApiTypes.STR,
+            enum=["latest", "rating"],
+            description="정렬 기준 (기본값: 검색어가 있으면 관련도순, 없으면 최신순)",
+            required=False,
+        ),
+        OpenApiParameter(
+            name="variety",
+            type=OpenApiTypes.STR,
+            description="품종 (선택사항)",
+            required=False,
+        ),
+        OpenApiParameter(
+            name="growing_region",
+            type=OpenApiTypes.STR,
+            description="재배 지역 (선택사항)",
+            required=False,
+        ),
     ],
     responses={
         200: OpenApiResponse(
@@ -106,28 +127,28 @@ class IsOwnerOrReadOnly(permissions.BasePermission):
 class ProductListView(generics.ListAPIView):
     """
     상품 목록을 보여주는 view
-    검색 기능 포함
+    검색어가 있으면 관련도순으로 정렬하고 품종, 재배 지역별 상품 수(facets)를 함께 반환
     """
 
-    queryset = Product.objects.annotate(average_rating=Avg("reviews__rating")).order_by(
-        "-created_at"
-    )
+    queryset = Product.objects.select_related("user", "primary_image")
     serializer_class = ProductListSerializer
     renderer_classes = [JSONRenderer, TemplateHTMLRenderer]
     template_name = "market/product_list.html"
-    filter_backends = [DjangoFilterBackend, SearchFilter]
-    search_fields = ["name", "user__username", "variety", "growing_region"]
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = ["variety", "growing_region"]
     pagination_class = PageNumberPagination
 
     def get_queryset(self):
         queryset = super().get_queryset()
-        search_query = self.request.query_params.get("search", None)
+        search_query = self.request.query_params.get("search", "").strip()
         if search_query:
-            queryset = queryset.filter(
-                Q(name__icontains=search_query)
-                | Q(user__username__icontains=search_query)
-                | Q(variety__icontains=search_query)
-                | Q(growing_region__icontains=search_query)
+            queryset = search.search_products(queryset, search_query)
+        else:
+            queryset = queryset.order_by("-created_at", "-id")
+        if self.request.query_params.get("sort") == "rating":
+            # 평점순 정렬은 market_product_rating_idx 인덱스 순서와 같음
+            queryset = queryset.order_by(
+                F("average_rating").desc(nulls_last=True), "-rating_count", "-id"
             )
         return queryset
 
@@ -136,7 +157,21 @@ class ProductListView(generics.ListAPIView):
         if request.accepted_renderer.format == "html":
             context = {"products": self.paginate_queryset(queryset)}
             return Response(context, template_name=self.template_name)
-        return super().list(request, *args, **kwargs)
+        return self.list(request, *args, **kwargs)
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        serializer = self.get_serializer(page, many=True)
+        response = self.get_paginated_response(serializer.data)
+        if request.query_params.get("search", "").strip():
+            # 선택한 품종/재배 지역 외의 값도 표시하도록 필터 적용 전 검색 결과로 계산
+            filters = {
+                field: request.query_params.get(field)
+                for field in self.filterset_fields
+            }
+            response.data["facets"] = search.facet_counts(self.get_queryset(), filters)
+        return response
 
 
 @extend_schema(
@@ -200,7 +235,6 @@ class ProductCreateView(generics.CreateAPIView):
     def post(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
         if serializer.is_valid():
-            product = serializer.save(user=self.request.user)
             images = request.FILES.getlist("images")
 
             if len(images) > 5:
@@ -209,8 +243,11 @@ class ProductCreateView(generics.CreateAPIView):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
-            for image in images:
-                ProductImage.objects.create(product=product, image=image)
+            with transaction.atomic():
+                product = serializer.save(user=self.request.user)
+                image_pipeline.create_pending_batch(
+                    ProductImage, images, product=product
+                )
 
             if request.accepted_renderer.format == "html":
                 success_url = reverse("product-detail", kwargs={"id": product.id})
@@ -269,9 +306,7 @@ class ProductDetailView(generics.RetrieveAPIView):
     lookup_field = "id"
 
     def get_queryset(self):
-        return Product.objects.annotate(
-            average_rating=Avg("reviews__rating")
-        ).prefetch_related("images")
+        return Product.objects.prefetch_related("images")
 
     def get(self, request, *args, **kwargs):
         instance = self.get_object()
@@ -329,9 +364,11 @@ class ProductDetailView(generics.RetrieveAPIView):
             content = request.data.get("content")
             rating = request.data.get("rating")
 
-            review = Review.objects.create(
-                product=product, user=request.user, content=content, rating=rating
-            )
+            # 리뷰와 상품 평점 집계(signal)를 함께 저장
+            with transaction.atomic():
+                review = Review.objects.create(
+                    product=product, user=request.user, content=content, rating=rating
+                )
 
             serializer = ReviewSerializer(review)
             return JsonResponse(
@@ -430,8 +467,7 @@ class ProductUpdateView(generics.UpdateAPIView):
                 print(f"Error deleting image with URL {full_image_url}: {str(e)}")
 
         new_images = self.request.FILES.getlist("image")
-        for image in new_images:
-            ProductImage.objects.create(product=product, image=image)
+        image_pipeline.create_pending_batch(ProductImage, new_images, product=product)
 
         return product
 
@@ -499,6 +535,11 @@ class ReviewDeleteView(generics.DestroyAPIView):
     permission_classes = [permissions.IsAuthenticated, IsReviewOwner]
     lookup_field = "id"
 
+    def perform_destroy(self, instance):
+        # 리뷰 삭제와 상품 평점 집계(signal)를 함께 반영
+        with transaction.atomic():
+            instance.delete()
+
     def delete(self, request, *args, **kwargs):
         try:
             review = self.get_object()